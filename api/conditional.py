@@ -0,0 +1,116 @@
+"""
+Requêtes conditionnelles (ETag / Last-Modified) liées à la version des données.
+
+Les réponses de lecture portent un ETag dérivé de la version des données
+(database/data_version.py) et du format de réponse. Un client qui renvoie
+cet ETag (If-None-Match) ou la date (If-Modified-Since) reçoit un 304 sans
+requête sur employees ni sérialisation.
+
+La version est gardée en mémoire DATA_VERSION_TTL secondes : pendant ce
+délai, une requête conditionnelle ne touche pas du tout la base ; une
+écriture est donc visible au plus DATA_VERSION_TTL secondes plus tard.
+"""
+
+import os
+import threading
+import time
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from database.data_version import DataVersionInfo, read_data_version
+
+# Durée (secondes) pendant laquelle la version lue en base est réutilisée
+DATA_VERSION_TTL = float(os.getenv("DATA_VERSION_TTL", "1.0"))
+
+
+class DataVersionCache:
+    """Dernière version lue en base, partagée par les requêtes du processus."""
+
+    def __init__(self, ttl: float = DATA_VERSION_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._info: Optional[DataVersionInfo] = None
+        self._expires = 0.0
+
+    def get(self, db) -> Optional[DataVersionInfo]:
+        """
+        Version courante, relue en base seulement après expiration.
+
+        Args:
+            db: Session SQLAlchemy (non utilisée tant que le cache est valide)
+
+        Returns:
+            DataVersionInfo, None si la base n'a pas de version (validateurs désactivés)
+        """
+        with self._lock:
+            if time.monotonic() < self._expires:
+                return self._info
+        try:
+            info = read_data_version(db)
+        except Exception:
+            # Base antérieure à la table data_version : pas de validateurs
+            db.rollback()
+            info = None
+        with self._lock:
+            self._info, self._expires = info, time.monotonic() + self.ttl
+        return info
+
+    def invalidate(self):
+        """Force une relecture à la prochaine requête."""
+        with self._lock:
+            self._expires = 0.0
+
+
+def make_etag(info: DataVersionInfo, media_type: str) -> str:
+    """ETag fort d'une représentation : version des données + format."""
+    return f'"{info.version}-{media_type.rsplit("/", 1)[-1]}"'
+
+
+def validator_headers(info: DataVersionInfo, media_type: str) -> Dict[str, str]:
+    """
+    En-têtes de validation d'une réponse.
+
+    Cache-Control: no-cache autorise le client à garder la réponse mais
+    l'oblige à la revalider (304) avant de la réutiliser.
+    """
+    last_modified = info.updated_at.replace(tzinfo=timezone.utc, microsecond=0)
+    return {
+        "ETag": make_etag(info, media_type),
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+
+def is_not_modified(
+    headers: Dict[str, str],
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+) -> bool:
+    """
+    Indique si la représentation du client est encore à jour (RFC 9110).
+
+    If-None-Match prime sur If-Modified-Since lorsqu'il est présent.
+
+    Args:
+        headers: Validateurs de la représentation courante (validator_headers)
+        if_none_match: En-tête If-None-Match de la requête
+        if_modified_since: En-tête If-Modified-Since de la requête
+
+    Returns:
+        True si un 304 peut être renvoyé
+    """
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or headers["ETag"] in tags
+
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return parsedate_to_datetime(headers["Last-Modified"]) <= since
+
+    return False
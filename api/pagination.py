@@ -0,0 +1,256 @@
+"""
+Pagination par curseur (keyset), tri et filtres de GET /employees.
+
+Avec skip/limit, la base parcourt puis jette les `skip` premières lignes :
+le coût d'une page croît avec sa position. Le curseur mémorise la clé de
+tri de la dernière ligne servie (valeur de la colonne triée et ID) ; la page
+suivante reprend juste après par une condition WHERE.
+
+- Coût : la reprise (`resume_conditions`) est découpée en plages que la base
+  parcourt sur un index (colonne, id) : celui de l'ID, et ceux des clés de
+  tri de l'Explorer (SORT_INDEX_COLUMNS, database/models.py). Un tri sur une
+  autre colonne, ou sur une colonne catégorielle du schéma compact (triée sur
+  sa valeur décodée), reste un tri de toute la sélection.
+- Total : compté une fois par filtre et par version des données (`TotalCache`),
+  puis réutilisé par les pages suivantes.
+
+- Tri : une colonne de la table, `-colonne` pour l'ordre décroissant ; l'ID
+  départage les égalités et les valeurs nulles sont placées en fin de tri.
+  En schéma compact, les colonnes catégorielles sont triées sur leur valeur
+  décodée et non sur le code stocké (voir `sort_expression`).
+- Curseur : chaîne opaque (JSON en base64 URL) liée à la colonne de tri ;
+  un curseur émis pour un autre tri est refusé.
+- Filtres : départements, postes, plage d'âge et recherche textuelle (sous-chaîne,
+  sans casse, dans SEARCH_COLUMNS), appliqués en SQL (total compris).
+"""
+
+import base64
+import binascii
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+from api.serialization import EMPLOYEE_FIELDS
+from database.compact import DictionaryEncoded
+
+# Tri par défaut : ordre des identifiants
+DEFAULT_SORT = "id"
+
+# Colonnes parcourues par la recherche textuelle (`search`)
+SEARCH_COLUMNS = ("poste", "departement", "domaine_etude", "statut_marital")
+
+# Nombre de totaux gardés par TotalCache
+TOTAL_CACHE_ENTRIES = 256
+
+
+def parse_sort(sort: Optional[str]) -> Tuple[str, bool]:
+    """
+    Interprète le paramètre `sort` ("age", "-revenu_mensuel"...).
+
+    Args:
+        sort: Valeur brute du paramètre (None ou vide = tri par ID)
+
+    Returns:
+        Tuple (nom de la colonne, ordre décroissant)
+
+    Raises:
+        ValueError: Si la colonne n'existe pas
+    """
+    sort = (sort or DEFAULT_SORT).strip()
+    descending = sort.startswith("-")
+    name = sort.lstrip("-")
+    if name not in EMPLOYEE_FIELDS:
+        raise ValueError(f"Tri inconnu : {name}")
+    return name, descending
+
+
+def sort_expression(column):
+    """
+    Expression à trier et à comparer pour une colonne.
+
+    Une colonne encodée par dictionnaire (schéma compact) stocke un code dans
+    l'ordre d'enregistrement des valeurs : on trie sur la valeur décodée.
+
+    Args:
+        column: Colonne de la table employees
+
+    Returns:
+        La colonne, ou sa valeur décodée
+    """
+    if isinstance(column.type, DictionaryEncoded):
+        return column.comparator.decoded()
+    return column
+
+
+def encode_cursor(sort: str, value: Any, last_id: int) -> str:
+    """
+    Curseur opaque pointant après une ligne.
+
+    Args:
+        sort: Tri de la page (tel que passé dans `sort`)
+        value: Valeur de la colonne triée pour la dernière ligne servie
+        last_id: ID de la dernière ligne servie
+
+    Returns:
+        Chaîne base64 URL sans remplissage
+    """
+    raw = json.dumps([sort, value, last_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """
+    Position (valeur triée, ID) contenue dans un curseur.
+
+    Args:
+        cursor: Curseur renvoyé dans `next_cursor`
+        sort: Tri de la requête courante
+
+    Returns:
+        Tuple (valeur de la colonne triée, ID)
+
+    Raises:
+        ValueError: Si le curseur est illisible ou a été émis pour un autre tri
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, value, last_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("Curseur invalide")
+    if cursor_sort != sort or not isinstance(last_id, int):
+        raise ValueError("Curseur invalide pour ce tri")
+    return value, last_id
+
+
+def order_by(column, id_column, descending: bool) -> list:
+    """Clauses ORDER BY : colonne triée (valeurs nulles en dernier) puis ID."""
+    if column is id_column:
+        return [id_column.desc() if descending else id_column.asc()]
+    if descending:
+        return [column.desc().nulls_last(), id_column.desc()]
+    return [column.asc().nulls_last(), id_column.asc()]
+
+
+def resume_conditions(column, id_column, descending: bool, value: Any, last_id: int) -> List:
+    """
+    Conditions WHERE des lignes situées après (value, last_id), plage par plage.
+
+    Chaque condition est une plage d'un index (colonne, id) ; les plages se
+    suivent dans l'ordre de `order_by` (valeurs non nulles, puis nulles). Une
+    seule condition réunissant les deux (OR ... IS NULL) obligerait la base à
+    parcourir l'index depuis le début.
+
+    Args:
+        column: Colonne triée
+        id_column: Colonne ID (départage)
+        descending: Ordre décroissant
+        value: Valeur triée de la dernière ligne servie (None si nulle)
+        last_id: ID de la dernière ligne servie
+
+    Returns:
+        Liste de conditions, à interroger dans l'ordre
+    """
+    after_id = id_column < last_id if descending else id_column > last_id
+    if column is id_column:
+        return [after_id]
+    if value is None:
+        # Les nulles sont en fin de tri : seules les nulles d'ID suivant restent
+        return [and_(column.is_(None), after_id)]
+    beyond = column < value if descending else column > value
+    return [or_(beyond, and_(column == value, after_id)), column.is_(None)]
+
+
+def after_position(column, id_column, descending: bool, value: Any, last_id: int):
+    """
+    Condition WHERE unique des lignes situées après (value, last_id) dans l'ordre de `order_by`.
+
+    Mêmes arguments que `resume_conditions`, dont elle réunit les plages.
+    """
+    return or_(*resume_conditions(column, id_column, descending, value, last_id))
+
+
+def filter_conditions(
+    table,
+    departements: Sequence[str] = (),
+    age_min: Optional[int] = None,
+    age_max: Optional[int] = None,
+    postes: Sequence[str] = (),
+    search: Optional[str] = None,
+) -> List:
+    """
+    Conditions WHERE des filtres de la liste d'employés.
+
+    Args:
+        table: Table employees
+        departements: Départements retenus (tous si vide)
+        age_min: Âge minimal inclus
+        age_max: Âge maximal inclus
+        postes: Postes retenus (tous si vide)
+        search: Texte cherché, sans casse, dans l'une des SEARCH_COLUMNS
+
+    Returns:
+        Liste de conditions à combiner par AND
+    """
+    conditions = []
+    if departements:
+        conditions.append(table.c.departement.in_(list(departements)))
+    if postes:
+        conditions.append(table.c.poste.in_(list(postes)))
+    if age_min is not None:
+        conditions.append(table.c.age >= age_min)
+    if age_max is not None:
+        conditions.append(table.c.age <= age_max)
+    if search and search.strip():
+        # % et _ saisis sont cherchés tels quels
+        escaped = search.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        conditions.append(
+            or_(*[table.c[name].ilike(f"%{escaped}%", escape="\\") for name in SEARCH_COLUMNS])
+        )
+    return conditions
+
+
+def parse_list(value: Optional[str]) -> List[str]:
+    """Valeurs d'un paramètre séparé par des virgules (vide si absent)."""
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+class TotalCache:
+    """Totaux de la liste d'employés, par filtre et par version des données (LRU)."""
+
+    def __init__(self, max_entries: int = TOTAL_CACHE_ENTRIES):
+        """
+        Args:
+            max_entries: Nombre maximal de totaux gardés
+        """
+        self.max_entries = max_entries
+        self._totals: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version: Optional[int], key: Hashable, count: Callable[[], int]) -> int:
+        """
+        Total d'une sélection, compté seulement s'il n'est pas connu pour cette version.
+
+        Args:
+            version: Version des données (None : pas de version, toujours compté)
+            key: Filtres de la sélection (hachables)
+            count: Requête COUNT(*) de la sélection
+
+        Returns:
+            Nombre d'employés de la sélection
+        """
+        if version is None:
+            return count()
+        key = (version, key)
+        with self._lock:
+            if key in self._totals:
+                self._totals.move_to_end(key)
+                return self._totals[key]
+        total = count()
+        with self._lock:
+            self._totals[key] = total
+            while len(self._totals) > self.max_entries:
+                self._totals.popitem(last=False)
+        return total
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 
 class EmployeeBase(BaseModel):
@@ -54,6 +54,20 @@ class EmployeeListResponse(BaseModel):
 
     total: int
     employees: list[EmployeeResponse]
+    next_cursor: Optional[str] = None
+
+
+class EmployeeSelectionRequest(BaseModel):
+    """Schéma de la sélection d'employés par IDs (POST /employees/batch)."""
+
+    ids: List[int]
+    fields: Optional[List[str]] = None
+
+
+class EmployeeSelectionResponse(EmployeeListResponse):
+    """Employés trouvés dans l'ordre des IDs demandés, et IDs sans correspondance."""
+
+    missing: List[int]
 
 
 class PredictionRequest(BaseModel):
@@ -104,6 +118,58 @@ class PredictionResponse(BaseModel):
     risk_level: str
 
 
+class BatchPredictionRequest(BaseModel):
+    """
+    Schéma pour la prédiction par lot.
+
+    Chaque enregistrement peut être au format de l'export brut
+    (dataset_employe.csv : id_employee, "11 %", Y/Oui...) ou déjà préparé :
+    les colonnes dérivées manquantes sont calculées côté API.
+    """
+
+    employees: List[Dict[str, Any]]
+
+
+class BatchPredictionItem(PredictionResponse):
+    """Prédiction d'un enregistrement du lot (id repris de la requête s'il existe)."""
+
+    id: Optional[int] = None
+
+
+class BatchPredictionResponse(BaseModel):
+    """Schéma de réponse pour la prédiction par lot (même ordre que la requête)."""
+
+    total: int
+    predictions: List[BatchPredictionItem]
+
+
+class SelectionPredictionItem(BatchPredictionItem):
+    """Prédiction d'un employé de la base, avec les colonnes demandées dans `fields`."""
+
+    model_config = ConfigDict(extra="allow")
+
+
+class SelectionPredictionResponse(BaseModel):
+    """Prédictions de tous les employés correspondant aux filtres (ordre des IDs)."""
+
+    total: int
+    predictions: List[SelectionPredictionItem]
+
+
+class EmployeeStatsResponse(BaseModel):
+    """Agrégats des employés pour la page Statistiques (voir utils/chart_data.py)."""
+
+    total: int
+    means: Dict[str, Optional[float]]
+    departements: List[Dict[str, Any]]
+    genres: List[Dict[str, Any]]
+    satisfaction: List[Dict[str, Any]]
+    age_histogram: List[Dict[str, Any]]
+    revenu_box: Optional[Dict[str, float]] = None
+    density: Dict[str, List[Any]]
+    sample: List[Dict[str, Any]]
+
+
 class HealthResponse(BaseModel):
     """Schéma de réponse pour le health check."""
 
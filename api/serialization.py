@@ -0,0 +1,352 @@
+"""
+Sérialisation rapide des réponses employés (sans objet ORM ni modèle Pydantic par ligne).
+
+Trois formats, choisis d'après l'en-tête Accept (negotiate) :
+- application/json (défaut) ;
+- application/vnd.apache.arrow.stream : flux IPC Arrow, colonnes typées,
+  décodable directement en DataFrame ;
+- application/msgpack : même structure que le JSON, encodage binaire
+  (si le paquet msgpack est installé).
+"""
+
+import io
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Union, get_args, get_origin
+
+import pandas as pd
+import pyarrow as pa
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+from api.schemas import EmployeeResponse
+
+try:
+    import msgpack
+except ImportError:  # Format binaire optionnel
+    msgpack = None
+
+# Ordre des champs identique à EmployeeResponse : le contrat JSON reste le même
+EMPLOYEE_FIELDS = tuple(EmployeeResponse.model_fields)
+
+JSON_MEDIA_TYPE = "application/json"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Formats proposés, par ordre de préférence à qualité égale
+MEDIA_TYPES = [JSON_MEDIA_TYPE, ARROW_STREAM_MEDIA_TYPE] + (
+    [MSGPACK_MEDIA_TYPE] if msgpack is not None else []
+)
+
+# Types Arrow des annotations de EmployeeResponse
+ARROW_TYPES = {int: pa.int64(), float: pa.float64(), str: pa.string()}
+
+
+def parse_fields(fields: Optional[str]) -> tuple:
+    """
+    Interprète le paramètre `fields` (liste de colonnes séparées par des virgules).
+
+    L'ID est toujours inclus et l'ordre suit celui de EmployeeResponse, ce qui
+    garantit une sortie stable et un encodeur par combinaison de champs.
+
+    Args:
+        fields: Valeur brute du paramètre (None ou vide = toutes les colonnes)
+
+    Returns:
+        Tuple des champs à sélectionner
+
+    Raises:
+        ValueError: Si un champ demandé n'existe pas
+    """
+    if not fields:
+        return EMPLOYEE_FIELDS
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(EMPLOYEE_FIELDS)
+    if unknown:
+        raise ValueError(f"Champs inconnus : {', '.join(sorted(unknown))}")
+
+    requested.add("id")
+    return tuple(name for name in EMPLOYEE_FIELDS if name in requested)
+
+
+@lru_cache(maxsize=64)
+def employee_row_type(fields: tuple = EMPLOYEE_FIELDS) -> type:
+    """
+    Construit le modèle de réponse réduit (TypedDict) pour un jeu de champs.
+
+    Args:
+        fields: Noms des champs à sérialiser, dans l'ordre de sortie
+
+    Returns:
+        TypedDict dont les annotations reprennent celles de EmployeeResponse
+    """
+    return TypedDict(
+        "EmployeeRow",
+        {name: EmployeeResponse.model_fields[name].annotation for name in fields},
+    )
+
+
+@lru_cache(maxsize=64)
+def employee_adapter(fields: tuple = EMPLOYEE_FIELDS) -> TypeAdapter:
+    """Encodeur JSON compilé pour un employé seul."""
+    return TypeAdapter(employee_row_type(fields))
+
+
+@lru_cache(maxsize=64)
+def employee_list_adapter(fields: tuple = EMPLOYEE_FIELDS) -> TypeAdapter:
+    """
+    Construit (une seule fois par jeu de champs) l'encodeur JSON d'une liste d'employés.
+
+    Les lignes sont décrites par un TypedDict : pydantic-core sérialise directement
+    les dictionnaires sans instancier de modèle.
+
+    Args:
+        fields: Noms des champs à sérialiser, dans l'ordre de sortie
+
+    Returns:
+        TypeAdapter compilé pour {"total": int, "employees": [...], "next_cursor": str | None}
+    """
+    payload_type = TypedDict(
+        "EmployeeListPayload",
+        {
+            "total": int,
+            "employees": list[employee_row_type(fields)],
+            "next_cursor": Optional[str],
+        },
+    )
+    return TypeAdapter(payload_type)
+
+
+def dump_employee(row: Sequence[Any], fields: tuple = EMPLOYEE_FIELDS) -> bytes:
+    """
+    Sérialise un employé issu d'un select Core.
+
+    Args:
+        row: Ligne renvoyée par la base, colonnes dans l'ordre de `fields`
+        fields: Noms des colonnes sélectionnées
+
+    Returns:
+        Corps JSON encodé en UTF-8
+    """
+    return employee_adapter(fields).dump_json(dict(zip(fields, row, strict=True)))
+
+
+@lru_cache(maxsize=64)
+def employee_selection_adapter(fields: tuple = EMPLOYEE_FIELDS) -> TypeAdapter:
+    """Encodeur JSON compilé d'une sélection par IDs ({"total", "employees", "missing"})."""
+    payload_type = TypedDict(
+        "EmployeeSelectionPayload",
+        {"total": int, "employees": list[employee_row_type(fields)], "missing": list[int]},
+    )
+    return TypeAdapter(payload_type)
+
+
+def dump_employee_list(
+    total: int,
+    rows: Sequence[Sequence[Any]],
+    fields: tuple = EMPLOYEE_FIELDS,
+    next_cursor: Optional[str] = None,
+) -> bytes:
+    """
+    Sérialise une page d'employés issue d'un select Core (tuples).
+
+    Args:
+        total: Nombre total d'employés
+        rows: Lignes renvoyées par la base, colonnes dans l'ordre de `fields`
+        fields: Noms des colonnes sélectionnées
+        next_cursor: Curseur de la page suivante (None sur la dernière page)
+
+    Returns:
+        Corps JSON encodé en UTF-8
+    """
+    employees = [dict(zip(fields, row, strict=True)) for row in rows]
+    return employee_list_adapter(fields).dump_json(
+        {"total": total, "employees": employees, "next_cursor": next_cursor}
+    )
+
+
+def dump_employee_selection(
+    rows: Sequence[Sequence[Any]], missing: Sequence[int], fields: tuple = EMPLOYEE_FIELDS
+) -> bytes:
+    """
+    Sérialise les employés d'une sélection par IDs (multi-get).
+
+    Args:
+        rows: Lignes trouvées, dans l'ordre des IDs demandés
+        missing: IDs demandés sans employé correspondant
+        fields: Noms des colonnes sélectionnées
+
+    Returns:
+        Corps JSON {"total", "employees", "missing"} encodé en UTF-8
+    """
+    employees = [dict(zip(fields, row, strict=True)) for row in rows]
+    return employee_selection_adapter(fields).dump_json(
+        {"total": len(employees), "employees": employees, "missing": list(missing)}
+    )
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    Choisit le format de réponse d'après un en-tête Accept.
+
+    Les facteurs de qualité (q=) sont respectés ; sans en-tête, avec */* ou
+    sans format connu, la réponse reste en JSON.
+
+    Args:
+        accept: Valeur brute de l'en-tête Accept
+
+    Returns:
+        Type MIME parmi MEDIA_TYPES
+    """
+    best, best_quality = JSON_MEDIA_TYPE, 0.0
+    for item in (accept or "").split(","):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if media_type in MEDIA_TYPES and quality > best_quality:
+            best, best_quality = media_type, quality
+    return best
+
+
+def _arrow_type(annotation) -> pa.DataType:
+    """Type Arrow d'une annotation (Optional[...] compris)."""
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    return ARROW_TYPES.get(annotation, pa.string())
+
+
+@lru_cache(maxsize=64)
+def employee_arrow_schema(fields: tuple = EMPLOYEE_FIELDS) -> pa.Schema:
+    """Schéma Arrow d'une page d'employés pour un jeu de champs."""
+    return pa.schema(
+        [(name, _arrow_type(EmployeeResponse.model_fields[name].annotation)) for name in fields]
+    )
+
+
+def dump_arrow_table(table: pa.Table, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Encode une table en flux IPC Arrow.
+
+    Args:
+        table: Table à encoder
+        metadata: Valeurs ajoutées aux métadonnées du schéma (ex. total)
+
+    Returns:
+        Corps binaire application/vnd.apache.arrow.stream
+    """
+    if metadata:
+        merged = {**(table.schema.metadata or {})}
+        merged.update({key.encode(): str(value).encode() for key, value in metadata.items()})
+        table = table.replace_schema_metadata(merged)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def dump_employee_list_arrow(
+    total: int,
+    rows: Sequence[Sequence[Any]],
+    fields: tuple = EMPLOYEE_FIELDS,
+    next_cursor: Optional[str] = None,
+) -> bytes:
+    """
+    Sérialise une page d'employés en flux Arrow (une colonne par champ).
+
+    Le total et le curseur suivant (s'il existe) sont transmis dans les
+    métadonnées du schéma (clés "total" et "next_cursor").
+
+    Args:
+        total: Nombre total d'employés
+        rows: Lignes renvoyées par la base, colonnes dans l'ordre de `fields`
+        fields: Noms des colonnes sélectionnées
+        next_cursor: Curseur de la page suivante (None sur la dernière page)
+
+    Returns:
+        Corps binaire application/vnd.apache.arrow.stream
+    """
+    metadata = {"total": total}
+    if next_cursor:
+        metadata["next_cursor"] = next_cursor
+    return dump_arrow_table(employee_table(rows, fields), metadata)
+
+
+def employee_table(rows: Sequence[Sequence[Any]], fields: tuple = EMPLOYEE_FIELDS) -> pa.Table:
+    """Table Arrow typée de lignes employés (une colonne par champ)."""
+    schema = employee_arrow_schema(fields)
+    columns = list(zip(*rows, strict=True)) if rows else [()] * len(fields)
+    arrays = [
+        pa.array(values, type=field.type) for values, field in zip(columns, schema, strict=True)
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def dump_msgpack(payload: Any) -> bytes:
+    """Encode une structure JSON-compatible en MessagePack."""
+    if msgpack is None:
+        raise RuntimeError("Le paquet msgpack n'est pas installé")
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def dump_employee_list_msgpack(
+    total: int,
+    rows: Sequence[Sequence[Any]],
+    fields: tuple = EMPLOYEE_FIELDS,
+    next_cursor: Optional[str] = None,
+) -> bytes:
+    """Sérialise une page d'employés en MessagePack (même structure que le JSON)."""
+    employees = [dict(zip(fields, row, strict=True)) for row in rows]
+    return dump_msgpack({"total": total, "employees": employees, "next_cursor": next_cursor})
+
+
+# Encodeur d'une page d'employés par format négocié
+EMPLOYEE_LIST_ENCODERS = {
+    JSON_MEDIA_TYPE: dump_employee_list,
+    ARROW_STREAM_MEDIA_TYPE: dump_employee_list_arrow,
+    MSGPACK_MEDIA_TYPE: dump_employee_list_msgpack,
+}
+
+
+def dump_employee_selection_arrow(
+    rows: Sequence[Sequence[Any]], missing: Sequence[int], fields: tuple = EMPLOYEE_FIELDS
+) -> bytes:
+    """Sélection par IDs en flux Arrow ; IDs absents dans les métadonnées ("missing")."""
+    metadata = {"total": len(rows), "missing": ",".join(str(i) for i in missing)}
+    return dump_arrow_table(employee_table(rows, fields), metadata)
+
+
+def dump_employee_selection_msgpack(
+    rows: Sequence[Sequence[Any]], missing: Sequence[int], fields: tuple = EMPLOYEE_FIELDS
+) -> bytes:
+    """Sélection par IDs en MessagePack (même structure que le JSON)."""
+    employees = [dict(zip(fields, row, strict=True)) for row in rows]
+    return dump_msgpack({"total": len(employees), "employees": employees, "missing": list(missing)})
+
+
+# Encodeur d'une sélection par IDs par format négocié
+EMPLOYEE_SELECTION_ENCODERS = {
+    JSON_MEDIA_TYPE: dump_employee_selection,
+    ARROW_STREAM_MEDIA_TYPE: dump_employee_selection_arrow,
+    MSGPACK_MEDIA_TYPE: dump_employee_selection_msgpack,
+}
+
+
+def dump_frame_arrow(df: pd.DataFrame, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Sérialise un DataFrame de résultats (ex. scores d'un lot) en flux Arrow.
+
+    Les colonnes sont converties en bloc, sans dictionnaire par ligne.
+
+    Args:
+        df: Résultats
+        metadata: Valeurs ajoutées aux métadonnées du schéma
+
+    Returns:
+        Corps binaire application/vnd.apache.arrow.stream
+    """
+    return dump_arrow_table(pa.Table.from_pandas(df, preserve_index=False), metadata)
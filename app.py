@@ -4,7 +4,8 @@ Application de prédiction d'attrition des employés.
 """
 
 import streamlit as st
-from utils.api_client import APIClient
+from utils.shared_client import get_shared_client
+from utils import data_access
 from utils.ui_components import render_metric_card, show_error, render_footer
 from config import APP_TITLE, APP_ICON, APP_LAYOUT, API_URL
 
@@ -18,7 +19,7 @@ st.set_page_config(
 
 # Initialisation du client API dans session_state
 if "api_client" not in st.session_state:
-    st.session_state.api_client = APIClient()
+    st.session_state.api_client = get_shared_client()
     st.session_state.api_url = API_URL
 
 # Header
@@ -34,7 +35,8 @@ col1, col2 = st.columns(2)
 
 with st.spinner("🔄 Connexion à l'API..."):
     try:
-        health_data = st.session_state.api_client.health_check()
+        # État de l'API (en cache quelques secondes)
+        health_data = data_access.health()
 
         with col1:
             status = health_data.get("status", "unknown")
@@ -60,25 +62,18 @@ with st.spinner("🔄 Connexion à l'API..."):
             st.header("📊 Statistiques Générales")
 
             try:
-                # Récupérer tous les employés pour les stats
-                data = st.session_state.api_client.get_employees(skip=0, limit=100)
-                total_employees = data.get("total", 0)
-                employees = data.get("employees", [])
+                # Première page, en cache jusqu'au prochain changement de version
+                employees = data_access.employees_page(
+                    limit=100, fields=["age", "satisfaction_moyenne", "revenu_mensuel"]
+                )
+                total_employees = employees.attrs.get("total", 0)
 
                 # Calculer des statistiques moyennes
-                avg_age = (
-                    sum(emp.get("age", 0) for emp in employees) / len(employees) if employees else 0
-                )
+                avg_age = employees["age"].mean() if not employees.empty else 0
                 avg_satisfaction = (
-                    sum(emp.get("satisfaction_moyenne", 0) for emp in employees) / len(employees)
-                    if employees
-                    else 0
-                )
-                avg_revenue = (
-                    sum(emp.get("revenu_mensuel", 0) for emp in employees) / len(employees)
-                    if employees
-                    else 0
+                    employees["satisfaction_moyenne"].mean() if not employees.empty else 0
                 )
+                avg_revenue = employees["revenu_mensuel"].mean() if not employees.empty else 0
 
                 col1, col2, col3 = st.columns(3)
 
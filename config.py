@@ -14,6 +14,22 @@ APP_LAYOUT = "wide"
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
 
+# Départements de la base (filtre de l'Explorer)
+DEPARTEMENTS = ["Commercial", "Consulting", "Ressources Humaines"]
+
+# Postes de la base (filtre du tableau des risques)
+POSTES = [
+    "Assistant de Direction",
+    "Cadre Commercial",
+    "Consultant",
+    "Directeur Technique",
+    "Manager",
+    "Représentant Commercial",
+    "Ressources Humaines",
+    "Senior Manager",
+    "Tech Lead",
+]
+
 # Couleurs du thème (bleu nuit + corail)
 COLORS = {
     "primary": "#FF6B6B",  # Corail
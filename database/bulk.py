@@ -0,0 +1,205 @@
+"""
+Insertion en masse d'un DataFrame dans une table (sans objet ORM par ligne).
+
+- Les colonnes du DataFrame sont converties en bloc vers le type de la colonne
+  cible (entiers nullables, flottants, chaînes), les valeurs manquantes en None.
+- Les lignes sont envoyées par lots via executemany, dans la transaction de
+  l'appelant.
+- Chemin le plus rapide selon le moteur : sous SQLite, executemany natif du
+  pilote sur des tuples ; sous PostgreSQL, insert Core (psycopg2 regroupe les
+  lignes en INSERT ... VALUES multi-lignes).
+- bulk_upsert : INSERT ... ON CONFLICT DO UPDATE (SQLite, PostgreSQL), sinon
+  suppression puis insertion des clés concernées.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Iterator, List, Sequence
+
+import pandas as pd
+from sqlalchemy import Float, Integer, Table, delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
+
+from database.compact import DictionaryEncoded
+
+# Nombre de lignes par appel executemany
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", "10000"))
+
+
+@dataclass
+class BulkResult:
+    """Bilan d'une insertion en masse."""
+
+    rows: int
+    batches: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def typed_frame(df: pd.DataFrame, table: Table) -> pd.DataFrame:
+    """
+    Aligne un DataFrame sur les colonnes d'une table et convertit les types.
+
+    Les colonnes absentes de la table sont ignorées ; les conversions sont
+    vectorisées (une opération par colonne, pas par ligne).
+
+    Args:
+        df: Données source
+        table: Table cible
+
+    Returns:
+        DataFrame aux dtypes pandas nullables (Int64, float64, string)
+    """
+    columns = [column for column in table.columns if column.name in df.columns]
+    converted = {}
+    for column in columns:
+        values = df[column.name]
+        if isinstance(column.type, DictionaryEncoded):
+            values = values.astype("string")
+        elif isinstance(column.type, Integer):
+            values = pd.to_numeric(values).round().astype("Int64")
+        elif isinstance(column.type, Float):
+            values = pd.to_numeric(values).astype("float64")
+        else:
+            values = values.astype("string")
+        converted[column.name] = values
+
+    return pd.DataFrame(converted, index=df.index)
+
+
+def prepare_frame(df: pd.DataFrame, table: Table) -> pd.DataFrame:
+    """
+    Comme typed_frame, avec des valeurs Python natives pour executemany.
+
+    Args:
+        df: Données source
+        table: Table cible
+
+    Returns:
+        DataFrame de dtype object, None pour les valeurs manquantes
+    """
+    frame = typed_frame(df, table).astype(object)
+    return frame.where(frame.notna(), None)
+
+
+def iter_batches(rows: Sequence, batch_size: int) -> Iterator[Sequence]:
+    """Découpe une séquence en lots de `batch_size` éléments."""
+    for start in range(0, len(rows), batch_size):
+        yield rows[start : start + batch_size]
+
+
+def _uses_driver_executemany(connection, table: Table) -> bool:
+    """Le executemany brut n'est possible que sans expression SQL sur les valeurs liées."""
+    return connection.dialect.name == "sqlite" and not any(
+        isinstance(column.type, DictionaryEncoded) for column in table.columns
+    )
+
+
+def bulk_insert(
+    connection, table: Table, df: pd.DataFrame, batch_size: int = BULK_BATCH_SIZE
+) -> BulkResult:
+    """
+    Insère un DataFrame dans une table par lots executemany.
+
+    Ne gère pas la transaction : l'appelant ouvre `engine.begin()` pour que
+    l'import soit atomique.
+
+    Args:
+        connection: Connexion SQLAlchemy
+        table: Table cible
+        df: Données à insérer
+        batch_size: Nombre de lignes par executemany
+
+    Returns:
+        BulkResult (lignes, lots, durée)
+    """
+    start = time.perf_counter()
+    frame = prepare_frame(df, table)
+    names: List[str] = list(frame.columns)
+    rows = list(frame.itertuples(index=False, name=None))
+
+    batches = 0
+    if _uses_driver_executemany(connection, table):
+        placeholders = ", ".join("?" for _ in names)
+        statement = f"INSERT INTO {table.name} ({', '.join(names)}) VALUES ({placeholders})"
+        for batch in iter_batches(rows, batch_size):
+            connection.exec_driver_sql(statement, batch)
+            batches += 1
+    else:
+        statement = insert(table)
+        for batch in iter_batches(rows, batch_size):
+            connection.execute(statement, [dict(zip(names, row, strict=True)) for row in batch])
+            batches += 1
+
+    return BulkResult(rows=len(rows), batches=batches, seconds=time.perf_counter() - start)
+
+
+def _upsert_statement(connection, table: Table, key: str):
+    """INSERT ... ON CONFLICT (key) DO UPDATE pour les moteurs qui le supportent."""
+    dialects = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+    dialect_insert = dialects.get(connection.dialect.name)
+    if dialect_insert is None:
+        return None
+
+    statement = dialect_insert(table)
+    updates = {
+        column.name: statement.excluded[column.name]
+        for column in table.columns
+        if column.name != key
+    }
+    return statement.on_conflict_do_update(index_elements=[key], set_=updates)
+
+
+def bulk_upsert(
+    connection, table: Table, df: pd.DataFrame, key: str = "id", batch_size: int = BULK_BATCH_SIZE
+) -> BulkResult:
+    """
+    Insère ou met à jour (selon `key`) les lignes d'un DataFrame, par lots.
+
+    Args:
+        connection: Connexion SQLAlchemy (dans la transaction de l'appelant)
+        table: Table cible
+        df: Lignes à insérer ou remplacer
+        key: Colonne clé primaire servant à détecter les conflits
+        batch_size: Nombre de lignes par executemany
+
+    Returns:
+        BulkResult (lignes, lots, durée)
+    """
+    statement = _upsert_statement(connection, table, key)
+    if statement is None:
+        # Repli générique : on remplace les lignes existantes
+        start = time.perf_counter()
+        keys = df[key].tolist()
+        for batch in iter_batches(keys, batch_size):
+            connection.execute(delete(table).where(table.c[key].in_(batch)))
+        result = bulk_insert(connection, table, df, batch_size)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    start = time.perf_counter()
+    frame = prepare_frame(df, table)
+    names: List[str] = list(frame.columns)
+    rows = list(frame.itertuples(index=False, name=None))
+
+    batches = 0
+    if _uses_driver_executemany(connection, table):
+        updates = ", ".join(f"{name} = excluded.{name}" for name in names if name != key)
+        raw_statement = (
+            f"INSERT INTO {table.name} ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' for _ in names)}) "
+            f"ON CONFLICT ({key}) DO UPDATE SET {updates}"
+        )
+        for batch in iter_batches(rows, batch_size):
+            connection.exec_driver_sql(raw_statement, batch)
+            batches += 1
+    else:
+        for batch in iter_batches(rows, batch_size):
+            connection.execute(statement, [dict(zip(names, row, strict=True)) for row in batch])
+            batches += 1
+
+    return BulkResult(rows=len(rows), batches=batches, seconds=time.perf_counter() - start)
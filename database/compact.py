@@ -0,0 +1,238 @@
+"""
+Schéma de stockage compact (option DB_SCHEMA=compact).
+
+- Les colonnes catégorielles sont encodées par dictionnaire : la table employees
+  stocke un code SMALLINT qui référence une table de correspondance
+  lookup_<colonne> (id, value).
+- Les scores 1–4, années et compteurs passent en SMALLINT, le revenu en INTEGER,
+  l'ID en INTEGER (alias du rowid sous SQLite) et la satisfaction moyenne en
+  REAL 4 octets.
+
+L'encodage et le décodage sont faits en SQL par le type DictionaryEncoded : les
+requêtes ORM et Core continuent de lire et d'écrire des chaînes, la
+représentation API est inchangée.
+"""
+
+from typing import Any, Dict, Iterable
+
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    SmallInteger,
+    String,
+    Table,
+    func,
+    insert,
+    select,
+    type_coerce,
+)
+from sqlalchemy.types import TypeDecorator
+
+from database.config import Base, DB_SCHEMA
+
+COMPACT_SCHEMA = DB_SCHEMA == "compact"
+
+# Colonnes catégorielles à faible cardinalité (encodées par dictionnaire)
+CATEGORY_COLUMNS = (
+    "genre",
+    "statut_marital",
+    "ayant_enfants",
+    "poste",
+    "domaine_etude",
+    "departement",
+    "heure_supplementaires",
+    "distance_categorie",
+    "frequence_deplacement",
+)
+
+# Types numériques qui ne tiennent pas sur un SMALLINT ; toutes les autres
+# colonnes numériques (scores 1–4, années, compteurs) tiennent sur 2 octets
+COMPACT_TYPES = {
+    "id": Integer,
+    "revenu_mensuel": Integer,
+    "satisfaction_moyenne": Float(precision=24),
+}
+
+
+def lookup_table(metadata: MetaData, column: str) -> Table:
+    """
+    Retourne (ou déclare) la table de correspondance d'une colonne catégorielle.
+
+    Args:
+        metadata: MetaData dans laquelle déclarer la table
+        column: Nom de la colonne catégorielle
+
+    Returns:
+        Table lookup_<column> (id SMALLINT, value unique)
+    """
+    name = f"lookup_{column}"
+    if name in metadata.tables:
+        return metadata.tables[name]
+    return Table(
+        name,
+        metadata,
+        Column("id", SmallInteger, primary_key=True, autoincrement=False),
+        Column("value", String, nullable=False, unique=True),
+    )
+
+
+class DictionaryEncoded(TypeDecorator):
+    """
+    Colonne stockée sous forme de code SMALLINT, exposée comme une chaîne.
+
+    Les valeurs liées sont converties en code par une sous-requête sur la table
+    de correspondance, et les colonnes sélectionnées sont décodées de la même
+    façon. Une valeur absente du dictionnaire devient NULL : les écrivains
+    doivent appeler register_category_values avant d'insérer.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, lookup: Table):
+        super().__init__()
+        self.lookup = lookup
+
+    class Comparator(TypeDecorator.Comparator):
+        """Réécrit IN / LIKE pour comparer les valeurs et non les codes."""
+
+        def decoded(self):
+            lookup = self.type.lookup
+            return (
+                select(lookup.c.value)
+                .where(lookup.c.id == type_coerce(self.expr, SmallInteger))
+                .scalar_subquery()
+            )
+
+        def in_(self, other):
+            lookup = self.type.lookup
+            codes = select(lookup.c.id).where(lookup.c.value.in_(other))
+            return type_coerce(self.expr, SmallInteger).in_(codes)
+
+        def not_in(self, other):
+            return ~self.in_(other)
+
+        def like(self, other, escape=None):
+            return self.decoded().like(other, escape=escape)
+
+        def ilike(self, other, escape=None):
+            return self.decoded().ilike(other, escape=escape)
+
+    comparator_factory = Comparator
+
+    def bind_expression(self, bindvalue):
+        return (
+            select(self.lookup.c.id)
+            .where(self.lookup.c.value == type_coerce(bindvalue, String))
+            .scalar_subquery()
+        )
+
+    def column_expression(self, colexpr):
+        return (
+            select(self.lookup.c.value)
+            .where(self.lookup.c.id == type_coerce(colexpr, SmallInteger))
+            .scalar_subquery()
+        )
+
+
+def compact_type(column: str, default, metadata: MetaData = Base.metadata):
+    """
+    Type de stockage compact d'une colonne de la table employees.
+
+    Args:
+        column: Nom de la colonne
+        default: Type du schéma standard (conservé pour les colonnes non numériques)
+        metadata: MetaData des tables de correspondance
+
+    Returns:
+        Type SQLAlchemy à utiliser
+    """
+    if column in CATEGORY_COLUMNS:
+        return DictionaryEncoded(lookup_table(metadata, column))
+    if column in COMPACT_TYPES:
+        return COMPACT_TYPES[column]
+    if isinstance(default, type):
+        default = default()
+    if isinstance(default, (Integer, Float)):
+        return SmallInteger
+    return default
+
+
+def storage_type(column: str, default):
+    """
+    Type à utiliser dans le modèle Employee selon DB_SCHEMA.
+
+    Args:
+        column: Nom de la colonne
+        default: Type du schéma standard
+
+    Returns:
+        `default` en schéma standard, type compact sinon
+    """
+    if not COMPACT_SCHEMA:
+        return default
+    return compact_type(column, default)
+
+
+def build_compact_table(source: Table, metadata: MetaData, name: str = "employees") -> Table:
+    """
+    Déclare une table employees compacte à partir des colonnes d'une table existante.
+
+    Args:
+        source: Table employees (standard, éventuellement réfléchie)
+        metadata: MetaData de destination (tables de correspondance comprises)
+        name: Nom de la nouvelle table
+
+    Returns:
+        Table compacte (non créée en base)
+    """
+    return Table(
+        name,
+        metadata,
+        *[
+            Column(
+                column.name,
+                compact_type(column.name, column.type, metadata),
+                primary_key=column.primary_key,
+            )
+            for column in source.columns
+        ],
+    )
+
+
+def register_category_values(connection, values: Dict[str, Iterable[Any]]) -> int:
+    """
+    Ajoute aux tables de correspondance les valeurs catégorielles encore inconnues.
+
+    À appeler par les écrivains (migration, import) avant d'insérer en schéma
+    compact. Sans effet en schéma standard.
+
+    Args:
+        connection: Connexion SQLAlchemy (dans la transaction d'import)
+        values: {colonne: valeurs} — typiquement un DataFrame
+
+    Returns:
+        Nombre de valeurs ajoutées
+    """
+    if not COMPACT_SCHEMA:
+        return 0
+
+    added = 0
+    for column in CATEGORY_COLUMNS:
+        if column not in values:
+            continue
+        lookup = lookup_table(Base.metadata, column)
+        wanted = {str(value) for value in values[column] if value is not None and value == value}
+        known = set(connection.execute(select(lookup.c.value)).scalars())
+        new_values = sorted(wanted - known)
+        if not new_values:
+            continue
+        next_id = (connection.execute(select(func.max(lookup.c.id))).scalar() or 0) + 1
+        connection.execute(
+            insert(lookup),
+            [{"id": next_id + i, "value": value} for i, value in enumerate(new_values)],
+        )
+        added += len(new_values)
+    return added
@@ -1,22 +1,124 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 import os
 from pathlib import Path
 
 # Déterminer le type de base de données (SQLite par défaut pour HF Spaces)
 DB_TYPE = os.getenv("DB_TYPE", "sqlite")
 
+# Schéma de stockage : "standard" ou "compact" (voir database/compact.py)
+DB_SCHEMA = os.getenv("DB_SCHEMA", "standard")
+
+# Profil de performance SQLite ("tuned" par défaut, "default" pour le comportement d'origine)
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "tuned")
+
+# PRAGMAs appliqués à chaque nouvelle connexion SQLite (profil "tuned")
+SQLITE_PRAGMAS = {
+    # WAL : les lecteurs ne sont plus bloqués par les écritures (migrations, scores)
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "wal"),
+    # NORMAL est sûr en mode WAL et évite un fsync à chaque commit
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "normal"),
+    # Lecture des pages via mmap plutôt que read() (octets)
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    # Valeur négative = taille en Kio (ici 64 Mio de cache de pages par connexion)
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-65536")),
+    # Tables temporaires (tris, GROUP BY) en mémoire
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "memory"),
+}
+
+# PRAGMAs qui écrivent dans le fichier : ignorés en lecture seule
+SQLITE_WRITE_PRAGMAS = {"journal_mode", "synchronous"}
+
+# Pool dimensionné pour une charge majoritairement en lecture
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "8"))
+SQLITE_MAX_OVERFLOW = int(os.getenv("SQLITE_MAX_OVERFLOW", "8"))
+
+# Connexions en lecture seule (ex. réplique servie par l'API sans écriture)
+SQLITE_READ_ONLY = os.getenv("SQLITE_READ_ONLY", "false").lower() in ("1", "true", "yes")
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: dict, read_only: bool = False):
+    """
+    Applique les PRAGMAs de performance sur une connexion SQLite brute.
+
+    Args:
+        dbapi_connection: Connexion sqlite3 fraîchement ouverte
+        pragmas: Dictionnaire {nom: valeur} des PRAGMAs à appliquer
+        read_only: Ignore les PRAGMAs qui nécessitent un accès en écriture
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            if read_only and name in SQLITE_WRITE_PRAGMAS:
+                continue
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def create_sqlite_engine(
+    db_path,
+    read_only: bool = False,
+    pragmas: dict = None,
+    pool_size: int = SQLITE_POOL_SIZE,
+    max_overflow: int = SQLITE_MAX_OVERFLOW,
+    **kwargs,
+):
+    """
+    Crée un moteur SQLite avec le profil de performance.
+
+    Le ping de pool est désactivé : un fichier local ne « tombe » pas entre
+    deux emprunts de connexion, le ping coûtait un aller-retour par requête.
+
+    Args:
+        db_path: Chemin du fichier SQLite
+        read_only: Ouvre le fichier en lecture seule (URI mode=ro)
+        pragmas: PRAGMAs à appliquer (SQLITE_PRAGMAS par défaut)
+        pool_size: Nombre de connexions conservées dans le pool
+        max_overflow: Connexions supplémentaires autorisées en pic
+        **kwargs: Arguments supplémentaires pour create_engine
+
+    Returns:
+        Moteur SQLAlchemy configuré
+    """
+    pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+
+    if read_only:
+        url = f"sqlite:///file:{Path(db_path).resolve()}?mode=ro&uri=true"
+    else:
+        url = f"sqlite:///{db_path}"
+
+    sqlite_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        **kwargs,
+    )
+
+    @event.listens_for(sqlite_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, pragmas, read_only=read_only)
+
+    return sqlite_engine
+
+
 # Configuration selon le type de base de données
 if DB_TYPE == "sqlite":
     # SQLite - pour Hugging Face Spaces et développement local
     BASE_DIR = Path(__file__).parent.parent
     SQLITE_DB = BASE_DIR / "database.db"
     DATABASE_URL = f"sqlite:///{SQLITE_DB}"
-    # SQLite nécessite check_same_thread=False pour FastAPI
-    engine = create_engine(
-        DATABASE_URL, connect_args={"check_same_thread": False}, pool_pre_ping=True
-    )
+    if SQLITE_PROFILE == "tuned":
+        engine = create_sqlite_engine(SQLITE_DB, read_only=SQLITE_READ_ONLY)
+    else:
+        # SQLite nécessite check_same_thread=False pour FastAPI
+        engine = create_engine(
+            DATABASE_URL, connect_args={"check_same_thread": False}, pool_pre_ping=True
+        )
 else:
     # PostgreSQL - pour environnement Docker local
     DATABASE_URL = os.getenv(
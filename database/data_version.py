@@ -0,0 +1,74 @@
+"""
+Version des données (validateur des caches HTTP, voir api/conditional.py).
+
+La version est un entier strictement croissant, mis à jour dans la
+transaction de chaque écriture sur employees. Elle vaut au moins l'heure
+courante en millisecondes : elle reste croissante même si la table est
+recréée (migration complète), et un ancien ETag ne peut jamais redevenir
+valide.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import case, insert, select, update
+
+from database.models import DataVersion
+
+TABLE = DataVersion.__table__
+ROW_ID = 1
+
+
+@dataclass(frozen=True)
+class DataVersionInfo:
+    """Version courante et date de la dernière écriture (UTC, sans fuseau)."""
+
+    version: int
+    updated_at: datetime
+
+
+def bump_data_version(connection) -> int:
+    """
+    Incrémente la version des données, dans la transaction de l'écriture.
+
+    Args:
+        connection: Connexion SQLAlchemy (transaction de l'écrivain)
+
+    Returns:
+        Nouvelle version
+    """
+    TABLE.create(connection, checkfirst=True)
+    now = datetime.now(timezone.utc)
+    now_ms = int(now.timestamp() * 1000)
+    updated_at = now.replace(tzinfo=None)
+
+    # UPDATE unique : deux écrivains concurrents sont sérialisés par le verrou de ligne
+    next_version = TABLE.c.version + 1
+    result = connection.execute(
+        update(TABLE)
+        .where(TABLE.c.id == ROW_ID)
+        .values(
+            version=case((next_version > now_ms, next_version), else_=now_ms),
+            updated_at=updated_at,
+        )
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(TABLE).values(id=ROW_ID, version=now_ms, updated_at=updated_at))
+    return connection.execute(select(TABLE.c.version).where(TABLE.c.id == ROW_ID)).scalar()
+
+
+def read_data_version(connection) -> Optional[DataVersionInfo]:
+    """
+    Version courante des données.
+
+    Args:
+        connection: Connexion ou Session SQLAlchemy
+
+    Returns:
+        DataVersionInfo, None si aucune version n'a encore été enregistrée
+    """
+    row = connection.execute(
+        select(TABLE.c.version, TABLE.c.updated_at).where(TABLE.c.id == ROW_ID)
+    ).first()
+    return DataVersionInfo(row.version, row.updated_at) if row else None
@@ -0,0 +1,326 @@
+"""
+Statistiques de revenu par (département, niveau) maintenues incrémentalement.
+
+sous_paye_niveau_dept vaut 1 quand le revenu d'un employé est inférieur à la
+médiane de son groupe (département, niveau hiérarchique) dans la table
+employees. Plutôt que de recalculer toutes les médianes et tous les
+indicateurs à chaque écriture, on conserve à côté de employees :
+
+- pay_buckets : l'histogramme exact des revenus de chaque groupe (une ligne
+  par valeur distincte et son effectif), d'où la médiane exacte ;
+- pay_group_stats : effectif, somme et médiane courante de chaque groupe.
+
+Après une écriture, apply_pay_changes reçoit l'état avant/après des lignes
+touchées : seuls les effectifs modifiés sont réécrits, seule la médiane des
+groupes concernés est recalculée, et seuls les indicateurs qui peuvent
+changer sont mis à jour (lignes écrites, et lignes dont le revenu est compris
+entre l'ancienne et la nouvelle médiane).
+
+Usage :
+    python database/dept_stats.py [--database-url URL]   # reconstruction complète
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import and_, case, create_engine, delete, insert, select, tuple_, update
+
+from database.bulk import iter_batches
+from database.config import DATABASE_URL
+from database.data_version import bump_data_version
+from database.models import Employee, PayBucket, PayGroupStats
+from utils.features import PAY_GROUP
+
+PAY_COLUMNS = PAY_GROUP + ["revenu_mensuel"]
+STATS_TABLES = [PayBucket.__table__, PayGroupStats.__table__]
+
+# Taille des listes IN (limite de variables SQLite)
+KEY_BATCH_SIZE = 500
+
+
+def histogram_median(values: np.ndarray, counts: np.ndarray) -> Optional[float]:
+    """
+    Médiane exacte d'un histogramme (même définition que pandas.median).
+
+    Args:
+        values: Valeurs distinctes, triées
+        counts: Effectif de chaque valeur
+
+    Returns:
+        Médiane, None si l'effectif total est nul
+    """
+    total = int(counts.sum())
+    if total == 0:
+        return None
+    cumulative = np.cumsum(counts)
+    # Rangs (base 1) des deux valeurs centrales, confondus si l'effectif est impair
+    lower = values[np.searchsorted(cumulative, (total + 1) // 2)]
+    upper = values[np.searchsorted(cumulative, total // 2 + 1)]
+    return (float(lower) + float(upper)) / 2
+
+
+def pay_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """Colonnes de PAY_COLUMNS renseignées et typées ; lignes incomplètes écartées."""
+    frame = df.reindex(columns=PAY_COLUMNS).dropna()
+    return frame.astype(
+        {"departement": str, "niveau_hierarchique_poste": "int64", "revenu_mensuel": "int64"}
+    )
+
+
+def pay_rows(connection, ids: Iterable[int]) -> pd.DataFrame:
+    """
+    État actuel (id, groupe, revenu) d'employés, à lire avant de les modifier.
+
+    Args:
+        connection: Connexion SQLAlchemy
+        ids: Identifiants des employés qui vont être écrits ou supprimés
+
+    Returns:
+        DataFrame id + PAY_COLUMNS (employés existants uniquement)
+    """
+    table = Employee.__table__
+    columns = [table.c.id] + [table.c[name] for name in PAY_COLUMNS]
+    rows = []
+    for batch in iter_batches(list(ids), KEY_BATCH_SIZE):
+        rows.extend(connection.execute(select(*columns).where(table.c.id.in_(batch))).all())
+    return pd.DataFrame(rows, columns=["id"] + PAY_COLUMNS)
+
+
+def _native(key) -> tuple:
+    """Clé (tuple) convertie en types Python, acceptés par tous les pilotes DB-API."""
+    return tuple(value.item() if isinstance(value, np.generic) else value for value in key)
+
+
+def _load_buckets(connection, groups) -> pd.Series:
+    """Effectifs actuels des groupes demandés, indexés par PAY_COLUMNS."""
+    table = PayBucket.__table__
+    group_key = tuple_(*[table.c[name] for name in PAY_GROUP])
+    rows = []
+    for batch in iter_batches([_native(group) for group in groups], KEY_BATCH_SIZE):
+        query = select(*[table.c[name] for name in PAY_COLUMNS], table.c.count)
+        rows.extend(connection.execute(query.where(group_key.in_(batch))).all())
+    frame = pd.DataFrame(rows, columns=PAY_COLUMNS + ["count"])
+    return frame.set_index(PAY_COLUMNS)["count"].astype("int64")
+
+
+def _load_medians(connection, groups=None) -> pd.Series:
+    """Médianes enregistrées (toutes, ou celles des groupes demandés)."""
+    table = PayGroupStats.__table__
+    query = select(*[table.c[name] for name in PAY_GROUP], table.c.median)
+    if groups is None:
+        rows = connection.execute(query).all()
+    else:
+        group_key = tuple_(*[table.c[name] for name in PAY_GROUP])
+        rows = []
+        for batch in iter_batches([_native(group) for group in groups], KEY_BATCH_SIZE):
+            rows.extend(connection.execute(query.where(group_key.in_(batch))).all())
+    frame = pd.DataFrame(rows, columns=PAY_GROUP + ["median"])
+    return frame.set_index(PAY_GROUP)["median"].astype("float64")
+
+
+def _group_stats(buckets: pd.Series) -> pd.DataFrame:
+    """count, total et median par groupe à partir d'un histogramme (effectifs > 0)."""
+    records = []
+    for group, counts in buckets.groupby(level=PAY_GROUP, sort=False):
+        counts = counts.droplevel(PAY_GROUP).sort_index()
+        values = counts.index.to_numpy()
+        records.append(
+            (
+                *group,
+                int(counts.sum()),
+                int((values * counts.to_numpy()).sum()),
+                histogram_median(values, counts.to_numpy()),
+            )
+        )
+    return pd.DataFrame(records, columns=PAY_GROUP + ["count", "total", "median"])
+
+
+def _group_filter(table, group: Tuple[str, int]):
+    return and_(
+        *[table.c[name] == value for name, value in zip(PAY_GROUP, _native(group), strict=True)]
+    )
+
+
+def _update_flags(connection, group: Tuple[str, int], median: float, bounds=None, ids=None):
+    """
+    Recalcule sous_paye_niveau_dept dans un groupe pour la médiane donnée.
+
+    Args:
+        connection: Connexion SQLAlchemy
+        group: (departement, niveau_hierarchique_poste)
+        median: Médiane courante du groupe
+        bounds: (bas, haut) : seuls les revenus de cet intervalle sont concernés
+        ids: Identifiants d'employés à recalculer
+    """
+    table = Employee.__table__
+    revenue = table.c.revenu_mensuel
+    statement = update(table).values(sous_paye_niveau_dept=case((revenue < median, 1), else_=0))
+    condition = and_(_group_filter(table, group), revenue.is_not(None))
+    if bounds is not None:
+        connection.execute(statement.where(condition, revenue.between(*bounds)))
+    if ids is not None:
+        for batch in iter_batches(list(ids), KEY_BATCH_SIZE):
+            connection.execute(statement.where(condition, table.c.id.in_(batch)))
+    if bounds is None and ids is None:
+        connection.execute(statement.where(condition))
+
+
+def _write_group_stats(connection, stats: pd.DataFrame, groups):
+    table = PayGroupStats.__table__
+    group_key = tuple_(*[table.c[name] for name in PAY_GROUP])
+    for batch in iter_batches([_native(group) for group in groups], KEY_BATCH_SIZE):
+        connection.execute(delete(table).where(group_key.in_(batch)))
+    if len(stats):
+        connection.execute(insert(table), stats.to_dict("records"))
+
+
+def rebuild_pay_stats(connection) -> int:
+    """
+    Recalcule entièrement les statistiques et tous les indicateurs sous-payé.
+
+    Utilisé au chargement complet d'une base et pour initialiser les
+    statistiques d'une base existante.
+
+    Args:
+        connection: Connexion SQLAlchemy (dans la transaction de l'appelant)
+
+    Returns:
+        Nombre de groupes (département, niveau)
+    """
+    for table in STATS_TABLES:
+        table.create(connection, checkfirst=True)
+        connection.execute(delete(table))
+
+    employees = Employee.__table__
+    rows = connection.execute(select(*[employees.c[name] for name in PAY_COLUMNS])).all()
+    keys = pay_keys(pd.DataFrame(rows, columns=PAY_COLUMNS))
+    buckets = keys.value_counts().rename("count")
+
+    if len(buckets):
+        connection.execute(insert(PayBucket.__table__), buckets.reset_index().to_dict("records"))
+    stats = _group_stats(buckets)
+    _write_group_stats(connection, stats, [])
+
+    for record in stats.itertuples(index=False):
+        _update_flags(
+            connection, (record.departement, record.niveau_hierarchique_poste), record.median
+        )
+    return len(stats)
+
+
+def apply_pay_changes(connection, before: pd.DataFrame, after: pd.DataFrame) -> int:
+    """
+    Répercute l'écriture de quelques employés sur les statistiques et les indicateurs.
+
+    À appeler dans la transaction de l'écriture, une fois employees à jour.
+    Si les statistiques n'existent pas encore, elles sont reconstruites.
+
+    Args:
+        connection: Connexion SQLAlchemy
+        before: État des lignes modifiées ou supprimées avant l'écriture (pay_rows)
+        after: Lignes insérées ou modifiées, telles qu'écrites (id + PAY_COLUMNS)
+
+    Returns:
+        Nombre de groupes dont les statistiques ont changé
+    """
+    for table in STATS_TABLES:
+        table.create(connection, checkfirst=True)
+    if connection.execute(select(PayGroupStats.__table__.c.count).limit(1)).first() is None:
+        return rebuild_pay_stats(connection)
+
+    after = after.reset_index(drop=True)
+    deltas = pd.concat(
+        [pay_keys(after).assign(count=1), pay_keys(before).assign(count=-1)], ignore_index=True
+    )
+    deltas = deltas.groupby(PAY_COLUMNS)["count"].sum()
+    written = pay_keys(after)
+    written_ids = after.loc[written.index, "id"].groupby([written[name] for name in PAY_GROUP])
+    groups = set(deltas.index.droplevel("revenu_mensuel")) | set(written_ids.groups)
+    if not groups:
+        return 0
+
+    old_medians = _load_medians(connection, groups)
+    deltas = deltas[deltas != 0]
+    changed_groups = set(deltas.index.droplevel("revenu_mensuel"))
+
+    if changed_groups:
+        current = _load_buckets(connection, changed_groups)
+        updated = current.add(deltas, fill_value=0).astype("int64")
+        touched = updated[updated.index.isin(deltas.index)]
+
+        bucket_table = PayBucket.__table__
+        bucket_key = tuple_(*[bucket_table.c[name] for name in PAY_COLUMNS])
+        for batch in iter_batches([_native(key) for key in touched.index], KEY_BATCH_SIZE):
+            connection.execute(delete(bucket_table).where(bucket_key.in_(batch)))
+        remaining = touched[touched > 0].rename("count")
+        if len(remaining):
+            connection.execute(insert(bucket_table), remaining.reset_index().to_dict("records"))
+
+        stats = _group_stats(updated[updated > 0])
+        _write_group_stats(connection, stats, changed_groups)
+        new_medians = stats.set_index(PAY_GROUP)["median"]
+    else:
+        new_medians = old_medians
+
+    for group in groups:
+        # Groupe dont seules des lignes ont été réécrites : médiane inchangée
+        median = new_medians.get(group) if group in changed_groups else old_medians.get(group)
+        if median is None:
+            continue  # Groupe vidé : plus aucun employé à recalculer
+        old_median = old_medians.get(group)
+        if old_median is None:
+            _update_flags(connection, group, median)
+            continue
+        if old_median != median:
+            _update_flags(connection, group, median, bounds=sorted((old_median, median)))
+        if group in written_ids.groups:
+            _update_flags(connection, group, median, ids=written_ids.get_group(group).tolist())
+
+    return len(changed_groups)
+
+
+def load_pay_medians(connection) -> pd.Series:
+    """
+    Médianes courantes par (département, niveau), lues dans pay_group_stats.
+
+    Args:
+        connection: Connexion SQLAlchemy
+
+    Returns:
+        Série indexée comme utils.features.pay_medians (vide sans statistiques)
+    """
+    return _load_medians(connection).rename("revenu_mensuel")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconstruction des statistiques de revenu")
+    parser.add_argument("--database-url", default=DATABASE_URL, help="URL SQLAlchemy de la base")
+    args = parser.parse_args()
+
+    print("🚀 Reconstruction des statistiques de revenu par département et niveau...")
+    start = time.perf_counter()
+    try:
+        with create_engine(args.database_url).begin() as conn:
+            groups = rebuild_pay_stats(conn)
+            bump_data_version(conn)
+    except Exception as e:
+        print(f"❌ Erreur lors de la reconstruction: {e}")
+        return False
+
+    print(f"✓ {groups} groupes, indicateurs sous_paye_niveau_dept recalculés")
+    print(f"\n✅ Terminé en {time.perf_counter() - start:.2f}s")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,222 @@
+"""
+Migration de la table employees vers le schéma compact (et retour).
+
+- Crée une table de correspondance lookup_<colonne> par colonne catégorielle,
+  avec des codes attribués dans l'ordre alphabétique des valeurs.
+- Recopie employees dans une table aux types étroits (SMALLINT, INTEGER, REAL)
+  en remplaçant chaque valeur catégorielle par son code, puis la renomme.
+- Tout se fait dans une seule transaction ; sous SQLite un VACUUM final
+  récupère l'espace libéré.
+
+Usage :
+    python database/migrate_compact.py            # standard -> compact
+    python database/migrate_compact.py --revert   # compact -> standard
+
+Lancer ensuite l'API avec DB_SCHEMA=compact (ou standard après --revert).
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Float,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    func,
+    inspect,
+    insert,
+    select,
+    text,
+)
+
+from database.compact import CATEGORY_COLUMNS, build_compact_table, lookup_table
+from database.config import DATABASE_URL
+from database.models import create_missing_indexes
+
+
+def is_compact(connection) -> bool:
+    """Indique si la base utilise déjà le schéma compact."""
+    return inspect(connection).has_table(f"lookup_{CATEGORY_COLUMNS[0]}")
+
+
+def _database_size(engine) -> int:
+    """Taille du fichier SQLite en octets (0 pour les autres moteurs)."""
+    if engine.dialect.name != "sqlite" or not engine.url.database:
+        return 0
+    return Path(engine.url.database).stat().st_size
+
+
+def _vacuum(engine):
+    """Récupère l'espace libéré par l'ancienne table (SQLite uniquement)."""
+    if engine.dialect.name == "sqlite":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM"))
+
+
+def _swap_tables(connection, source: Table, target: Table):
+    """Remplace la table source par la table cible (déjà remplie)."""
+    source.drop(connection)
+    connection.execute(text(f"ALTER TABLE {target.name} RENAME TO employees"))
+
+
+def migrate_to_compact(engine) -> int:
+    """
+    Convertit la table employees standard en schéma compact.
+
+    Args:
+        engine: Moteur SQLAlchemy de la base à migrer
+
+    Returns:
+        Nombre d'employés migrés
+    """
+    metadata = MetaData()
+    with engine.begin() as conn:
+        if is_compact(conn):
+            raise RuntimeError("La base utilise déjà le schéma compact")
+
+        source = Table("employees", metadata, autoload_with=conn)
+        values = {}
+
+        # 1. Tables de correspondance (codes dans l'ordre alphabétique)
+        for column in CATEGORY_COLUMNS:
+            lookup = lookup_table(metadata, column)
+            lookup.create(conn)
+            distinct_values = (
+                conn.execute(
+                    select(source.c[column])
+                    .where(source.c[column].isnot(None))
+                    .distinct()
+                    .order_by(source.c[column])
+                )
+                .scalars()
+                .all()
+            )
+            if distinct_values:
+                conn.execute(
+                    insert(lookup),
+                    [{"id": i, "value": value} for i, value in enumerate(distinct_values, 1)],
+                )
+            values[column] = len(distinct_values)
+
+        # 2. Table compacte remplie en une requête INSERT ... SELECT
+        target = build_compact_table(source, metadata, name="employees_compact")
+        target.create(conn)
+
+        expressions = []
+        for column in source.columns:
+            if column.name in CATEGORY_COLUMNS:
+                lookup = metadata.tables[f"lookup_{column.name}"]
+                expressions.append(
+                    select(lookup.c.id).where(lookup.c.value == column).scalar_subquery()
+                )
+            else:
+                expressions.append(column)
+
+        names = [column.name for column in source.columns]
+        conn.execute(insert(target).from_select(names, select(*expressions)))
+
+        count = conn.execute(select(func.count()).select_from(target)).scalar()
+        expected = conn.execute(select(func.count()).select_from(source)).scalar()
+        if count != expected:
+            raise RuntimeError(f"Migration incomplète : {count}/{expected} lignes copiées")
+
+        # 3. Remplacement de l'ancienne table (ses index disparaissent avec elle)
+        _swap_tables(conn, source, target)
+        create_missing_indexes(conn)
+
+    for column, cardinality in values.items():
+        print(f"   lookup_{column}: {cardinality} valeurs")
+    return count
+
+
+def revert_to_standard(engine) -> int:
+    """
+    Reconvertit la table employees compacte en schéma standard.
+
+    Args:
+        engine: Moteur SQLAlchemy de la base à migrer
+
+    Returns:
+        Nombre d'employés migrés
+    """
+    metadata = MetaData()
+    with engine.begin() as conn:
+        if not is_compact(conn):
+            raise RuntimeError("La base utilise déjà le schéma standard")
+
+        source = Table("employees", metadata, autoload_with=conn)
+        lookups = [Table(f"lookup_{c}", metadata, autoload_with=conn) for c in CATEGORY_COLUMNS]
+
+        columns = []
+        expressions = []
+        for column in source.columns:
+            if column.name in CATEGORY_COLUMNS:
+                lookup = metadata.tables[f"lookup_{column.name}"]
+                columns.append(Column(column.name, String))
+                expressions.append(
+                    select(lookup.c.value).where(lookup.c.id == column).scalar_subquery()
+                )
+            else:
+                column_type = Float if isinstance(column.type, Float) else BigInteger
+                columns.append(Column(column.name, column_type, primary_key=column.primary_key))
+                expressions.append(column)
+
+        target = Table("employees_standard", metadata, *columns)
+        target.create(conn)
+        names = [column.name for column in source.columns]
+        conn.execute(insert(target).from_select(names, select(*expressions)))
+        count = conn.execute(select(func.count()).select_from(target)).scalar()
+
+        _swap_tables(conn, source, target)
+        for lookup in lookups:
+            lookup.drop(conn)
+
+        # Index du modèle Employee (ID, groupes de paie, clés de tri)
+        create_missing_indexes(conn)
+
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migration vers le schéma compact")
+    parser.add_argument("--revert", action="store_true", help="Revenir au schéma standard")
+    parser.add_argument("--database-url", default=DATABASE_URL, help="URL SQLAlchemy de la base")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    size_before = _database_size(engine)
+
+    try:
+        if args.revert:
+            print("🚀 Retour au schéma standard...")
+            count = revert_to_standard(engine)
+        else:
+            print("🚀 Migration vers le schéma compact...")
+            count = migrate_to_compact(engine)
+    except Exception as e:
+        print(f"❌ Erreur lors de la migration: {e}")
+        return False
+
+    _vacuum(engine)
+    print(f"✓ {count} employés migrés")
+    if size_before:
+        size_after = _database_size(engine)
+        print(f"📊 Taille du fichier: {size_before / 1024:.2f} KB -> {size_after / 1024:.2f} KB")
+
+    print(
+        f"\n✅ Migration terminée. Lancer l'API avec DB_SCHEMA={'standard' if args.revert else 'compact'}"
+    )
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
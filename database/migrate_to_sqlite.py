@@ -1,9 +1,12 @@
 """
 Script de migration des données CSV vers SQLite.
 Utilise SQLAlchemy pour créer la base de données et les tables.
+
+Par défaut la base est recréée ; avec --sync seules les lignes nouvelles ou
+modifiées sont appliquées (voir database/sync.py).
 """
 
-import os
+import argparse
 import sys
 import pandas as pd
 from pathlib import Path
@@ -11,9 +14,13 @@ from pathlib import Path
 # Ajouter le répertoire parent au path pour les imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, func, select
+from database.bulk import BULK_BATCH_SIZE, bulk_insert
+from database.compact import register_category_values
+from database.data_version import bump_data_version
+from database.dept_stats import rebuild_pay_stats
 from database.models import Base, Employee
+from database.sync import record_row_hashes, sync_csv
 
 # Chemins
 BASE_DIR = Path(__file__).parent.parent
@@ -21,9 +28,12 @@ CSV_FILE = BASE_DIR / "data" / "export-api" / "test_employees.csv"
 SQLITE_DB = BASE_DIR / "database.db"
 
 
-def migrate_to_sqlite():
+def migrate_to_sqlite(batch_size: int = BULK_BATCH_SIZE):
     """
     Migre les données du CSV vers une base de données SQLite.
+
+    Args:
+        batch_size: Nombre de lignes par executemany
     """
     print("🚀 Début de la migration vers SQLite...")
 
@@ -60,73 +70,34 @@ def migrate_to_sqlite():
         print(f"❌ Erreur lors de la création de la base: {e}")
         return False
 
-    # 4. Insérer les données
+    # 4. Insérer les données (executemany par lots, une seule transaction)
     try:
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        db = SessionLocal()
-
         # Ajouter un ID auto-incrémenté si non présent
         if "id" not in df.columns:
             df.insert(0, "id", range(1, len(df) + 1))
 
-        # Convertir le DataFrame en objets Employee
-        employees = []
-        for _, row in df.iterrows():
-            employee = Employee(
-                id=row.get("id"),
-                genre=row.get("genre"),
-                age=row.get("age"),
-                statut_marital=row.get("statut_marital"),
-                ayant_enfants=row.get("ayant_enfants"),
-                distance_domicile_travail=row.get("distance_domicile_travail"),
-                niveau_education=row.get("niveau_education"),
-                poste=row.get("poste"),
-                domaine_etude=row.get("domaine_etude"),
-                departement=row.get("departement"),
-                niveau_hierarchique_poste=row.get("niveau_hierarchique_poste"),
-                nombre_experiences_precedentes=row.get("nombre_experiences_precedentes"),
-                annee_experience_totale=row.get("annee_experience_totale"),
-                annees_dans_l_entreprise=row.get("annees_dans_l_entreprise"),
-                annees_dans_le_poste_actuel=row.get("annees_dans_le_poste_actuel"),
-                annees_depuis_la_derniere_promotion=row.get("annees_depuis_la_derniere_promotion"),
-                annes_sous_responsable_actuel=row.get("annes_sous_responsable_actuel"),
-                nombre_employee_sous_responsabilite=row.get("nombre_employee_sous_responsabilite"),
-                revenu_mensuel=row.get("revenu_mensuel"),
-                heure_supplementaires=row.get("heure_supplementaires"),
-                nombre_heures_travailless=row.get("nombre_heures_travailless"),
-                distance_categorie=row.get("distance_categorie"),
-                frequence_deplacement=row.get("frequence_deplacement"),
-                satisfaction_employee_environnement=row.get("satisfaction_employee_environnement"),
-                satisfaction_employee_nature_travail=row.get(
-                    "satisfaction_employee_nature_travail"
-                ),
-                satisfaction_employee_equipe=row.get("satisfaction_employee_equipe"),
-                satisfaction_employee_equilibre_pro_perso=row.get(
-                    "satisfaction_employee_equilibre_pro_perso"
-                ),
-                satisfaction_moyenne=row.get("satisfaction_moyenne"),
-                note_evaluation_precedente=row.get("note_evaluation_precedente"),
-                note_evaluation_actuelle=row.get("note_evaluation_actuelle"),
-                nb_formations_suivies=row.get("nb_formations_suivies"),
-                nombre_participation_pee=row.get("nombre_participation_pee"),
-                parent_burnout=row.get("parent_burnout"),
-                sous_paye_niveau_dept=row.get("sous_paye_niveau_dept"),
-                augementation_salaire_precedente=row.get("augementation_salaire_precedente"),
-            )
-            employees.append(employee)
-
-        # Insertion en batch
-        db.bulk_save_objects(employees)
-        db.commit()
-
-        print(f"✓ {len(employees)} employés insérés avec succès")
+        with engine.begin() as conn:
+            # Schéma compact : compléter les tables de correspondance avant l'insertion
+            register_category_values(conn, df)
+            result = bulk_insert(conn, Employee.__table__, df, batch_size=batch_size)
+            # Empreintes des lignes : la première synchronisation ne réécrit pas tout
+            record_row_hashes(conn, df, batch_size=batch_size)
+            # Médianes de revenu de la population chargée, base des mises à jour incrémentales
+            groups = rebuild_pay_stats(conn)
+            # Nouvelle version des données : les ETag servis par l'API sont invalidés
+            bump_data_version(conn)
+
+        print(
+            f"✓ {result.rows} employés insérés avec succès "
+            f"({result.batches} lots, {result.seconds:.2f}s, {result.rows_per_second:,.0f} lignes/s)"
+        )
+        print(f"✓ Statistiques de revenu calculées pour {groups} groupes département/niveau")
 
         # Vérification
-        count = db.query(Employee).count()
+        with engine.connect() as conn:
+            count = conn.execute(select(func.count()).select_from(Employee.__table__)).scalar()
         print(f"✓ Vérification: {count} employés dans la base")
 
-        db.close()
-
     except Exception as e:
         print(f"❌ Erreur lors de l'insertion des données: {e}")
         import traceback
@@ -141,6 +112,52 @@ def migrate_to_sqlite():
     return True
 
 
+def sync_sqlite(delete_missing: bool = False, batch_size: int = BULK_BATCH_SIZE):
+    """
+    Synchronise le CSV avec la base SQLite existante, sans la recréer.
+
+    Args:
+        delete_missing: Supprime les employés absents du CSV
+        batch_size: Nombre de lignes par executemany
+    """
+    print("🚀 Synchronisation incrémentale vers SQLite...")
+
+    if not CSV_FILE.exists():
+        print(f"❌ Erreur: Fichier CSV introuvable: {CSV_FILE}")
+        return False
+
+    try:
+        engine = create_engine(f"sqlite:///{SQLITE_DB}", echo=False)
+        result = sync_csv(engine, CSV_FILE, delete_missing=delete_missing, batch_size=batch_size)
+    except Exception as e:
+        print(f"❌ Erreur lors de la synchronisation: {e}")
+        return False
+
+    if result.skipped:
+        print("✓ CSV inchangé depuis la dernière synchronisation, rien à faire")
+    else:
+        print(
+            f"✓ {result.inserted} ajoutés, {result.updated} modifiés, "
+            f"{result.deleted} supprimés, {result.unchanged} inchangés ({result.seconds:.2f}s)"
+        )
+    return True
+
+
 if __name__ == "__main__":
-    success = migrate_to_sqlite()
+    parser = argparse.ArgumentParser(description="Migration CSV -> SQLite")
+    parser.add_argument(
+        "--batch-size", type=int, default=BULK_BATCH_SIZE, help="Lignes par executemany"
+    )
+    parser.add_argument(
+        "--sync", action="store_true", help="Synchronisation incrémentale au lieu de recréer"
+    )
+    parser.add_argument(
+        "--delete-missing", action="store_true", help="Avec --sync : supprimer les absents"
+    )
+    args = parser.parse_args()
+
+    if args.sync:
+        success = sync_sqlite(delete_missing=args.delete_missing, batch_size=args.batch_size)
+    else:
+        success = migrate_to_sqlite(batch_size=args.batch_size)
     sys.exit(0 if success else 1)
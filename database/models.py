@@ -1,65 +1,202 @@
-from sqlalchemy import Column, Integer, String, Float, BigInteger
+from typing import List
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Float, BigInteger, inspect
 from database.config import Base
+from database.compact import storage_type
+
+# Clés de tri proposées par la page Explorer : index (colonne, id) pour la
+# pagination par curseur (voir api/pagination.py)
+SORT_INDEX_COLUMNS = (
+    "genre",
+    "age",
+    "poste",
+    "departement",
+    "revenu_mensuel",
+    "satisfaction_moyenne",
+    "annees_dans_l_entreprise",
+)
 
 
 class Employee(Base):
     """
     Modèle SQLAlchemy pour la table employees.
     Représente un employé avec toutes ses caractéristiques.
+    Les types de stockage dépendent de DB_SCHEMA (standard ou compact).
     """
 
     __tablename__ = "employees"
+    __table_args__ = (
+        # Mise à jour ciblée de sous_paye_niveau_dept (voir database/dept_stats.py)
+        Index(
+            "ix_employees_pay_group", "departement", "niveau_hierarchique_poste", "revenu_mensuel"
+        ),
+        *(Index(f"ix_employees_sort_{name}", name, "id") for name in SORT_INDEX_COLUMNS),
+    )
 
     # Identifiant
-    id = Column(BigInteger, primary_key=True, index=True)
+    id = Column(storage_type("id", BigInteger), primary_key=True, index=True)
 
     # Informations personnelles
-    genre = Column(String)
-    age = Column(BigInteger)
-    statut_marital = Column(String)
-    ayant_enfants = Column(String)
-    distance_domicile_travail = Column(BigInteger)
-    niveau_education = Column(BigInteger)
+    genre = Column(storage_type("genre", String))
+    age = Column(storage_type("age", BigInteger))
+    statut_marital = Column(storage_type("statut_marital", String))
+    ayant_enfants = Column(storage_type("ayant_enfants", String))
+    distance_domicile_travail = Column(storage_type("distance_domicile_travail", BigInteger))
+    niveau_education = Column(storage_type("niveau_education", BigInteger))
 
     # Informations professionnelles
-    poste = Column(String)
-    domaine_etude = Column(String)
-    departement = Column(String)
-    niveau_hierarchique_poste = Column(BigInteger)
+    poste = Column(storage_type("poste", String))
+    domaine_etude = Column(storage_type("domaine_etude", String))
+    departement = Column(storage_type("departement", String))
+    niveau_hierarchique_poste = Column(storage_type("niveau_hierarchique_poste", BigInteger))
 
     # Carrière et expérience
-    nombre_experiences_precedentes = Column(BigInteger)
-    annee_experience_totale = Column(BigInteger)
-    annees_dans_l_entreprise = Column(BigInteger)
-    annees_dans_le_poste_actuel = Column(BigInteger)
-    annees_depuis_la_derniere_promotion = Column(BigInteger)
-    annes_sous_responsable_actuel = Column(BigInteger)
-    nombre_employee_sous_responsabilite = Column(BigInteger)
+    nombre_experiences_precedentes = Column(
+        storage_type("nombre_experiences_precedentes", BigInteger)
+    )
+    annee_experience_totale = Column(storage_type("annee_experience_totale", BigInteger))
+    annees_dans_l_entreprise = Column(storage_type("annees_dans_l_entreprise", BigInteger))
+    annees_dans_le_poste_actuel = Column(storage_type("annees_dans_le_poste_actuel", BigInteger))
+    annees_depuis_la_derniere_promotion = Column(
+        storage_type("annees_depuis_la_derniere_promotion", BigInteger)
+    )
+    annes_sous_responsable_actuel = Column(
+        storage_type("annes_sous_responsable_actuel", BigInteger)
+    )
+    nombre_employee_sous_responsabilite = Column(
+        storage_type("nombre_employee_sous_responsabilite", BigInteger)
+    )
 
     # Conditions de travail
-    revenu_mensuel = Column(BigInteger)
-    heure_supplementaires = Column(String)
-    nombre_heures_travailless = Column(BigInteger)
-    distance_categorie = Column(String)
-    frequence_deplacement = Column(String)
+    revenu_mensuel = Column(storage_type("revenu_mensuel", BigInteger))
+    heure_supplementaires = Column(storage_type("heure_supplementaires", String))
+    nombre_heures_travailless = Column(storage_type("nombre_heures_travailless", BigInteger))
+    distance_categorie = Column(storage_type("distance_categorie", String))
+    frequence_deplacement = Column(storage_type("frequence_deplacement", String))
 
     # Satisfaction et évaluation
-    satisfaction_employee_environnement = Column(BigInteger)
-    satisfaction_employee_nature_travail = Column(BigInteger)
-    satisfaction_employee_equipe = Column(BigInteger)
-    satisfaction_employee_equilibre_pro_perso = Column(BigInteger)
-    satisfaction_moyenne = Column(Float)
-    note_evaluation_precedente = Column(BigInteger)
-    note_evaluation_actuelle = Column(BigInteger)
+    satisfaction_employee_environnement = Column(
+        storage_type("satisfaction_employee_environnement", BigInteger)
+    )
+    satisfaction_employee_nature_travail = Column(
+        storage_type("satisfaction_employee_nature_travail", BigInteger)
+    )
+    satisfaction_employee_equipe = Column(storage_type("satisfaction_employee_equipe", BigInteger))
+    satisfaction_employee_equilibre_pro_perso = Column(
+        storage_type("satisfaction_employee_equilibre_pro_perso", BigInteger)
+    )
+    satisfaction_moyenne = Column(storage_type("satisfaction_moyenne", Float))
+    note_evaluation_precedente = Column(storage_type("note_evaluation_precedente", BigInteger))
+    note_evaluation_actuelle = Column(storage_type("note_evaluation_actuelle", BigInteger))
 
     # Formation et développement
-    nb_formations_suivies = Column(BigInteger)
-    nombre_participation_pee = Column(BigInteger)
+    nb_formations_suivies = Column(storage_type("nb_formations_suivies", BigInteger))
+    nombre_participation_pee = Column(storage_type("nombre_participation_pee", BigInteger))
 
     # Indicateurs de risque
-    parent_burnout = Column(BigInteger)
-    sous_paye_niveau_dept = Column(BigInteger)
-    augementation_salaire_precedente = Column(BigInteger)
+    parent_burnout = Column(storage_type("parent_burnout", BigInteger))
+    sous_paye_niveau_dept = Column(storage_type("sous_paye_niveau_dept", BigInteger))
+    augementation_salaire_precedente = Column(
+        storage_type("augementation_salaire_precedente", BigInteger)
+    )
 
     def __repr__(self):
         return f"<Employee(id={self.id}, nom={self.poste}, departement={self.departement})>"
+
+
+def create_missing_indexes(connection) -> List[str]:
+    """
+    Crée les index du modèle Employee absents de la table employees.
+
+    create_all ne touche pas une table existante : une base créée avant l'ajout
+    d'un index, ou une table recréée par migrate_compact, en est dépourvue.
+
+    Args:
+        connection: Connexion SQLAlchemy (dans une transaction)
+
+    Returns:
+        Noms des index créés
+    """
+    existing = {index["name"] for index in inspect(connection).get_indexes(Employee.__tablename__)}
+    created = []
+    for index in sorted(Employee.__table__.indexes, key=lambda index: index.name):
+        if index.name not in existing:
+            index.create(connection)
+            created.append(index.name)
+    return created
+
+
+class EmployeeRowHash(Base):
+    """
+    Empreinte du contenu source de chaque employé (synchronisation incrémentale).
+    Table séparée : le schéma de employees reste inchangé.
+    """
+
+    __tablename__ = "employee_row_hashes"
+
+    id = Column(BigInteger, primary_key=True)
+    row_hash = Column(BigInteger, nullable=False)
+
+
+class SyncState(Base):
+    """Empreinte du dernier fichier source synchronisé, par source."""
+
+    __tablename__ = "sync_state"
+
+    source = Column(String, primary_key=True)
+    file_hash = Column(String, nullable=False)
+    synced_at = Column(DateTime, nullable=False)
+    rows = Column(BigInteger, nullable=False)
+
+
+class IngestCheckpoint(Base):
+    """Position de reprise d'un import en flux (octet suivant le dernier lot validé)."""
+
+    __tablename__ = "ingest_checkpoints"
+
+    source = Column(String, primary_key=True)
+    fingerprint = Column(String, nullable=False)
+    byte_offset = Column(BigInteger, nullable=False)
+    rows = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class PayBucket(Base):
+    """
+    Histogramme exact des revenus par (département, niveau) : une ligne par
+    valeur de revenu distincte, avec son effectif. Sert au calcul incrémental
+    des médianes de sous_paye_niveau_dept.
+    """
+
+    __tablename__ = "pay_buckets"
+
+    departement = Column(String, primary_key=True)
+    niveau_hierarchique_poste = Column(BigInteger, primary_key=True)
+    revenu_mensuel = Column(BigInteger, primary_key=True)
+    count = Column(BigInteger, nullable=False)
+
+
+class PayGroupStats(Base):
+    """Statistiques courantes des revenus par (département, niveau)."""
+
+    __tablename__ = "pay_group_stats"
+
+    departement = Column(String, primary_key=True)
+    niveau_hierarchique_poste = Column(BigInteger, primary_key=True)
+    count = Column(BigInteger, nullable=False)
+    total = Column(BigInteger, nullable=False)
+    median = Column(Float, nullable=False)
+
+
+class DataVersion(Base):
+    """
+    Version des données servies par l'API (ligne unique), strictement croissante.
+    Incrémentée par chaque écriture (migration, import, synchronisation) ; sert
+    de validateur HTTP (ETag / Last-Modified).
+    """
+
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
@@ -0,0 +1,170 @@
+"""
+Chargement en masse PostgreSQL par COPY (mode Docker / DB_TYPE=postgres).
+
+1. Les lignes sont converties en CSV dans un tampon mémoire (pas de fichier
+   temporaire) par l'écrivain CSV de pyarrow (installé avec streamlit), qui
+   libère le GIL, puis envoyées par COPY FROM STDIN dans une table de transit
+   UNLOGGED ; les lots peuvent être chargés sur plusieurs connexions en
+   parallèle.
+2. La table de transit est fusionnée dans employees par un seul
+   INSERT ... SELECT ... ON CONFLICT (id) DO UPDATE, puis supprimée.
+
+Nécessite psycopg2 et une table employees avec clé primaire sur id (celle du
+modèle Employee ; une table créée par DataFrame.to_sql n'en a pas).
+Le schéma compact (DB_SCHEMA=compact) n'est pas pris en charge.
+"""
+
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from sqlalchemy import Table, inspect, text
+
+from database.bulk import typed_frame
+from database.compact import DictionaryEncoded
+from database.models import Employee
+
+# Lignes par COPY (un tampon CSV en mémoire par lot)
+COPY_CHUNK_SIZE = 100_000
+
+
+@dataclass
+class CopyResult:
+    """Bilan d'un chargement COPY."""
+
+    rows: int
+    chunks: int
+    copy_seconds: float
+    merge_seconds: float
+
+    @property
+    def seconds(self) -> float:
+        return self.copy_seconds + self.merge_seconds
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def frame_to_csv_buffer(frame: pd.DataFrame) -> io.BytesIO:
+    """
+    Sérialise un lot (déjà passé par typed_frame) au format CSV de COPY.
+
+    pyarrow entoure toujours les chaînes de guillemets et écrit les valeurs
+    manquantes comme un champ vide sans guillemets : c'est exactement la
+    convention NULL par défaut de COPY ... (FORMAT csv).
+
+    Args:
+        frame: Lignes à charger, colonnes dans l'ordre de la commande COPY
+
+    Returns:
+        Tampon UTF-8 positionné au début
+    """
+    buffer = io.BytesIO()
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    pa_csv.write_csv(table, buffer, pa_csv.WriteOptions(include_header=False))
+    buffer.seek(0)
+    return buffer
+
+
+def _check_target(connection, table: Table, key: str):
+    """Vérifie que la table cible accepte ON CONFLICT (key)."""
+    if any(isinstance(column.type, DictionaryEncoded) for column in table.columns):
+        raise RuntimeError("Le chargement COPY ne prend pas en charge le schéma compact")
+
+    table.create(connection, checkfirst=True)
+    primary_key = inspect(connection).get_pk_constraint(table.name)["constrained_columns"]
+    if primary_key != [key]:
+        raise RuntimeError(
+            f"La table {table.name} n'a pas de clé primaire sur {key} "
+            "(créée par to_sql ?) : la supprimer pour la recréer depuis le modèle"
+        )
+
+
+def _copy_chunk(engine, staging: str, columns: List[str], frame: pd.DataFrame) -> int:
+    """Charge un lot dans la table de transit sur sa propre connexion."""
+    buffer = frame_to_csv_buffer(frame)
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {staging} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        raw.commit()
+    finally:
+        raw.close()
+    return len(frame)
+
+
+def copy_load(
+    engine,
+    df: pd.DataFrame,
+    table: Table = Employee.__table__,
+    key: str = "id",
+    chunk_size: int = COPY_CHUNK_SIZE,
+    workers: int = 1,
+) -> CopyResult:
+    """
+    Charge un DataFrame dans une table PostgreSQL via COPY puis fusion.
+
+    Args:
+        engine: Moteur SQLAlchemy PostgreSQL (psycopg2)
+        df: Lignes à charger
+        table: Table cible
+        key: Clé primaire utilisée pour la fusion
+        chunk_size: Lignes par COPY
+        workers: Connexions utilisées en parallèle pour les COPY
+
+    Returns:
+        CopyResult (durées de chargement et de fusion)
+    """
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("copy_load nécessite une base PostgreSQL")
+
+    staging = f"{table.name}_staging"
+    frame = typed_frame(df, table)
+    columns = list(frame.columns)
+
+    with engine.begin() as conn:
+        _check_target(conn, table, key)
+        conn.execute(text(f"DROP TABLE IF EXISTS {staging}"))
+        conn.execute(
+            text(f"CREATE UNLOGGED TABLE {staging} (LIKE {table.name} INCLUDING DEFAULTS)")
+        )
+
+    start = time.perf_counter()
+    chunks = [frame.iloc[i : i + chunk_size] for i in range(0, len(frame), chunk_size)]
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            rows = sum(
+                executor.map(lambda chunk: _copy_chunk(engine, staging, columns, chunk), chunks)
+            )
+        copy_seconds = time.perf_counter() - start
+
+        # Fusion en une instruction ; DISTINCT ON évite l'erreur ON CONFLICT sur une clé en double
+        start = time.perf_counter()
+        updates = ", ".join(f"{name} = EXCLUDED.{name}" for name in columns if name != key)
+        column_list = ", ".join(columns)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    f"INSERT INTO {table.name} ({column_list}) "
+                    f"SELECT DISTINCT ON ({key}) {column_list} FROM {staging} "
+                    f"ORDER BY {key} "
+                    f"ON CONFLICT ({key}) DO UPDATE SET {updates}"
+                )
+            )
+        merge_seconds = time.perf_counter() - start
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {staging}"))
+
+    return CopyResult(
+        rows=rows, chunks=len(chunks), copy_seconds=copy_seconds, merge_seconds=merge_seconds
+    )
@@ -0,0 +1,271 @@
+"""
+Export de la table employees en snapshot Parquet, partitionné par département.
+
+- Le contenu est lu en une requête, typé (database/bulk.py) puis écrit par
+  pyarrow dans un dossier par département (partitionnement « hive »).
+- Chaque snapshot porte une version horodatée suivie d'une empreinte du
+  contenu ; elle est reprise dans le manifeste (_manifest.json) et dans les
+  métadonnées Parquet. Un contenu identique au snapshot courant n'est pas
+  réécrit (sauf --force).
+- Le manifeste enregistre aussi la version des données de la base
+  (database/data_version.py) : les pages Streamlit ne servent le snapshot
+  que tant qu'elle est celle de l'API.
+- Publication atomique : écriture dans un dossier temporaire, renommage, puis
+  mise à jour du fichier CURRENT. Un lecteur voit l'ancienne ou la nouvelle
+  version, jamais un snapshot partiel.
+- Avec --with-scores, les scores du modèle (probabilité, prédiction, niveau
+  de risque) sont ajoutés à chaque ligne.
+
+Lecture : utils/snapshot.py (read_snapshot, snapshot_arrays).
+
+Usage :
+    python database/snapshot.py [--output data/snapshots] [--with-scores] [--keep 3]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+import joblib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, select
+
+from database.bulk import typed_frame
+from database.config import DATABASE_URL
+from database.data_version import read_data_version
+from database.models import Employee
+from utils.scoring import score_frame
+from utils.snapshot import (
+    CURRENT_FILE,
+    MANIFEST_FILE,
+    PARTITION_COLUMN,
+    SNAPSHOT_DIR,
+    current_version,
+    snapshot_manifest,
+)
+
+BASE_DIR = Path(__file__).parent.parent
+MODEL_PATH = BASE_DIR / "data" / "export-api" / "attrition_model.joblib"
+
+# Nombre de versions conservées dans le dossier des snapshots
+SNAPSHOT_KEEP = 3
+
+
+@dataclass
+class SnapshotResult:
+    """Bilan d'un export."""
+
+    version: str
+    path: Path
+    rows: int
+    partitions: int
+    seconds: float
+    reused: bool = False
+
+
+def content_hash(df: pd.DataFrame) -> str:
+    """Empreinte courte du contenu d'un DataFrame (indépendante de l'horodatage)."""
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.sha256(hashes.tobytes())
+    digest.update(",".join(df.columns).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def read_employees(connection) -> pd.DataFrame:
+    """Contenu complet de employees, trié par id, aux types de la table."""
+    table = Employee.__table__
+    rows = connection.execute(select(table).order_by(table.c.id)).all()
+    df = pd.DataFrame(rows, columns=[column.name for column in table.columns])
+    return typed_frame(df, table)
+
+
+def read_version(connection) -> Optional[int]:
+    """Version des données de la base, None si elle n'en enregistre pas."""
+    try:
+        info = read_data_version(connection)
+    except Exception:
+        # Base antérieure à la table data_version
+        connection.rollback()
+        return None
+    return info.version if info else None
+
+
+def _write_manifest(directory: Path, manifest: Dict):
+    """Écrit le manifeste d'un snapshot (remplacement atomique)."""
+    temporary = directory / f".{MANIFEST_FILE}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temporary, directory / MANIFEST_FILE)
+
+
+def _publish(root: Path, version: str):
+    """Remplace atomiquement le pointeur CURRENT."""
+    pointer = root / CURRENT_FILE
+    temporary = root / f".{CURRENT_FILE}.tmp"
+    temporary.write_text(version, encoding="utf-8")
+    os.replace(temporary, pointer)
+
+
+def prune_snapshots(root: Path, keep: int = SNAPSHOT_KEEP) -> int:
+    """
+    Supprime les versions les plus anciennes (jamais la version courante).
+
+    Returns:
+        Nombre de versions supprimées
+    """
+    current = current_version(root)
+    versions = sorted(
+        path.name for path in root.iterdir() if path.is_dir() and not path.name.startswith(".")
+    )
+    removed = 0
+    for version in versions[: max(len(versions) - keep, 0)]:
+        if version != current:
+            shutil.rmtree(root / version)
+            removed += 1
+    return removed
+
+
+def export_snapshot(
+    engine,
+    root: Path = SNAPSHOT_DIR,
+    with_scores: bool = False,
+    model_path: Path = MODEL_PATH,
+    force: bool = False,
+    keep: int = SNAPSHOT_KEEP,
+) -> SnapshotResult:
+    """
+    Écrit et publie un snapshot Parquet de employees.
+
+    Args:
+        engine: Moteur SQLAlchemy
+        root: Dossier des snapshots
+        with_scores: Ajoute les scores du modèle à chaque ligne
+        model_path: Modèle joblib utilisé pour les scores
+        force: Réécrit même si le contenu est celui du snapshot courant
+        keep: Nombre de versions conservées
+
+    Returns:
+        SnapshotResult (reused=True si le snapshot courant a été conservé)
+    """
+    start = time.perf_counter()
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+
+    with engine.connect() as conn:
+        # Lue avant le contenu : une écriture concurrente rend le snapshot périmé, jamais l'inverse
+        data_version = read_version(conn)
+        df = read_employees(conn)
+    if with_scores:
+        scores = score_frame(joblib.load(model_path), df)
+        df = pd.concat([df, scores], axis=1)
+
+    digest = content_hash(df)
+    current = current_version(root)
+    if current and not force:
+        manifest = snapshot_manifest(root, current)
+        if manifest.get("content_hash") == digest:
+            # Contenu identique sous une nouvelle version des données : le snapshot reste à jour
+            if manifest.get("data_version") != data_version:
+                _write_manifest(root / current, {**manifest, "data_version": data_version})
+            return SnapshotResult(
+                version=current,
+                path=root / current,
+                rows=manifest["rows"],
+                partitions=len(manifest["partitions"]),
+                seconds=time.perf_counter() - start,
+                reused=True,
+            )
+
+    created_at = datetime.now(timezone.utc)
+    version = f"{created_at:%Y%m%dT%H%M%S%fZ}-{digest}"
+    temporary = root / f".{version}.tmp"
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = {**(table.schema.metadata or {}), b"snapshot_version": version.encode("utf-8")}
+    table = table.replace_schema_metadata(metadata)
+    pq.write_to_dataset(
+        table,
+        root_path=str(temporary),
+        partition_cols=[PARTITION_COLUMN],
+        basename_template="part-{i}.parquet",
+    )
+
+    partitions = df[PARTITION_COLUMN].value_counts(dropna=False)
+    manifest = {
+        "version": version,
+        "created_at": created_at.isoformat(),
+        "content_hash": digest,
+        "data_version": data_version,
+        "rows": len(df),
+        "columns": list(df.columns),
+        "with_scores": with_scores,
+        "partition_column": PARTITION_COLUMN,
+        "partitions": {str(name): int(count) for name, count in partitions.items()},
+    }
+    _write_manifest(temporary, manifest)
+
+    os.replace(temporary, root / version)
+    _publish(root, version)
+    prune_snapshots(root, keep)
+
+    return SnapshotResult(
+        version=version,
+        path=root / version,
+        rows=len(df),
+        partitions=len(partitions),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snapshot Parquet de la table employees")
+    parser.add_argument("--database-url", default=DATABASE_URL, help="URL SQLAlchemy de la base")
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_DIR, help="Dossier des snapshots")
+    parser.add_argument("--with-scores", action="store_true", help="Ajouter les scores du modèle")
+    parser.add_argument("--model", type=Path, default=MODEL_PATH, help="Modèle joblib")
+    parser.add_argument("--keep", type=int, default=SNAPSHOT_KEEP, help="Versions conservées")
+    parser.add_argument("--force", action="store_true", help="Réécrire même si inchangé")
+    args = parser.parse_args()
+
+    print(f"🚀 Export de la table employees vers {args.output}...")
+    try:
+        result = export_snapshot(
+            create_engine(args.database_url),
+            args.output,
+            with_scores=args.with_scores,
+            model_path=args.model,
+            force=args.force,
+            keep=args.keep,
+        )
+    except Exception as e:
+        print(f"❌ Erreur lors de l'export: {e}")
+        return False
+
+    if result.reused:
+        print(f"✓ Contenu inchangé, snapshot courant conservé: {result.version}")
+        return True
+
+    print(
+        f"✓ {result.rows:,} employés, {result.partitions} départements " f"({result.seconds:.2f}s)"
+    )
+    print(f"\n✅ Snapshot publié: {result.path}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
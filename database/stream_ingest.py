@@ -0,0 +1,338 @@
+"""
+Import en flux d'un export RH au format dataset_employe.csv.
+
+- Le fichier est lu par lots de lignes (mémoire constante quelle que soit sa
+  taille), chaque lot est typé explicitement puis upserté et validé.
+- Après chaque lot, la position (octet suivant la dernière ligne importée) est
+  enregistrée dans ingest_checkpoints, dans la même transaction que les
+  données : un import interrompu reprend exactement au lot suivant. Le
+  checkpoint est supprimé une fois le fichier entièrement importé.
+- Le checkpoint porte l'empreinte du fichier (taille et SHA-256 du début) :
+  un autre fichier de même nom est importé depuis le début.
+- La progression (pourcentage, lignes/s) est affichée au fil de l'eau.
+
+Les colonnes dérivées sont calculées par utils/features.py (satisfaction
+moyenne, catégorie de distance, augmentation numérique, parent_burnout) ;
+sous_paye_niveau_dept dépend de toute la population : il est maintenu lot par
+lot par les statistiques de revenu incrémentales (database/dept_stats.py).
+
+Hypothèse de format : une ligne CSV par employé (pas de retour à la ligne dans
+un champ entre guillemets), comme les exports SIRH actuels.
+
+Usage :
+    python database/stream_ingest.py [--csv FICHIER] [--chunk-size 50000] [--restart]
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple
+
+import pandas as pd
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, delete, insert, inspect, select
+
+from database.bulk import BULK_BATCH_SIZE, bulk_upsert
+from database.compact import register_category_values
+from database.config import DATABASE_URL
+from database.data_version import bump_data_version
+from database.dept_stats import STATS_TABLES, apply_pay_changes, pay_rows
+from database.models import (
+    Employee,
+    EmployeeRowHash,
+    IngestCheckpoint,
+    create_missing_indexes,
+)
+from database.sync import record_row_hashes
+from utils.features import derive_features
+
+BASE_DIR = Path(__file__).parent.parent
+CSV_FILE = BASE_DIR / "data" / "dataset_employe.csv"
+
+# Lignes par lot validé
+CHUNK_SIZE = 50_000
+
+# Octets du début du fichier inclus dans son empreinte
+FINGERPRINT_BYTES = 1024 * 1024
+
+# Types explicites des colonnes de l'export (pas d'inférence lot par lot)
+RAW_DTYPES = {
+    "id_employee": "int64",
+    "age": "Int16",
+    "genre": "string",
+    "revenu_mensuel": "Int32",
+    "statut_marital": "string",
+    "departement": "string",
+    "poste": "string",
+    "nombre_experiences_precedentes": "Int16",
+    "nombre_heures_travailless": "Int16",
+    "annee_experience_totale": "Int16",
+    "annees_dans_l_entreprise": "Int16",
+    "annees_dans_le_poste_actuel": "Int16",
+    "satisfaction_employee_environnement": "Int8",
+    "note_evaluation_precedente": "Int8",
+    "niveau_hierarchique_poste": "Int8",
+    "satisfaction_employee_nature_travail": "Int8",
+    "satisfaction_employee_equipe": "Int8",
+    "satisfaction_employee_equilibre_pro_perso": "Int8",
+    "note_evaluation_actuelle": "Int8",
+    "heure_supplementaires": "string",
+    "augementation_salaire_precedente": "string",
+    "a_quitte_l_entreprise": "string",
+    "nombre_participation_pee": "Int16",
+    "nb_formations_suivies": "Int16",
+    "nombre_employee_sous_responsabilite": "Int16",
+    "distance_domicile_travail": "Int16",
+    "niveau_education": "Int8",
+    "domaine_etude": "string",
+    "ayant_enfants": "string",
+    "frequence_deplacement": "string",
+    "annees_depuis_la_derniere_promotion": "Int16",
+    "annes_sous_responsable_actuel": "Int16",
+}
+
+
+@dataclass
+class IngestProgress:
+    """Avancement d'un import en flux."""
+
+    rows: int  # Lignes importées au total (y compris avant une reprise)
+    new_rows: int  # Lignes importées par cette exécution
+    byte_offset: int
+    total_bytes: int
+    seconds: float
+
+    @property
+    def percent(self) -> float:
+        return 100.0 * self.byte_offset / self.total_bytes if self.total_bytes else 100.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.new_rows / self.seconds if self.seconds else 0.0
+
+
+def iter_chunks(
+    path: Path, start_offset: int = 0, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[pd.DataFrame, int]]:
+    """
+    Lit un CSV par lots de lignes à partir d'une position en octets.
+
+    Args:
+        path: Fichier CSV (avec ligne d'en-tête)
+        start_offset: Position de reprise (0 = début du fichier)
+        chunk_size: Nombre de lignes par lot
+
+    Yields:
+        (lot typé, position en octets après la dernière ligne du lot)
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        names = next(csv.reader([header.decode("utf-8-sig").strip()]))
+        dtypes = {name: RAW_DTYPES[name] for name in names if name in RAW_DTYPES}
+        if start_offset > f.tell():
+            f.seek(start_offset)
+
+        while True:
+            lines = []
+            for _ in range(chunk_size):
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip():
+                    lines.append(line)
+            if not lines:
+                return
+
+            chunk = pd.read_csv(io.BytesIO(b"".join(lines)), names=names, header=None, dtype=dtypes)
+            yield chunk, f.tell()
+
+
+def file_fingerprint(path: Path) -> str:
+    """
+    Empreinte d'un fichier à importer : taille et SHA-256 de son début.
+
+    Suffit à distinguer deux exports de même nom sans relire tout le fichier.
+
+    Args:
+        path: Fichier CSV
+
+    Returns:
+        Chaîne "taille:sha256"
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read(FINGERPRINT_BYTES)).hexdigest()
+    return f"{path.stat().st_size}:{digest}"
+
+
+def _upgrade_checkpoint_table(engine):
+    """Supprime une table de checkpoints antérieure à l'empreinte (recréée ensuite)."""
+    table = IngestCheckpoint.__table__
+    inspector = inspect(engine)
+    if inspector.has_table(table.name):
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        if "fingerprint" not in columns:
+            table.drop(engine)
+
+
+def _load_checkpoint(connection, source: str, fingerprint: str) -> Tuple[int, int]:
+    table = IngestCheckpoint.__table__
+    row = connection.execute(
+        select(table.c.byte_offset, table.c.rows, table.c.fingerprint).where(
+            table.c.source == source
+        )
+    ).first()
+    # Checkpoint d'un autre fichier de même nom : on repart du début
+    if row is None or row.fingerprint != fingerprint:
+        return 0, 0
+    return row.byte_offset, row.rows
+
+
+def _save_checkpoint(connection, source: str, fingerprint: str, byte_offset: int, rows: int):
+    table = IngestCheckpoint.__table__
+    connection.execute(delete(table).where(table.c.source == source))
+    connection.execute(
+        insert(table).values(
+            source=source,
+            fingerprint=fingerprint,
+            byte_offset=byte_offset,
+            rows=rows,
+            updated_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        )
+    )
+
+
+def print_progress(progress: IngestProgress):
+    """Affiche l'avancement sur une seule ligne de terminal."""
+    print(
+        f"\r   {progress.percent:5.1f}% | {progress.rows:,} lignes | "
+        f"{progress.rows_per_second:,.0f} lignes/s",
+        end="",
+        flush=True,
+    )
+
+
+def stream_ingest(
+    engine,
+    csv_file: Path = CSV_FILE,
+    chunk_size: int = CHUNK_SIZE,
+    restart: bool = False,
+    on_progress: Optional[Callable[[IngestProgress], None]] = print_progress,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> IngestProgress:
+    """
+    Importe un export en flux, un commit par lot, avec reprise sur checkpoint.
+
+    Les lignes sont upsertées par ID : rejouer un lot déjà importé est sans effet.
+
+    Args:
+        engine: Moteur SQLAlchemy
+        csv_file: Fichier au format dataset_employe.csv
+        chunk_size: Nombre de lignes par lot validé
+        restart: Ignore le checkpoint et repart du début du fichier
+        on_progress: Rappel appelé après chaque lot (None pour désactiver)
+        batch_size: Nombre de lignes par executemany
+
+    Returns:
+        IngestProgress final
+    """
+    csv_file = Path(csv_file)
+    source = csv_file.name
+    total_bytes = csv_file.stat().st_size
+    fingerprint = file_fingerprint(csv_file)
+
+    _upgrade_checkpoint_table(engine)
+    for table in (
+        Employee.__table__,
+        EmployeeRowHash.__table__,
+        IngestCheckpoint.__table__,
+        *STATS_TABLES,
+    ):
+        table.create(engine, checkfirst=True)
+
+    with engine.begin() as conn:
+        # Base créée avant l'ajout d'index au modèle
+        create_missing_indexes(conn)
+        offset, rows_before = (0, 0) if restart else _load_checkpoint(conn, source, fingerprint)
+
+    start = time.perf_counter()
+    rows = 0
+    progress = IngestProgress(rows_before, 0, offset, total_bytes, 0.0)
+
+    for chunk, chunk_end in iter_chunks(csv_file, offset, chunk_size):
+        # Référence vide : sous_paye_niveau_dept est calculé sur la table, après écriture
+        chunk = derive_features(chunk, medians={})
+        with engine.begin() as conn:
+            register_category_values(conn, chunk)
+            # Lignes déjà présentes (reprise, réimport) : leur ancien revenu sort des statistiques
+            before = pay_rows(conn, chunk["id"].tolist())
+            bulk_upsert(conn, Employee.__table__, chunk, batch_size=batch_size)
+            # Empreintes des lignes : database/sync.py ne les réécrira pas
+            record_row_hashes(conn, chunk, batch_size=batch_size)
+            apply_pay_changes(conn, before, chunk)
+            bump_data_version(conn)
+            _save_checkpoint(conn, source, fingerprint, chunk_end, rows_before + rows + len(chunk))
+        rows += len(chunk)
+
+        progress = IngestProgress(
+            rows_before + rows, rows, chunk_end, total_bytes, time.perf_counter() - start
+        )
+        if on_progress:
+            on_progress(progress)
+
+    # Import complet : la prochaine exécution repartira du début du fichier
+    with engine.begin() as conn:
+        conn.execute(
+            delete(IngestCheckpoint.__table__).where(IngestCheckpoint.__table__.c.source == source)
+        )
+
+    progress.seconds = time.perf_counter() - start
+    return progress
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import en flux d'un export RH")
+    parser.add_argument("--csv", type=Path, default=CSV_FILE, help="Fichier CSV source")
+    parser.add_argument("--database-url", default=DATABASE_URL, help="URL SQLAlchemy de la base")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Lignes par lot")
+    parser.add_argument("--restart", action="store_true", help="Ignorer le checkpoint")
+    args = parser.parse_args()
+
+    if not args.csv.exists():
+        print(f"❌ Erreur: Fichier CSV introuvable: {args.csv}")
+        return False
+
+    print(f"🚀 Import en flux de {args.csv} (lots de {args.chunk_size:,} lignes)...")
+    try:
+        progress = stream_ingest(
+            create_engine(args.database_url),
+            args.csv,
+            chunk_size=args.chunk_size,
+            restart=args.restart,
+        )
+    except KeyboardInterrupt:
+        print("\n⚠️ Import interrompu : relancer la commande pour reprendre au dernier lot validé")
+        return False
+    except Exception as e:
+        print(f"\n❌ Erreur lors de l'import: {e}")
+        print("   Relancer la commande pour reprendre au dernier lot validé")
+        return False
+
+    print(
+        f"\n✅ Import terminé : {progress.rows:,} employés au total, {progress.new_rows:,} "
+        f"importés en {progress.seconds:.2f}s ({progress.rows_per_second:,.0f} lignes/s)"
+    )
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,276 @@
+"""
+Synchronisation incrémentale du CSV employés vers la base (sans drop/reload).
+
+- Si l'empreinte SHA-256 du fichier source est identique à celle de la
+  dernière synchronisation, rien n'est fait.
+- Sinon, une empreinte de contenu est calculée pour chaque ligne (vectorisé,
+  pandas.util.hash_pandas_object) et comparée à celles de employee_row_hashes :
+  seules les lignes nouvelles ou modifiées sont upsertées.
+- Les employés absents du fichier peuvent être supprimés (--delete-missing).
+
+La table employees n'est jamais recréée : index et données dérivées sont
+conservés, et en mode WAL les lecteurs ne sont pas bloqués. Les statistiques
+de revenu par département (database/dept_stats.py) et sous_paye_niveau_dept
+sont mis à jour à partir des seules lignes écrites ou supprimées.
+
+Usage :
+    python database/sync.py [--csv FICHIER] [--delete-missing] [--force]
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, delete, insert, select
+
+from database.bulk import BULK_BATCH_SIZE, bulk_upsert, iter_batches, prepare_frame
+from database.compact import register_category_values
+from database.config import DATABASE_URL
+from database.data_version import bump_data_version
+from database.dept_stats import STATS_TABLES, apply_pay_changes, pay_rows
+from database.models import Employee, EmployeeRowHash, SyncState
+from utils.features import derive_features
+
+BASE_DIR = Path(__file__).parent.parent
+CSV_FILE = BASE_DIR / "data" / "export-api" / "test_employees.csv"
+
+TABLES = [Employee.__table__, EmployeeRowHash.__table__, SyncState.__table__, *STATS_TABLES]
+
+
+@dataclass
+class SyncResult:
+    """Bilan d'une synchronisation."""
+
+    skipped: bool = False
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    seconds: float = 0.0
+
+
+def file_hash(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Empreinte SHA-256 d'un fichier, lu par blocs."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def row_hashes(frame: pd.DataFrame) -> pd.Series:
+    """
+    Empreinte 64 bits du contenu de chaque ligne.
+
+    Args:
+        frame: Lignes déjà converties par prepare_frame
+
+    Returns:
+        Série int64 (signée, pour tenir dans un BIGINT) indexée comme `frame`
+    """
+    hashes = pd.util.hash_pandas_object(frame, index=False).to_numpy().view("int64")
+    return pd.Series(hashes, index=frame.index)
+
+
+def record_row_hashes(connection, df: pd.DataFrame, batch_size: int = BULK_BATCH_SIZE) -> int:
+    """
+    Enregistre l'empreinte de lignes écrites dans employees hors synchronisation.
+
+    Appelé par la migration complète et l'import en flux, dans la transaction
+    de leur écriture : la synchronisation suivante ne réécrit que les lignes
+    réellement modifiées depuis.
+
+    Args:
+        connection: Connexion SQLAlchemy (dans la transaction de l'appelant)
+        df: Lignes telles qu'écrites dans employees, avec la colonne id
+        batch_size: Nombre de lignes par executemany
+
+    Returns:
+        Nombre d'empreintes enregistrées
+    """
+    frame = prepare_frame(df, Employee.__table__)
+    hashes = pd.DataFrame({"id": frame["id"], "row_hash": row_hashes(frame)})
+    bulk_upsert(connection, EmployeeRowHash.__table__, hashes, batch_size=batch_size)
+    return len(hashes)
+
+
+def sync_dataframe(
+    connection,
+    df: pd.DataFrame,
+    delete_missing: bool = False,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> SyncResult:
+    """
+    Applique un DataFrame complet à la table employees de façon incrémentale.
+
+    Args:
+        connection: Connexion SQLAlchemy (dans la transaction de l'appelant)
+        df: Contenu source complet, avec la colonne id
+        delete_missing: Supprime les employés absents de `df`
+        batch_size: Nombre de lignes par executemany
+
+    Returns:
+        SyncResult (compteurs par type de changement)
+    """
+    start = time.perf_counter()
+    table = Employee.__table__
+    hash_table = EmployeeRowHash.__table__
+
+    frame = prepare_frame(df, table)
+    frame["row_hash"] = row_hashes(frame)
+
+    known = dict(connection.execute(select(hash_table.c.id, hash_table.c.row_hash)).all())
+    # Int64 nullable : un float64 perdrait la précision des empreintes 64 bits
+    previous = pd.Series(known, dtype="Int64").reindex(frame["id"].tolist())
+    is_new = previous.isna().to_numpy()
+    is_changed = is_new | (
+        previous.to_numpy(dtype="int64", na_value=0) != frame["row_hash"].to_numpy()
+    )
+    changed = frame[is_changed]
+
+    missing = []
+    if delete_missing:
+        present = set(frame["id"])
+        existing = connection.execute(select(table.c.id)).scalars().all()
+        missing = [key for key in existing if key not in present]
+
+    # État avant écriture des lignes remplacées ou supprimées (statistiques de revenu).
+    # Tous les IDs modifiés sont lus : après une migration, la table des empreintes
+    # est vide alors que les employés existent déjà (pay_rows ne renvoie que ceux-là)
+    before = pay_rows(connection, changed["id"].tolist() + missing)
+    inserted = len(changed) - int(before["id"].isin(changed["id"]).sum())
+
+    result = SyncResult(
+        inserted=inserted,
+        updated=len(changed) - inserted,
+        unchanged=len(frame) - len(changed),
+    )
+
+    if len(changed):
+        register_category_values(connection, changed)
+        bulk_upsert(connection, table, changed.drop(columns="row_hash"), batch_size=batch_size)
+        bulk_upsert(connection, hash_table, changed[["id", "row_hash"]], batch_size=batch_size)
+
+    for batch in iter_batches(missing, batch_size):
+        connection.execute(delete(table).where(table.c.id.in_(batch)))
+        connection.execute(delete(hash_table).where(hash_table.c.id.in_(batch)))
+    result.deleted = len(missing)
+
+    if len(changed) or missing:
+        apply_pay_changes(connection, before, changed)
+        bump_data_version(connection)
+
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def sync_csv(
+    engine,
+    csv_file: Path = CSV_FILE,
+    delete_missing: bool = False,
+    force: bool = False,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> SyncResult:
+    """
+    Synchronise un export CSV avec la base, en une seule transaction.
+
+    Args:
+        engine: Moteur SQLAlchemy
+        csv_file: Fichier source
+        delete_missing: Supprime les employés absents du fichier
+        force: Ignore l'empreinte du fichier et compare toutes les lignes
+        batch_size: Nombre de lignes par executemany
+
+    Returns:
+        SyncResult (skipped=True si le fichier n'a pas changé)
+    """
+    source = str(Path(csv_file).name)
+    digest = file_hash(csv_file)
+    state_table = SyncState.__table__
+
+    with engine.begin() as conn:
+        for table in TABLES:
+            table.create(conn, checkfirst=True)
+
+        state = conn.execute(
+            select(state_table.c.file_hash).where(state_table.c.source == source)
+        ).scalar()
+        if state == digest and not force:
+            return SyncResult(skipped=True)
+
+        # Export brut ou préparé : colonnes dérivées calculées ligne à ligne ;
+        # sous_paye_niveau_dept est maintenu par database/dept_stats.py
+        df = derive_features(pd.read_csv(csv_file), medians={})
+        # Même convention d'ID que migrate_to_sqlite : numéro de ligne
+        if "id" not in df.columns:
+            df.insert(0, "id", range(1, len(df) + 1))
+
+        result = sync_dataframe(conn, df, delete_missing=delete_missing, batch_size=batch_size)
+
+        conn.execute(delete(state_table).where(state_table.c.source == source))
+        conn.execute(
+            insert(state_table).values(
+                source=source,
+                file_hash=digest,
+                synced_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                rows=len(df),
+            )
+        )
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synchronisation incrémentale CSV -> base")
+    parser.add_argument("--csv", type=Path, default=CSV_FILE, help="Fichier CSV source")
+    parser.add_argument("--database-url", default=DATABASE_URL, help="URL SQLAlchemy de la base")
+    parser.add_argument(
+        "--delete-missing", action="store_true", help="Supprimer les employés absents du fichier"
+    )
+    parser.add_argument("--force", action="store_true", help="Ignorer l'empreinte du fichier")
+    parser.add_argument(
+        "--batch-size", type=int, default=BULK_BATCH_SIZE, help="Lignes par executemany"
+    )
+    args = parser.parse_args()
+
+    if not args.csv.exists():
+        print(f"❌ Erreur: Fichier CSV introuvable: {args.csv}")
+        return False
+
+    print(f"🚀 Synchronisation de {args.csv}...")
+    try:
+        result = sync_csv(
+            create_engine(args.database_url),
+            args.csv,
+            delete_missing=args.delete_missing,
+            force=args.force,
+            batch_size=args.batch_size,
+        )
+    except Exception as e:
+        print(f"❌ Erreur lors de la synchronisation: {e}")
+        return False
+
+    if result.skipped:
+        print("✓ Fichier inchangé depuis la dernière synchronisation, rien à faire")
+        return True
+
+    print(
+        f"✓ {result.inserted} ajoutés, {result.updated} modifiés, "
+        f"{result.deleted} supprimés, {result.unchanged} inchangés ({result.seconds:.2f}s)"
+    )
+    print("\n✅ Synchronisation terminée")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -1,21 +1,56 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, select, func
 import pandas as pd
 import joblib
 import sklearn
 import os
+from typing import List, Optional
 
 from database.config import get_db
+from database.dept_stats import load_pay_medians
 from database.models import Employee
 from api.schemas import (
+    BatchPredictionRequest,
+    BatchPredictionResponse,
     EmployeeResponse,
     EmployeeListResponse,
+    EmployeeSelectionRequest,
+    EmployeeSelectionResponse,
+    EmployeeStatsResponse,
     HealthResponse,
     PredictionRequest,
     PredictionResponse,
+    SelectionPredictionResponse,
 )
+from api.conditional import DataVersionCache, is_not_modified, validator_headers
+from api.pagination import (
+    TotalCache,
+    decode_cursor,
+    encode_cursor,
+    filter_conditions,
+    order_by,
+    parse_list,
+    parse_sort,
+    resume_conditions,
+    sort_expression,
+)
+from api.serialization import (
+    ARROW_STREAM_MEDIA_TYPE,
+    EMPLOYEE_LIST_ENCODERS,
+    EMPLOYEE_SELECTION_ENCODERS,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    dump_employee,
+    dump_frame_arrow,
+    dump_msgpack,
+    negotiate,
+    parse_fields,
+)
+from utils.chart_data import SUMMARY_COLUMNS, population_summary
+from utils.features import pay_medians
+from utils.scoring import risk_levels, score_frame
 
 app = FastAPI(
     title="ML Attrition API",
@@ -28,6 +63,24 @@ app = FastAPI(
 # Charger le modèle de machine learning
 MODEL_PATH = os.path.join(os.path.dirname(__file__), "data", "export-api", "attrition_model.joblib")
 
+# Taille maximale d'un lot pour /predict/batch
+MAX_BATCH_SIZE = 5000
+
+# Nombre maximal d'IDs d'une sélection (/employees?ids=, /employees/batch)
+MAX_SELECTION_SIZE = 1000
+
+# Nombre maximal d'employés scorés par /predict/employees
+MAX_SCORED_SELECTION = 50000
+
+# Réponses dont le format dépend de l'en-tête Accept (caches HTTP)
+VARY_ACCEPT = {"Vary": "Accept"}
+
+# Version des données (ETag / Last-Modified), gardée en mémoire DATA_VERSION_TTL secondes
+data_version = DataVersionCache()
+
+# Totaux de /employees par filtre, comptés une fois par version des données
+employee_totals = TotalCache()
+
 # Version attendue du modèle
 EXPECTED_SKLEARN_VERSION = "1.7.1"
 
@@ -124,9 +177,15 @@ async def root():
         "endpoints": {
             "documentation": "/docs",
             "health": "/health",
+            "data_version": "/data-version",
             "employees": "/employees",
             "employee_by_id": "/employees/{id}",
+            "employees_batch": "/employees/batch",
+            "employees_stats": "/employees/stats",
             "predict_attrition": "/predict",
+            "predict_employee": "/employees/{id}/prediction",
+            "predict_batch": "/predict/batch",
+            "predict_employees": "/predict/employees",
         },
     }
 
@@ -173,39 +232,298 @@ async def health_check(db: Session = Depends(get_db)):
     return {"status": "healthy", "database": db_status}
 
 
+@app.get("/data-version")
+async def get_data_version(db: Session = Depends(get_db)):
+    """
+    Version courante des données (incrémentée à chaque écriture sur employees).
+
+    Sert de clé d'invalidation aux caches des clients ; `version` vaut null
+    si la base n'a encore enregistré aucune écriture versionnée.
+    """
+    info = data_version.get(db)
+    if info is None:
+        return {"version": None, "updated_at": None}
+    return {"version": info.version, "updated_at": info.updated_at.isoformat()}
+
+
+def conditional_response(request: Request, db: Session, media_type: str):
+    """
+    Validateurs HTTP de la représentation demandée, et 304 si le client est à jour.
+
+    Ne touche pas la base tant que la version des données est en cache
+    (voir api/conditional.py).
+
+    Returns:
+        Tuple (en-têtes de la réponse, Response 304 ou None)
+    """
+    info = data_version.get(db)
+    if info is None:
+        return dict(VARY_ACCEPT), None
+
+    headers = {**validator_headers(info, media_type), **VARY_ACCEPT}
+    if is_not_modified(
+        headers,
+        request.headers.get("if-none-match"),
+        request.headers.get("if-modified-since"),
+    ):
+        return headers, Response(status_code=304, headers=headers)
+    return headers, None
+
+
+def employee_columns(fields: Optional[str]) -> tuple:
+    """
+    Résout le paramètre `fields` en colonnes de la table employees.
+
+    Returns:
+        Tuple (noms des champs, colonnes SQLAlchemy correspondantes)
+    """
+    try:
+        names = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return names, [Employee.__table__.c[name] for name in names]
+
+
+def parse_ids(ids: str) -> List[int]:
+    """
+    Interprète le paramètre `ids` (identifiants séparés par des virgules).
+
+    Raises:
+        HTTPException: 400 si un identifiant n'est pas un entier
+    """
+    try:
+        return [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Identifiants invalides : {ids}")
+
+
+def select_employees(db: Session, ids: List[int], names: tuple, columns: list) -> tuple:
+    """
+    Charge une sélection d'employés en une seule requête `IN`.
+
+    Args:
+        db: Session SQLAlchemy
+        ids: IDs demandés (les doublons ne sont renvoyés qu'une fois)
+        names: Champs sélectionnés (contient toujours `id`)
+        columns: Colonnes SQLAlchemy correspondantes
+
+    Returns:
+        Tuple (lignes dans l'ordre des IDs demandés, IDs introuvables)
+
+    Raises:
+        HTTPException: 400 au-delà de MAX_SELECTION_SIZE identifiants
+    """
+    requested = list(dict.fromkeys(ids))
+    if len(requested) > MAX_SELECTION_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Trop d'identifiants ({len(requested)} > {MAX_SELECTION_SIZE})",
+        )
+
+    found = {}
+    if requested:
+        position = names.index("id")
+        for row in db.execute(select(*columns).where(Employee.id.in_(requested))):
+            found[row[position]] = row
+
+    rows = [found[employee_id] for employee_id in requested if employee_id in found]
+    missing = [employee_id for employee_id in requested if employee_id not in found]
+    return rows, missing
+
+
 @app.get("/employees", response_model=EmployeeListResponse)
-async def get_employees(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_employees(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    ids: Optional[str] = None,
+    sort: Optional[str] = None,
+    cursor: Optional[str] = None,
+    departement: Optional[str] = None,
+    poste: Optional[str] = None,
+    age_min: Optional[int] = None,
+    age_max: Optional[int] = None,
+    search: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
     """
     Récupérer la liste de tous les employés avec pagination.
 
     - **skip**: Nombre d'employés à ignorer (pour la pagination)
     - **limit**: Nombre maximum d'employés à retourner (max 100)
+    - **fields**: Colonnes à renvoyer, séparées par des virgules (toutes par défaut, `id` toujours inclus)
+    - **ids**: Sélection par IDs séparés par des virgules (max 1000, `skip`/`limit` ignorés) ;
+      la réponse suit l'ordre demandé et liste les IDs introuvables dans `missing`
+    - **sort**: Colonne de tri, préfixée par `-` pour l'ordre décroissant (`id` par défaut)
+    - **cursor**: Reprise après la page précédente (`next_cursor` de sa réponse, même tri
+      et mêmes filtres) ; remplace `skip` : la reprise parcourt l'index de la clé de tri
+      (ID et clés de tri de l'Explorer) au lieu des lignes déjà servies
+    - **departement**: Départements retenus, séparés par des virgules
+    - **poste**: Postes retenus, séparés par des virgules
+    - **age_min** / **age_max**: Plage d'âge (bornes incluses)
+    - **search**: Texte cherché (sans casse) dans le poste, le département, le domaine
+      d'étude ou le statut marital
+
+    `total` compte les employés correspondant aux filtres (compté une fois par filtre
+    et par version des données) ; `next_cursor` vaut null sur la dernière page.
+
+    Formats de réponse (en-tête Accept) : JSON, `application/vnd.apache.arrow.stream`
+    (une colonne par champ, total dans les métadonnées), `application/msgpack`.
+
+    Réponse conditionnelle : ETag / Last-Modified suivent la version des données,
+    If-None-Match / If-Modified-Since à jour donnent un 304.
+    """
+    limit = min(max(limit, 0), 100)
+
+    names, columns = employee_columns(fields)
+    media_type = negotiate(accept)
+    headers, not_modified = conditional_response(request, db, media_type)
+    if not_modified:
+        return not_modified
+
+    if ids is not None:
+        rows, missing = select_employees(db, parse_ids(ids), names, columns)
+        content = EMPLOYEE_SELECTION_ENCODERS[media_type](rows, missing, names)
+        return Response(content=content, media_type=media_type, headers=headers)
+
+    table = Employee.__table__
+    try:
+        sort_name, descending = parse_sort(sort)
+        sort = f"-{sort_name}" if descending else sort_name
+        position = decode_cursor(cursor, sort) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    sort_column, id_column = sort_expression(table.c[sort_name]), table.c.id
+    departements, postes = parse_list(departement), parse_list(poste)
+    conditions = filter_conditions(table, departements, age_min, age_max, postes, search)
+
+    # Compter le total d'employés (filtres compris), une fois par version des données
+    info = data_version.get(db)
+    total = employee_totals.get(
+        info.version if info else None,
+        (tuple(departements), age_min, age_max, tuple(postes), search),
+        lambda: db.execute(select(func.count()).select_from(table).where(*conditions)).scalar(),
+    )
+
+    # Select Core : tuples bruts, sans objet Employee ni EmployeeResponse par ligne.
+    # La colonne triée est ajoutée en fin de ligne pour construire le curseur.
+    query = select(*columns, sort_column).where(*conditions)
+    if position is not None:
+        # Une requête par plage d'index, tant que la page n'est pas remplie
+        queries = [
+            query.where(condition)
+            for condition in resume_conditions(sort_column, id_column, descending, *position)
+        ]
+    else:
+        queries = [query.offset(skip)]
+    # Une ligne de plus que la page : indique s'il reste une page suivante
+    ordering = order_by(sort_column, id_column, descending)
+    rows = []
+    for page_query in queries:
+        rows += db.execute(page_query.order_by(*ordering).limit(limit + 1 - len(rows))).all()
+        if len(rows) > limit:
+            break
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        # limit=0 : page vide, aucune position à reprendre
+        if rows:
+            last = rows[-1]
+            next_cursor = encode_cursor(sort, last[-1], last[names.index("id")])
+    rows = [row[:-1] for row in rows]
+
+    content = EMPLOYEE_LIST_ENCODERS[media_type](total, rows, names, next_cursor)
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+@app.post("/employees/batch", response_model=EmployeeSelectionResponse)
+async def get_employees_batch(
+    request: EmployeeSelectionRequest,
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Récupérer plusieurs employés par IDs (variante POST de `/employees?ids=`).
+
+    - **ids**: Identifiants (max 1000) ; la réponse suit cet ordre
+    - **fields**: Colonnes à renvoyer (toutes par défaut, `id` toujours inclus)
+
+    Les IDs sans employé sont listés dans `missing`.
     """
-    if limit > 100:
-        limit = 100
+    names, columns = employee_columns(",".join(request.fields or []))
+    rows, missing = select_employees(db, request.ids, names, columns)
+
+    media_type = negotiate(accept)
+    content = EMPLOYEE_SELECTION_ENCODERS[media_type](rows, missing, names)
+    return Response(content=content, media_type=media_type, headers=VARY_ACCEPT)
+
+
+@app.get("/employees/stats", response_model=EmployeeStatsResponse)
+async def get_employee_stats(
+    request: Request,
+    departement: Optional[str] = None,
+    poste: Optional[str] = None,
+    age_min: Optional[int] = None,
+    age_max: Optional[int] = None,
+    search: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Agrégats des employés pour la page Statistiques, calculés côté API.
+
+    Seules les colonnes utiles sont lues en base ; la réponse a une taille
+    bornée quelle que soit la population : effectifs et moyennes par
+    département, genres, histogramme des âges, quartiles des revenus, grille
+    de densité et échantillon stratifié du nuage revenu / expérience.
 
-    # Compter le total d'employés
-    total = db.query(Employee).count()
+    - **departement** / **poste** / **age_min** / **age_max** / **search**: Filtres
+      comme pour /employees
+
+    Réponse conditionnelle (ETag / Last-Modified) comme pour /employees.
+    """
+    headers, not_modified = conditional_response(request, db, JSON_MEDIA_TYPE)
+    if not_modified:
+        return not_modified
 
-    # Récupérer les employés avec pagination
-    employees = db.query(Employee).offset(skip).limit(limit).all()
+    table = Employee.__table__
+    conditions = filter_conditions(
+        table, parse_list(departement), age_min, age_max, parse_list(poste), search
+    )
+    rows = db.execute(select(*[table.c[name] for name in SUMMARY_COLUMNS]).where(*conditions))
+    summary = population_summary(pd.DataFrame(rows.all(), columns=list(SUMMARY_COLUMNS)))
 
-    return {"total": total, "employees": employees}
+    content = EmployeeStatsResponse(**summary).model_dump_json()
+    return Response(content=content, media_type=JSON_MEDIA_TYPE, headers=headers)
 
 
 @app.get("/employees/{employee_id}", response_model=EmployeeResponse)
-async def get_employee(employee_id: int, db: Session = Depends(get_db)):
+async def get_employee(
+    request: Request,
+    employee_id: int,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
     """
     Récupérer un employé spécifique par son ID.
 
     - **employee_id**: L'identifiant unique de l'employé
+    - **fields**: Colonnes à renvoyer, séparées par des virgules (toutes par défaut, `id` toujours inclus)
+
+    Réponse conditionnelle (ETag / Last-Modified) comme pour /employees.
     """
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    names, columns = employee_columns(fields)
+    headers, not_modified = conditional_response(request, db, JSON_MEDIA_TYPE)
+    if not_modified:
+        return not_modified
+    row = db.execute(select(*columns).where(Employee.id == employee_id)).first()
 
-    if employee is None:
+    if row is None:
         raise HTTPException(status_code=404, detail=f"Employé avec l'ID {employee_id} non trouvé")
 
-    return employee
+    return Response(content=dump_employee(row, names), media_type=JSON_MEDIA_TYPE, headers=headers)
 
 
 def get_risk_level(probability: float) -> str:
@@ -215,23 +533,15 @@ def get_risk_level(probability: float) -> str:
     if probability < 0 or probability > 1:
         raise ValueError("La probabilité doit être entre 0 et 1")
 
-    if probability < 0.3:
-        return "Faible"
-    elif probability < 0.6:
-        return "Moyen"
-    elif probability < 0.8:
-        return "Élevé"
-    else:
-        return "Très élevé"
+    return risk_levels([probability])[0]
 
 
-@app.post("/predict", response_model=PredictionResponse)
-async def predict_attrition(request: PredictionRequest):
+def require_model():
     """
-    Prédire le risque d'attrition pour un employé.
+    Retourne le modèle chargé, en retentant un chargement si nécessaire.
 
-    Cette endpoint utilise un modèle de machine learning pour prédire
-    la probabilité qu'un employé quitte l'entreprise.
+    Raises:
+        HTTPException: 503 si le modèle reste indisponible
     """
     global model, model_error
 
@@ -259,110 +569,225 @@ async def predict_attrition(request: PredictionRequest):
                 },
             )
 
+    return model
+
+
+# Médianes de revenu par (département, niveau) de la population en base
+# Repli pour une base sans statistiques de revenu (calculé une fois par processus)
+_pay_medians = None
+
+
+def reference_pay_medians(db: Session):
+    """
+    Médianes de référence pour calculer sous_paye_niveau_dept d'un enregistrement.
+
+    Lues dans pay_group_stats, tenues à jour à chaque écriture (voir
+    database/dept_stats.py). Une base sans ces statistiques retombe sur un
+    calcul depuis employees, une fois par processus. None si la base est
+    indisponible (la colonne garde alors sa valeur par défaut).
+    """
+    global _pay_medians
+
     try:
-        # Convertir les données de la requête en DataFrame pandas
-        data_dict = request.model_dump(exclude_none=True)
-
-        # Créer un DataFrame avec une seule ligne
-        df = pd.DataFrame([data_dict])
-
-        # S'assurer que toutes les colonnes requises par le modèle sont présentes
-        required_columns = [
-            "genre",
-            "statut_marital",
-            "heure_supplementaires",
-            "ayant_enfants",
-            "poste",
-            "domaine_etude",
-            "distance_categorie",
-            "frequence_deplacement",
-            "departement",
-            "age",
-            "revenu_mensuel",
-            "nombre_experiences_precedentes",
-            "nombre_heures_travailless",
-            "annee_experience_totale",
-            "annees_dans_l_entreprise",
-            "annees_dans_le_poste_actuel",
-            "satisfaction_employee_environnement",
-            "note_evaluation_precedente",
-            "niveau_hierarchique_poste",
-            "satisfaction_employee_nature_travail",
-            "satisfaction_employee_equipe",
-            "satisfaction_employee_equilibre_pro_perso",
-            "note_evaluation_actuelle",
-            "nombre_participation_pee",
-            "nb_formations_suivies",
-            "nombre_employee_sous_responsabilite",
-            "distance_domicile_travail",
-            "niveau_education",
-            "annees_depuis_la_derniere_promotion",
-            "annes_sous_responsable_actuel",
-            "satisfaction_moyenne",
-            "parent_burnout",
-            "sous_paye_niveau_dept",
-            "augementation_salaire_precedente",
-        ]
+        medians = load_pay_medians(db.connection())
+        if len(medians):
+            return medians
+    except Exception:
+        # Table absente (base antérieure aux statistiques) : annuler la requête en échec
+        db.rollback()
+
+    if _pay_medians is None:
+        try:
+            columns = [
+                Employee.departement,
+                Employee.niveau_hierarchique_poste,
+                Employee.revenu_mensuel,
+            ]
+            rows = db.execute(select(*columns)).all()
+            _pay_medians = pay_medians(pd.DataFrame(rows, columns=[c.key for c in columns]))
+        except Exception as e:
+            print(f"⚠️ Médianes de référence indisponibles: {e}")
+            return None
+    return _pay_medians
+
+
+@app.post("/predict", response_model=PredictionResponse)
+async def predict_attrition(request: PredictionRequest, db: Session = Depends(get_db)):
+    """
+    Prédire le risque d'attrition pour un employé.
+
+    Cette endpoint utilise un modèle de machine learning pour prédire
+    la probabilité qu'un employé quitte l'entreprise. Les colonnes dérivées
+    absentes (satisfaction moyenne, catégorie de distance, sous-paye...) sont
+    calculées à partir des colonnes brutes.
+    """
+    return score_one(request, db)
 
-        # Ajouter les colonnes manquantes avec des valeurs par défaut
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = (
-                    0
-                    if col
-                    in [
-                        "age",
-                        "revenu_mensuel",
-                        "distance_domicile_travail",
-                        "niveau_education",
-                        "niveau_hierarchique_poste",
-                        "nombre_experiences_precedentes",
-                        "annee_experience_totale",
-                        "annees_dans_l_entreprise",
-                        "annees_dans_le_poste_actuel",
-                        "annees_depuis_la_derniere_promotion",
-                        "annes_sous_responsable_actuel",
-                        "nombre_employee_sous_responsabilite",
-                        "nombre_heures_travailless",
-                        "satisfaction_employee_environnement",
-                        "note_evaluation_precedente",
-                        "satisfaction_employee_nature_travail",
-                        "satisfaction_employee_equipe",
-                        "satisfaction_employee_equilibre_pro_perso",
-                        "note_evaluation_actuelle",
-                        "nombre_participation_pee",
-                        "nb_formations_suivies",
-                        "parent_burnout",
-                        "sous_paye_niveau_dept",
-                        "augementation_salaire_precedente",
-                    ]
-                    else "Inconnu"
-                )
-
-        # Réorganiser les colonnes dans le bon ordre
-        df = df[required_columns]
-
-        # Faire la prédiction
-        prediction_proba = model.predict_proba(df)[:, 1]  # Probabilité de la classe positive
-        prediction = model.predict(df)[0]  # Classe prédite (0 ou 1)
-        probability = float(prediction_proba[0])
-
-        # Calculer le risque d'attrition (probabilité en pourcentage)
-        attrition_risk = probability * 100
-
-        # Déterminer le niveau de risque
-        risk_level = get_risk_level(probability)
+
+def score_one(request: PredictionRequest, db: Session) -> PredictionResponse:
+    """
+    Score un seul enregistrement (utilisé par /predict et /employees/{id}/prediction).
+
+    Raises:
+        HTTPException: 503 sans modèle, 500 si le scoring échoue
+    """
+    current_model = require_model()
+
+    try:
+        # Convertir les données de la requête en DataFrame pandas (une seule ligne)
+        df = pd.DataFrame([request.model_dump(exclude_none=True)])
+        result = score_frame(current_model, df, reference_pay_medians(db)).iloc[0]
 
         return PredictionResponse(
-            attrition_risk=round(attrition_risk, 2),
-            attrition_probability=round(probability, 4),
-            prediction=int(prediction),
-            risk_level=risk_level,
+            attrition_risk=float(result["attrition_risk"]),
+            attrition_probability=float(result["attrition_probability"]),
+            prediction=int(result["prediction"]),
+            risk_level=result["risk_level"],
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors de la prédiction: {str(e)}")
+
+
+@app.get("/employees/{employee_id}/prediction", response_model=PredictionResponse)
+async def predict_employee(employee_id: int, db: Session = Depends(get_db)):
+    """
+    Prédire le risque d'attrition d'un employé de la base, par son ID.
+
+    Équivaut à envoyer à /predict la fiche renvoyée par /employees/{id}, sans
+    aller-retour de la fiche par le client.
+
+    - **employee_id**: L'identifiant unique de l'employé
+    """
+    names, columns = employee_columns(None)
+    row = db.execute(select(*columns).where(Employee.id == employee_id)).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Employé avec l'ID {employee_id} non trouvé")
+    return score_one(PredictionRequest.model_validate(dict(zip(names, row, strict=True))), db)
+
+
+def derive_ids(df: pd.DataFrame) -> pd.Series:
+    """Identifiants des enregistrements d'un lot (id ou id_employee), None sinon."""
+    for column in ("id", "id_employee"):
+        if column in df.columns:
+            return pd.to_numeric(df[column], errors="coerce").astype("Int64")
+    return pd.Series(pd.NA, index=df.index, dtype="Int64")
+
+
+@app.post("/predict/batch", response_model=BatchPredictionResponse)
+async def predict_batch(
+    request: BatchPredictionRequest,
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Prédire le risque d'attrition pour un lot d'employés en un seul appel au modèle.
+
+    Les enregistrements peuvent venir directement d'un export brut
+    (dataset_employe.csv). Les prédictions sont renvoyées dans l'ordre de la requête.
+
+    - **employees**: Liste d'enregistrements (max 5000)
+
+    Formats de réponse (en-tête Accept) : JSON, `application/vnd.apache.arrow.stream`
+    (une colonne par champ, total dans les métadonnées), `application/msgpack`.
+    """
+    if len(request.employees) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400, detail=f"Lot trop grand ({len(request.employees)} > {MAX_BATCH_SIZE})"
+        )
+    current_model = require_model()
+    media_type = negotiate(accept)
+
+    if not request.employees and media_type == JSON_MEDIA_TYPE:
+        return BatchPredictionResponse(total=0, predictions=[])
+
+    try:
+        df = pd.DataFrame.from_records(request.employees)
+        if len(df):
+            scores = score_frame(current_model, df, reference_pay_medians(db))
+        else:
+            scores = pd.DataFrame(columns=list(PredictionResponse.model_fields))
+        scores.insert(0, "id", derive_ids(df))
+
+        if media_type == ARROW_STREAM_MEDIA_TYPE:
+            content = dump_frame_arrow(scores, {"total": len(scores)})
+            return Response(content=content, media_type=media_type, headers=VARY_ACCEPT)
+
+        records = scores.astype(object).where(scores.notna(), None).to_dict("records")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors de la prédiction: {str(e)}")
+
+    if media_type == MSGPACK_MEDIA_TYPE:
+        content = dump_msgpack({"total": len(records), "predictions": records})
+        return Response(content=content, media_type=media_type, headers=VARY_ACCEPT)
+    return BatchPredictionResponse(total=len(records), predictions=records)
+
+
+@app.get("/predict/employees", response_model=SelectionPredictionResponse)
+async def predict_employees(
+    departement: Optional[str] = None,
+    poste: Optional[str] = None,
+    age_min: Optional[int] = None,
+    age_max: Optional[int] = None,
+    fields: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Prédire le risque d'attrition de tous les employés d'une équipe, en un seul appel.
+
+    Les employés correspondant aux filtres sont lus et scorés côté API en un
+    seul appel au modèle, sans aller-retour des fiches par le client.
+
+    - **departement**: Départements retenus, séparés par des virgules (tous par défaut)
+    - **poste**: Postes retenus, séparés par des virgules (tous par défaut)
+    - **age_min** / **age_max**: Plage d'âge (bornes incluses)
+    - **fields**: Colonnes de l'employé ajoutées à chaque prédiction (ex. `poste,departement`)
+
+    Au plus MAX_SCORED_SELECTION employés (50 000). Formats de réponse comme
+    /predict/batch (JSON, Arrow, MessagePack).
+    """
+    table = Employee.__table__
+    # Colonnes de l'employé jointes aux scores (aucune sans `fields`)
+    extra = [name for name in employee_columns(fields)[0] if name != "id"] if fields else []
+    conditions = filter_conditions(
+        table, parse_list(departement), age_min, age_max, parse_list(poste)
+    )
+
+    total = db.execute(select(func.count()).select_from(table).where(*conditions)).scalar()
+    if total > MAX_SCORED_SELECTION:
+        raise HTTPException(
+            status_code=400, detail=f"Sélection trop grande ({total} > {MAX_SCORED_SELECTION})"
         )
+    current_model = require_model()
+    media_type = negotiate(accept)
+
+    names, columns = employee_columns(None)
+    rows = db.execute(select(*columns).where(*conditions).order_by(table.c.id)).all()
+
+    try:
+        df = pd.DataFrame(rows, columns=list(names))
+        if len(df):
+            scores = score_frame(current_model, df, reference_pay_medians(db))
+        else:
+            scores = pd.DataFrame(columns=list(PredictionResponse.model_fields))
+        scores.insert(0, "id", df["id"].astype("Int64"))
+        for name in extra:
+            scores[name] = df[name].to_numpy()
 
+        if media_type == ARROW_STREAM_MEDIA_TYPE:
+            content = dump_frame_arrow(scores, {"total": len(scores)})
+            return Response(content=content, media_type=media_type, headers=VARY_ACCEPT)
+
+        records = scores.astype(object).where(scores.notna(), None).to_dict("records")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur lors de la prédiction: {str(e)}")
 
+    if media_type == MSGPACK_MEDIA_TYPE:
+        content = dump_msgpack({"total": len(records), "predictions": records})
+        return Response(content=content, media_type=media_type, headers=VARY_ACCEPT)
+    return SelectionPredictionResponse(total=len(records), predictions=records)
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,10 +1,25 @@
 """Page Explorer - Liste et filtre des employés."""
 
+import math
+
 import streamlit as st
 import pandas as pd
-from utils.api_client import APIClient
+from utils.data_access import (
+    data_version,
+    employees_page,
+    get_client,
+    prefetch_employees_page,
+    render_refresh_control,
+)
 from utils.ui_components import show_error, show_info
-from config import APP_TITLE, APP_ICON, APP_LAYOUT, DEFAULT_PAGE_SIZE
+from config import (
+    APP_TITLE,
+    APP_ICON,
+    APP_LAYOUT,
+    DEFAULT_PAGE_SIZE,
+    DEPARTEMENTS,
+    MAX_PAGE_SIZE,
+)
 
 st.set_page_config(
     page_title=f"{APP_TITLE} - Explorer",
@@ -14,13 +29,55 @@ st.set_page_config(
 
 # Initialisation
 if "api_client" not in st.session_state:
-    st.session_state.api_client = APIClient()
+    st.session_state.api_client = get_client()
 
 st.title("📊 Explorer les Employés")
 st.markdown("Parcourez et filtrez la liste complète des employés de l'entreprise.")
 
 st.markdown("---")
 
+# Colonnes affichées : seules celles-ci sont demandées à l'API
+display_columns = [
+    "id",
+    "genre",
+    "age",
+    "poste",
+    "departement",
+    "revenu_mensuel",
+    "satisfaction_moyenne",
+    "annees_dans_l_entreprise",
+]
+
+column_labels = {
+    "id": "ID",
+    "genre": "Genre",
+    "age": "Âge",
+    "poste": "Poste",
+    "departement": "Département",
+    "revenu_mensuel": "Revenu Mensuel",
+    "satisfaction_moyenne": "Satisfaction",
+    "annees_dans_l_entreprise": "Ancienneté",
+}
+
+FILTER_KEYS = ["filter_departements", "filter_age", "sort_column", "sort_descending"]
+
+
+def reset_filters():
+    """Remet les filtres et le tri à leur valeur par défaut."""
+    for key in FILTER_KEYS:
+        st.session_state.pop(key, None)
+
+
+def go_to(page: int):
+    """Change de page (0 = première) dans la pile des curseurs."""
+    del st.session_state.explorer_cursors[page + 1 :]
+
+
+def go_next(cursor: str):
+    """Passe à la page suivante à partir de son curseur."""
+    st.session_state.explorer_cursors.append(cursor)
+
+
 # Sidebar avec filtres
 st.sidebar.header("🔧 Filtres")
 
@@ -28,8 +85,9 @@ with st.sidebar:
     # Filtre par département
     departements = st.multiselect(
         "Département",
-        options=["Commercial", "Consulting", "Data Science", "RH", "IT"],
+        options=DEPARTEMENTS,
         help="Filtrer par département",
+        key="filter_departements",
     )
 
     # Filtre par âge
@@ -40,112 +98,163 @@ with st.sidebar:
         max_value=70,
         value=(18, 70),
         label_visibility="collapsed",
+        key="filter_age",
+    )
+
+    # Tri (appliqué par l'API sur toute la table)
+    st.markdown("**Tri**")
+    sort_column = st.selectbox(
+        "Trier par",
+        options=display_columns,
+        format_func=column_labels.get,
+        key="sort_column",
+    )
+    sort_descending = st.toggle("Ordre décroissant", key="sort_descending")
+
+    page_size = st.select_slider(
+        "Employés par page",
+        options=[DEFAULT_PAGE_SIZE, 50, MAX_PAGE_SIZE],
+        value=MAX_PAGE_SIZE,
     )
 
     # Bouton reset
-    if st.button("🔄 Réinitialiser les filtres"):
-        st.rerun()
+    st.button("🔄 Réinitialiser les filtres", on_click=reset_filters)
+
+render_refresh_control()
+
+# Filtres et tri poussés à l'API : seule la page visible est transférée
+filters = {
+    "departement": departements,
+    "age_min": age_min if age_min > 18 else None,
+    "age_max": age_max if age_max < 70 else None,
+}
+sort = f"-{sort_column}" if sort_descending else sort_column
+
+# Pile des curseurs (un par page déjà visitée), remise à zéro si la requête change
+query = (tuple(departements), age_min, age_max, sort, page_size)
+if st.session_state.get("explorer_query") != query:
+    st.session_state.explorer_query = query
+    st.session_state.explorer_cursors = [None]
+cursors = st.session_state.explorer_cursors
+page_params = {"limit": page_size, "fields": display_columns, "sort": sort, "filters": filters}
 
 # Récupération des données
 try:
     with st.spinner("Chargement des données..."):
-        data = st.session_state.api_client.get_employees(skip=0, limit=100)
-        employees = data.get("employees", [])
+        df = employees_page(cursor=cursors[-1], **page_params)
 
-        if not employees:
-            show_info("Aucun employé trouvé.")
-            st.stop()
+    total = df.attrs.get("total", len(df))
+    next_cursor = df.attrs.get("next_cursor")
 
-        # Conversion en DataFrame
-        df = pd.DataFrame(employees)
+    # Page suivante chargée en arrière-plan pendant la lecture de celle-ci
+    if next_cursor:
+        prefetch_employees_page(cursor=next_cursor, **page_params)
 
-        # Application des filtres
-        filtered_df = df.copy()
+    if total == 0:
+        show_info("Aucun employé ne correspond aux filtres sélectionnés.")
+        st.stop()
 
-        # Filtre département
-        if departements:
-            filtered_df = filtered_df[filtered_df["departement"].isin(departements)]
+    # Affichage des résultats
+    page_number, page_count = len(cursors), max(1, math.ceil(total / page_size))
+    st.subheader(f"📋 Résultats ({total} employés) — page {page_number} / {page_count}")
 
-        # Filtre âge
-        filtered_df = filtered_df[(filtered_df["age"] >= age_min) & (filtered_df["age"] <= age_max)]
+    # Navigation par curseur
+    nav_first, nav_previous, nav_next, _ = st.columns([1, 1, 1, 4])
+    with nav_first:
+        st.button("⏮️ Première", on_click=go_to, args=(0,), disabled=page_number == 1)
+    with nav_previous:
+        st.button(
+            "◀️ Précédente",
+            on_click=go_to,
+            args=(page_number - 2,),
+            disabled=page_number == 1,
+        )
+    with nav_next:
+        st.button(
+            "Suivante ▶️",
+            on_click=go_next,
+            args=(next_cursor,),
+            disabled=next_cursor is None,
+        )
 
-        # Affichage des résultats
-        st.subheader(f"📋 Résultats ({len(filtered_df)} employés)")
+    # Préparation du DataFrame pour l'affichage
+    display_df = df[display_columns].copy()
 
-        if filtered_df.empty:
-            show_info("Aucun employé ne correspond aux filtres sélectionnés.")
-        else:
-            # Sélection des colonnes à afficher
-            display_columns = [
-                "id",
-                "genre",
-                "age",
-                "poste",
-                "departement",
-                "revenu_mensuel",
-                "satisfaction_moyenne",
-                "annees_dans_l_entreprise",
-            ]
-
-            # Préparation du DataFrame pour l'affichage
-            display_df = filtered_df[display_columns].copy()
-
-            # Formatage des colonnes
-            display_df["revenu_mensuel"] = display_df["revenu_mensuel"].apply(
-                lambda x: f"{x:,.0f} €".replace(",", " ")
-            )
-            display_df["satisfaction_moyenne"] = display_df["satisfaction_moyenne"].apply(
-                lambda x: f"{x:.1f}/4" if pd.notna(x) else "N/A"
-            )
+    # Formatage des colonnes
+    display_df["revenu_mensuel"] = display_df["revenu_mensuel"].apply(
+        lambda x: f"{x:,.0f} €".replace(",", " ")
+    )
+    display_df["satisfaction_moyenne"] = display_df["satisfaction_moyenne"].apply(
+        lambda x: f"{x:.1f}/4" if pd.notna(x) else "N/A"
+    )
 
-            # Renommer les colonnes pour l'affichage
-            display_df = display_df.rename(
-                columns={
-                    "id": "ID",
-                    "genre": "Genre",
-                    "age": "Âge",
-                    "poste": "Poste",
-                    "departement": "Département",
-                    "revenu_mensuel": "Revenu Mensuel",
-                    "satisfaction_moyenne": "Satisfaction",
-                    "annees_dans_l_entreprise": "Ancienneté",
-                }
-            )
+    # Renommer les colonnes pour l'affichage
+    display_df = display_df.rename(columns=column_labels)
 
-            # Affichage du tableau
-            st.dataframe(
-                display_df,
-                use_container_width=True,
-                height=500,
-            )
+    # Affichage du tableau (rendu virtualisé côté navigateur)
+    st.dataframe(
+        display_df,
+        use_container_width=True,
+        height=500,
+        hide_index=True,
+    )
 
-            # Statistiques rapides
-            st.markdown("---")
-            st.subheader("📊 Statistiques sur la sélection")
+    # Statistiques rapides
+    st.markdown("---")
+    st.subheader("📊 Statistiques sur la page affichée")
 
-            col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3, col4 = st.columns(4)
 
-            with col1:
-                st.metric("Total", len(filtered_df))
+    with col1:
+        st.metric("Total (sélection)", total)
 
-            with col2:
-                avg_age = filtered_df["age"].mean()
-                st.metric("Âge moyen", f"{avg_age:.0f} ans")
+    with col2:
+        avg_age = df["age"].mean()
+        st.metric("Âge moyen", f"{avg_age:.0f} ans")
 
-            with col3:
-                avg_satisfaction = filtered_df["satisfaction_moyenne"].mean()
-                st.metric("Satisfaction moyenne", f"{avg_satisfaction:.1f}/4")
+    with col3:
+        avg_satisfaction = df["satisfaction_moyenne"].mean()
+        st.metric("Satisfaction moyenne", f"{avg_satisfaction:.1f}/4")
 
-            with col4:
-                avg_anciennete = filtered_df["annees_dans_l_entreprise"].mean()
-                st.metric("Ancienneté moyenne", f"{avg_anciennete:.1f} ans")
+    with col4:
+        avg_anciennete = df["annees_dans_l_entreprise"].mean()
+        st.metric("Ancienneté moyenne", f"{avg_anciennete:.1f} ans")
 
-            # Export CSV
-            st.markdown("---")
-            csv = filtered_df.to_csv(index=False).encode("utf-8")
+    # Export CSV : la page affichée, ou toute la sélection parcourue page par page
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.download_button(
+            label="📥 Télécharger la page (CSV)",
+            data=df.to_csv(index=False).encode("utf-8"),
+            file_name=f"employees_page_{page_number}.csv",
+            mime="text/csv",
+        )
+
+    with col2:
+        export_key = (*query, data_version())
+        export = st.session_state.get("explorer_export")
+        if export is None or export[0] != export_key:
+            if st.button("📦 Préparer l'export de la sélection"):
+                with st.spinner(f"Export de {total} employés..."):
+                    pages = get_client().iter_employees(
+                        page_size=MAX_PAGE_SIZE,
+                        fields=display_columns,
+                        as_frames=True,
+                        sort=sort,
+                        filters=filters,
+                    )
+                    selection = pd.concat(list(pages), ignore_index=True)
+                st.session_state.explorer_export = (
+                    export_key,
+                    selection.to_csv(index=False).encode("utf-8"),
+                )
+                st.rerun()
+        else:
             st.download_button(
-                label="📥 Télécharger les résultats (CSV)",
-                data=csv,
+                label="📥 Télécharger la sélection (CSV)",
+                data=export[1],
                 file_name="employees_filtered.csv",
                 mime="text/csv",
             )
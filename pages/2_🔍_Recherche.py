@@ -1,7 +1,9 @@
 """Page Recherche - Recherche d'un employé par ID."""
 
+import pandas as pd
 import streamlit as st
-from utils.api_client import APIClient
+from utils import data_access
+from utils.shared_client import get_shared_client
 from utils.ui_components import render_employee_card, show_error, show_info
 from config import APP_TITLE, APP_ICON, APP_LAYOUT
 
@@ -13,12 +15,13 @@ st.set_page_config(
 
 # Initialisation
 if "api_client" not in st.session_state:
-    st.session_state.api_client = APIClient()
+    st.session_state.api_client = get_shared_client()
 
 st.title("🔍 Recherche d'Employé")
 st.markdown("Recherchez un employé spécifique par son identifiant unique.")
 
 st.markdown("---")
+data_access.render_refresh_control()
 
 # Input pour l'ID
 col1, col2 = st.columns([3, 1])
@@ -40,7 +43,7 @@ with col2:
 if search_button or employee_id:
     try:
         with st.spinner("Recherche en cours..."):
-            employee = st.session_state.api_client.get_employee(employee_id)
+            employee = data_access.employee(employee_id)
 
             if employee:
                 st.success(f"✅ Employé #{employee_id} trouvé !")
@@ -186,3 +189,34 @@ if search_button or employee_id:
             show_error(f"Employé #{employee_id} non trouvé.")
         else:
             show_error(f"Erreur lors de la recherche : {str(e)}")
+
+# Comparaison : tous les employés demandés en un seul appel
+st.markdown("---")
+st.subheader("👥 Comparer plusieurs employés")
+
+compare_input = st.text_input(
+    "IDs à comparer",
+    placeholder="Ex. 1, 2, 3",
+    help="Identifiants séparés par des virgules",
+)
+
+if compare_input:
+    try:
+        compare_ids = [int(value) for value in compare_input.split(",") if value.strip()]
+    except ValueError:
+        show_error("Les identifiants doivent être des nombres entiers séparés par des virgules.")
+        compare_ids = []
+
+    if compare_ids:
+        try:
+            with st.spinner("Chargement des employés..."):
+                selection = data_access.employees_by_ids(compare_ids)
+
+            if selection["missing"]:
+                show_info("Introuvables : " + ", ".join(f"#{i}" for i in selection["missing"]))
+            if selection["employees"]:
+                comparison = pd.DataFrame(selection["employees"]).set_index("id")
+                comparison.index = [f"#{i}" for i in comparison.index]
+                st.dataframe(comparison.T.astype(str), use_container_width=True)
+        except Exception as e:
+            show_error(f"Erreur lors de la comparaison : {str(e)}")
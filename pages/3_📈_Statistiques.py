@@ -4,7 +4,14 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.api_client import APIClient
+from utils.shared_client import get_shared_client
+from utils.data_access import all_employees, employee_stats, render_refresh_control
+from utils.chart_data import (
+    LARGE_POPULATION_THRESHOLD,
+    MAX_SCATTER_POINTS,
+    SUMMARY_COLUMNS,
+    population_summary,
+)
 from utils.ui_components import show_error
 from config import APP_TITLE, APP_ICON, APP_LAYOUT, COLORS
 
@@ -16,24 +23,60 @@ st.set_page_config(
 
 # Initialisation
 if "api_client" not in st.session_state:
-    st.session_state.api_client = APIClient()
+    st.session_state.api_client = get_shared_client()
 
 st.title("📈 Statistiques et Visualisations")
 st.markdown("Analysez les données des employés avec des graphiques interactifs.")
 
 st.markdown("---")
 
+render_refresh_control()
+
+# Mode de rendu : agrégé (points envoyés au navigateur bornés) ou exact
+with st.sidebar:
+    st.header("🖥️ Rendu")
+    render_mode = st.radio(
+        "Mode de rendu",
+        options=["Automatique", "Agrégé", "Exact"],
+        help=(
+            "Agrégé : histogrammes, quartiles et nuage échantillonné (WebGL) ou en densité, "
+            "calculés par l'API sans charger les employés. Automatique : agrégé au-delà de "
+            f"{LARGE_POPULATION_THRESHOLD} employés."
+        ),
+    )
+    scatter_mode = st.radio(
+        "Nuage revenu / expérience (mode agrégé)",
+        options=["Échantillon stratifié", "Densité"],
+    )
+
 # Récupération des données
 try:
     with st.spinner("Chargement des données..."):
-        data = st.session_state.api_client.get_employees(skip=0, limit=100)
-        employees = data.get("employees", [])
-
-        if not employees:
+        # Agrégats calculés par l'API (en cache) : la population n'est chargée qu'en rendu exact
+        aggregated = False
+        if render_mode != "Exact":
+            summary = employee_stats()
+            aggregated = render_mode == "Agrégé" or summary["total"] > LARGE_POPULATION_THRESHOLD
+        if not aggregated:
+            # Snapshot Parquet s'il existe, sinon toutes les pages de l'API (en cache)
+            df = all_employees(SUMMARY_COLUMNS)
+            if df.attrs["source"] != "api":
+                st.caption(f"Source : snapshot {df.attrs['source']}")
+            summary = population_summary(df)
+
+        total = summary["total"]
+        if not total:
             st.info("Aucune donnée disponible.")
             st.stop()
 
-        df = pd.DataFrame(employees)
+        if aggregated:
+            st.caption(
+                f"Rendu agrégé : {total} employés résumés par l'API "
+                f"(au plus {MAX_SCATTER_POINTS} points par nuage)."
+            )
+
+        means = summary["means"]
+        departements = pd.DataFrame(summary["departements"])
 
         # 1. Métriques générales
         st.subheader("📊 Vue d'Ensemble")
@@ -41,18 +84,18 @@ try:
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.metric("Total Employés", len(df))
+            st.metric("Total Employés", total)
 
         with col2:
-            avg_age = df["age"].mean()
+            avg_age = means["age"]
             st.metric("Âge Moyen", f"{avg_age:.0f} ans")
 
         with col3:
-            avg_satisfaction = df["satisfaction_moyenne"].mean()
+            avg_satisfaction = means["satisfaction_moyenne"]
             st.metric("Satisfaction Moyenne", f"{avg_satisfaction:.1f}/4")
 
         with col4:
-            avg_revenue = df["revenu_mensuel"].mean()
+            avg_revenue = means["revenu_mensuel"]
             st.metric("Revenu Moyen", f"{avg_revenue:,.0f} €".replace(",", " "))
 
         st.markdown("---")
@@ -66,11 +109,8 @@ try:
             st.subheader("Répartition par Département")
 
             # Graphique en barres : Employés par département
-            dept_counts = df["departement"].value_counts().reset_index()
-            dept_counts.columns = ["departement", "count"]
-
             fig1 = px.bar(
-                dept_counts,
+                departements,
                 x="departement",
                 y="count",
                 title="Nombre d'Employés par Département",
@@ -82,10 +122,8 @@ try:
             st.plotly_chart(fig1, use_container_width=True)
 
             # Revenu moyen par département
-            dept_salary = df.groupby("departement")["revenu_mensuel"].mean().reset_index()
-
             fig2 = px.bar(
-                dept_salary,
+                departements,
                 x="departement",
                 y="revenu_mensuel",
                 title="Revenu Moyen par Département (€)",
@@ -105,23 +143,38 @@ try:
 
             with col1:
                 # Distribution par âge
-                fig3 = px.histogram(
-                    df,
-                    x="age",
-                    nbins=20,
-                    title="Distribution par Âge",
-                    labels={"age": "Âge", "count": "Nombre d'employés"},
-                    color_discrete_sequence=[COLORS["primary"]],
-                )
+                if aggregated:
+                    # Classes comptées par l'API : 20 barres quelle que soit la population
+                    bins = pd.DataFrame(summary["age_histogram"])
+                    fig3 = go.Figure(
+                        go.Bar(
+                            x=bins["center"],
+                            y=bins["count"],
+                            width=bins["right"] - bins["left"],
+                            marker_color=COLORS["primary"],
+                        )
+                    )
+                    fig3.update_layout(
+                        title="Distribution par Âge",
+                        xaxis_title="Âge",
+                        yaxis_title="Nombre d'employés",
+                        bargap=0,
+                    )
+                else:
+                    fig3 = px.histogram(
+                        df,
+                        x="age",
+                        nbins=20,
+                        title="Distribution par Âge",
+                        labels={"age": "Âge", "count": "Nombre d'employés"},
+                        color_discrete_sequence=[COLORS["primary"]],
+                    )
                 st.plotly_chart(fig3, use_container_width=True)
 
             with col2:
                 # Distribution par genre
-                genre_counts = df["genre"].value_counts().reset_index()
-                genre_counts.columns = ["genre", "count"]
-
                 fig4 = px.pie(
-                    genre_counts,
+                    pd.DataFrame(summary["genres"]),
                     names="genre",
                     values="count",
                     title="Répartition par Genre",
@@ -136,21 +189,40 @@ try:
 
             with col1:
                 # Distribution des revenus
-                fig6 = px.box(
-                    df,
-                    y="revenu_mensuel",
-                    title="Distribution des Revenus Mensuels",
-                    labels={"revenu_mensuel": "Revenu mensuel (€)"},
-                    color_discrete_sequence=[COLORS["primary"]],
-                )
+                if aggregated:
+                    # Quartiles calculés par l'API : la boîte ne transporte que 5 valeurs
+                    box = summary["revenu_box"] or {}
+                    fig6 = go.Figure(
+                        go.Box(
+                            q1=[box.get("q1")],
+                            median=[box.get("median")],
+                            q3=[box.get("q3")],
+                            lowerfence=[box.get("lowerfence")],
+                            upperfence=[box.get("upperfence")],
+                            mean=[box.get("mean")],
+                            name="revenu_mensuel",
+                            marker_color=COLORS["primary"],
+                        )
+                    )
+                    fig6.update_layout(
+                        title="Distribution des Revenus Mensuels",
+                        yaxis_title="Revenu mensuel (€)",
+                        showlegend=False,
+                    )
+                else:
+                    fig6 = px.box(
+                        df,
+                        y="revenu_mensuel",
+                        title="Distribution des Revenus Mensuels",
+                        labels={"revenu_mensuel": "Revenu mensuel (€)"},
+                        color_discrete_sequence=[COLORS["primary"]],
+                    )
                 st.plotly_chart(fig6, use_container_width=True)
 
             with col2:
                 # Revenu moyen par département
-                dept_salary = df.groupby("departement")["revenu_mensuel"].mean().reset_index()
-
                 fig7 = px.bar(
-                    dept_salary,
+                    departements,
                     x="departement",
                     y="revenu_mensuel",
                     title="Revenu Moyen par Département",
@@ -164,30 +236,53 @@ try:
                 st.plotly_chart(fig7, use_container_width=True)
 
             # Scatter : Revenu vs Années d'expérience
-            fig8 = px.scatter(
-                df,
-                x="annee_experience_totale",
-                y="revenu_mensuel",
-                color="departement",
-                title="Revenu vs Expérience par Département",
-                labels={
-                    "annee_experience_totale": "Années d'expérience",
-                    "revenu_mensuel": "Revenu mensuel (€)",
-                    "departement": "Département",
-                },
-            )
+            scatter_labels = {
+                "annee_experience_totale": "Années d'expérience",
+                "revenu_mensuel": "Revenu mensuel (€)",
+                "departement": "Département",
+            }
+            if aggregated and scatter_mode == "Densité":
+                # Grille 40 x 40 : nombre d'employés par cellule
+                density = summary["density"]
+                fig8 = go.Figure(
+                    go.Heatmap(
+                        x=density["x"],
+                        y=density["y"],
+                        z=density["counts"],
+                        colorscale=["#1A1A2E", "#FF6B6B"],
+                        colorbar={"title": "Employés"},
+                    )
+                )
+                fig8.update_layout(
+                    title="Densité Revenu vs Expérience",
+                    xaxis_title=scatter_labels["annee_experience_totale"],
+                    yaxis_title=scatter_labels["revenu_mensuel"],
+                )
+            else:
+                points = pd.DataFrame(summary["sample"]) if aggregated else df
+                fig8 = px.scatter(
+                    points,
+                    x="annee_experience_totale",
+                    y="revenu_mensuel",
+                    color="departement",
+                    title="Revenu vs Expérience par Département",
+                    labels=scatter_labels,
+                    # WebGL (scattergl) en mode agrégé ; sinon choix automatique de Plotly
+                    render_mode="webgl" if aggregated else "auto",
+                )
+                if len(points) < total:
+                    fig8.update_layout(
+                        title=f"Revenu vs Expérience par Département "
+                        f"(échantillon stratifié de {len(points)} sur {total})"
+                    )
             st.plotly_chart(fig8, use_container_width=True)
 
         with tab4:
             st.subheader("Analyse de Satisfaction")
 
             # Satisfaction moyenne par département
-            dept_satisfaction = (
-                df.groupby("departement")["satisfaction_moyenne"].mean().reset_index()
-            )
-
             fig9 = px.bar(
-                dept_satisfaction,
+                departements,
                 x="departement",
                 y="satisfaction_moyenne",
                 title="Satisfaction Moyenne par Département",
@@ -202,13 +297,8 @@ try:
             st.plotly_chart(fig9, use_container_width=True)
 
             # Répartition de la satisfaction
-            satisfaction_distribution = (
-                df["satisfaction_moyenne"].value_counts().sort_index().reset_index()
-            )
-            satisfaction_distribution.columns = ["satisfaction", "count"]
-
             fig10 = px.bar(
-                satisfaction_distribution,
+                pd.DataFrame(summary["satisfaction"]),
                 x="satisfaction",
                 y="count",
                 title="Distribution de la Satisfaction",
@@ -11,7 +11,10 @@ from utils.ui_components import (
     show_error,
     show_success,
 )
-import time
+from utils import data_access
+
+# Résultats d'une recherche par nom scorés d'avance (changement de sélection immédiat)
+PREFETCHED_RESULTS = 5
 
 
 def render_prediction_results(prediction_data: dict, employee_data: dict):
@@ -601,7 +604,9 @@ def main():
         """
     )
 
-    # Initialiser l'API client
+    # Client API partagé par les sessions (utils/shared_client.py)
+    if "api_client" not in st.session_state:
+        st.session_state.api_client = data_access.get_client()
     api_client = st.session_state.api_client
 
     # Interface de recherche
@@ -612,59 +617,82 @@ def main():
         st.session_state.selected_employee = None
     if "prediction_result" not in st.session_state:
         st.session_state.prediction_result = None
-
-    col1, col2 = st.columns([3, 1])
-
-    with col1:
-        if st.button("🔍 Rechercher", type="primary"):
-            if search_value:
-                try:
-                    with st.spinner("Recherche de l'employé..."):
-                        if search_type == "ID Employé":
-                            employee = api_client.get_employee(search_value)
-                            st.session_state.selected_employee = employee
-                            show_success(f"Employé trouvé: {employee.get('poste', 'N/A')}")
+    if "prediction_future" not in st.session_state:
+        st.session_state.prediction_future = None
+    if "search_results" not in st.session_state:
+        st.session_state.search_results = None
+
+    if st.button("🔍 Rechercher et prédire", type="primary"):
+        if search_value:
+            st.session_state.selected_employee = None
+            st.session_state.prediction_result = None
+            st.session_state.prediction_future = None
+            st.session_state.search_results = None
+            st.session_state.pop("search_choice", None)
+            try:
+                with st.spinner("Recherche de l'employé..."):
+                    if search_type == "ID Employé":
+                        # Scoring lancé avant même le chargement de la fiche
+                        future = data_access.start_prediction(search_value)
+                        st.session_state.prediction_future = future
+                        employee = data_access.employee(search_value)
+                        st.session_state.selected_employee = employee
+                        show_success(f"Employé trouvé: {employee.get('poste', 'N/A')}")
+                    else:
+                        employees = api_client.search_employees(str(search_value))
+                        if employees:
+                            st.session_state.search_results = employees
+                            for candidate in employees[:PREFETCHED_RESULTS]:
+                                data_access.start_prediction(candidate["id"], candidate)
+                            show_success(f"{len(employees)} employé(s) trouvé(s)")
                         else:
-                            employees = api_client.search_employees(str(search_value))
-                            if employees:
-                                st.session_state.selected_employee = employees[0]
-                                show_success(f"{len(employees)} employé(s) trouvé(s)")
-                            else:
-                                show_error("Aucun employé trouvé pour cette recherche")
-                                st.session_state.selected_employee = None
-
-                    st.session_state.prediction_result = None
-                    st.rerun()
-
-                except Exception as e:
-                    show_error(f"Erreur lors de la recherche: {str(e)}")
-            else:
-                show_error("Veuillez saisir une valeur pour la recherche")
+                            show_error("Aucun employé trouvé pour cette recherche")
+
+            except Exception as e:
+                st.session_state.prediction_future = None
+                show_error(f"Erreur lors de la recherche: {str(e)}")
+        else:
+            show_error("Veuillez saisir une valeur pour la recherche")
+
+    # Choix parmi les résultats d'une recherche par nom : le scoring part à la sélection
+    results = st.session_state.search_results
+    if results:
+        choice = st.selectbox(
+            "Employé",
+            options=range(len(results)),
+            format_func=lambda i: (
+                f"#{results[i].get('id')} — {results[i].get('poste', 'N/A')} "
+                f"({results[i].get('departement', 'N/A')})"
+            ),
+            key="search_choice",
+        )
+        employee = results[choice]
+        selected = st.session_state.selected_employee
+        if selected is None or selected.get("id") != employee.get("id"):
+            st.session_state.selected_employee = employee
+            st.session_state.prediction_result = None
+            st.session_state.prediction_future = data_access.start_prediction(
+                employee["id"], employee
+            )
 
-    with col2:
-        if st.session_state.selected_employee:
-            if st.button("🎯 Prédire l'attrition", type="secondary"):
-                try:
-                    render_loading_prediction()
-                    time.sleep(1)  # Simulation pour l'effet visuel
-
-                    with st.spinner("Analyse avec le modèle de machine learning..."):
-                        prediction_data = api_client.predict_attrition(
-                            st.session_state.selected_employee
-                        )
-                        st.session_state.prediction_result = prediction_data
-                        show_success("Prédiction réalisée avec succès!")
-                        time.sleep(0.5)
-                        st.rerun()
-
-                except Exception as e:
-                    show_error(f"Erreur lors de la prédiction: {str(e)}")
-
-    # Afficher les résultats
+    # Afficher les résultats : la fiche d'abord, la prédiction dès qu'elle arrive
     if st.session_state.selected_employee:
         st.markdown("### 👤 Employé sélectionné")
         render_employee_card(st.session_state.selected_employee)
 
+        future = st.session_state.prediction_future
+        if st.session_state.prediction_result is None and future is not None:
+            placeholder = st.empty()
+            with placeholder.container():
+                render_loading_prediction()
+            try:
+                st.session_state.prediction_result = future.result()
+            except Exception as e:
+                show_error(f"Erreur lors de la prédiction: {str(e)}")
+            finally:
+                st.session_state.prediction_future = None
+                placeholder.empty()
+
         if st.session_state.prediction_result:
             st.markdown("### 🎯 Résultats de la prédiction")
             render_prediction_results(
@@ -0,0 +1,200 @@
+"""Page Risques - Tableau de bord du risque d'attrition d'une équipe."""
+
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from utils.chart_data import histogram_bins
+from utils.data_access import get_client, render_refresh_control, team_scores
+from utils.scoring import RISK_LABELS
+from utils.ui_components import show_error, show_info
+from config import APP_TITLE, APP_ICON, APP_LAYOUT, COLORS, DEPARTEMENTS, POSTES
+
+st.set_page_config(
+    page_title=f"{APP_TITLE} - Risques",
+    page_icon=APP_ICON,
+    layout=APP_LAYOUT,
+)
+
+# Initialisation
+if "api_client" not in st.session_state:
+    st.session_state.api_client = get_client()
+
+st.title("🚦 Risque d'Attrition par Équipe")
+st.markdown(
+    "Choisissez une équipe (département, poste, tranche d'âge) : tous ses membres sont "
+    "scorés en un seul appel à l'API."
+)
+
+st.markdown("---")
+
+# Couleur de chaque niveau de risque (du plus faible au plus élevé)
+RISK_COLORS = dict(zip(RISK_LABELS, ["#4ECDC4", "#FFD166", "#FF9F1C", "#FF6B6B"], strict=True))
+
+# Colonnes de l'employé jointes aux scores
+TEAM_COLUMNS = ["poste", "departement", "age", "revenu_mensuel", "annees_dans_l_entreprise"]
+
+# Sidebar : définition de l'équipe
+st.sidebar.header("👥 Équipe")
+
+with st.sidebar:
+    departements = st.multiselect("Département", options=DEPARTEMENTS)
+    postes = st.multiselect("Poste", options=POSTES)
+
+    st.markdown("**Âge**")
+    age_min, age_max = st.slider(
+        "Plage d'âge",
+        min_value=18,
+        max_value=70,
+        value=(18, 70),
+        label_visibility="collapsed",
+    )
+
+render_refresh_control()
+
+filters = {
+    "departement": departements,
+    "poste": postes,
+    "age_min": age_min if age_min > 18 else None,
+    "age_max": age_max if age_max < 70 else None,
+}
+
+try:
+    with st.spinner("Scoring de l'équipe..."):
+        # Un seul appel GET /predict/employees, en cache jusqu'au prochain changement de données
+        scores = team_scores(filters, TEAM_COLUMNS)
+
+    if scores.empty:
+        show_info("Aucun employé ne correspond à cette équipe.")
+        st.stop()
+
+    # 1. Vue d'ensemble
+    st.subheader("📊 Vue d'Ensemble")
+
+    level_counts = scores["risk_level"].value_counts().reindex(RISK_LABELS, fill_value=0)
+    at_risk = int(level_counts[["Élevé", "Très élevé"]].sum())
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Effectif", len(scores))
+
+    with col2:
+        st.metric("Risque moyen", f"{scores['attrition_risk'].mean():.1f} %")
+
+    with col3:
+        st.metric("Risque élevé ou très élevé", at_risk)
+
+    with col4:
+        st.metric("Part à risque", f"{at_risk / len(scores):.0%}")
+
+    st.markdown("---")
+
+    # 2. Distribution (agrégée : taille indépendante de l'effectif)
+    st.subheader("📈 Distribution du Risque")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        bins = histogram_bins(scores["attrition_risk"], nbins=20)
+        fig1 = go.Figure(
+            go.Bar(
+                x=bins["center"],
+                y=bins["count"],
+                width=bins["right"] - bins["left"],
+                marker_color=COLORS["primary"],
+            )
+        )
+        fig1.update_layout(
+            title="Distribution du Risque d'Attrition",
+            xaxis_title="Risque d'attrition (%)",
+            yaxis_title="Nombre d'employés",
+            bargap=0,
+        )
+        st.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        fig2 = px.bar(
+            level_counts.rename_axis("risk_level").reset_index(name="count"),
+            x="risk_level",
+            y="count",
+            color="risk_level",
+            color_discrete_map=RISK_COLORS,
+            title="Employés par Niveau de Risque",
+            labels={"risk_level": "Niveau de risque", "count": "Nombre d'employés"},
+        )
+        fig2.update_layout(showlegend=False)
+        st.plotly_chart(fig2, use_container_width=True)
+
+    # Répartition des niveaux de risque par poste
+    by_poste = (
+        scores.groupby(["poste", "risk_level"], observed=True).size().reset_index(name="count")
+    )
+    fig3 = px.bar(
+        by_poste,
+        x="poste",
+        y="count",
+        color="risk_level",
+        color_discrete_map=RISK_COLORS,
+        category_orders={"risk_level": RISK_LABELS},
+        title="Niveaux de Risque par Poste",
+        labels={"poste": "Poste", "count": "Nombre d'employés", "risk_level": "Niveau de risque"},
+    )
+    st.plotly_chart(fig3, use_container_width=True)
+
+    st.markdown("---")
+
+    # 3. Classement
+    st.subheader("🏆 Classement par Risque")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        levels = st.multiselect("Niveaux affichés", options=RISK_LABELS, default=RISK_LABELS)
+
+    with col2:
+        sort_column = st.selectbox(
+            "Trier par",
+            options=["attrition_risk", "revenu_mensuel", "age", "annees_dans_l_entreprise"],
+            format_func={
+                "attrition_risk": "Risque d'attrition",
+                "revenu_mensuel": "Revenu mensuel",
+                "age": "Âge",
+                "annees_dans_l_entreprise": "Ancienneté",
+            }.get,
+        )
+
+    ranking = scores[scores["risk_level"].isin(levels)].sort_values(
+        [sort_column, "id"], ascending=[False, True]
+    )
+    ranking.insert(0, "rang", range(1, len(ranking) + 1))
+
+    # Tableau virtualisé : les en-têtes restent cliquables pour trier autrement
+    st.dataframe(
+        ranking[["rang", "id", *TEAM_COLUMNS, "attrition_risk", "risk_level"]],
+        use_container_width=True,
+        height=500,
+        hide_index=True,
+        column_config={
+            "rang": st.column_config.NumberColumn("Rang"),
+            "id": st.column_config.NumberColumn("ID"),
+            "poste": "Poste",
+            "departement": "Département",
+            "age": st.column_config.NumberColumn("Âge"),
+            "revenu_mensuel": st.column_config.NumberColumn("Revenu mensuel", format="%d €"),
+            "annees_dans_l_entreprise": st.column_config.NumberColumn("Ancienneté"),
+            "attrition_risk": st.column_config.ProgressColumn(
+                "Risque (%)", min_value=0, max_value=100, format="%.1f"
+            ),
+            "risk_level": "Niveau",
+        },
+    )
+
+    st.download_button(
+        label="📥 Télécharger le classement (CSV)",
+        data=ranking.to_csv(index=False).encode("utf-8"),
+        file_name="risques_equipe.csv",
+        mime="text/csv",
+    )
+
+except Exception as e:
+    show_error(f"Erreur lors du scoring de l'équipe : {str(e)}")
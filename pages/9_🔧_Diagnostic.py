@@ -7,7 +7,7 @@ import streamlit as st
 import requests
 import json
 import time
-from utils.api_client import APIClient
+from utils.shared_client import get_shared_client
 from config import API_URL
 
 # Configuration de la page
@@ -26,7 +26,7 @@ st.header("🏥 État de l'API et Diagnostic")
 
 # Initialiser le client API si nécessaire
 if "api_client" not in st.session_state:
-    st.session_state.api_client = APIClient()
+    st.session_state.api_client = get_shared_client()
     st.session_state.api_url = API_URL
 
 col1, col2, col3 = st.columns(3)
@@ -113,6 +113,23 @@ with col_info1:
     except Exception:
         st.error("❌ Pas de connectivité")
 
+    # Cache de réponses du client (utils/response_cache.py)
+    st.subheader("🗄️ Cache du client API")
+    cache_stats = st.session_state.api_client.cache.stats()
+    cache_col1, cache_col2, cache_col3 = st.columns(3)
+    cache_col1.metric("Taux de succès", f"{cache_stats['hit_rate']:.0%}")
+    cache_col2.metric("Hits / 304", f"{cache_stats['hits']} / {cache_stats['revalidated']}")
+    cache_col3.metric("Misses", cache_stats["misses"])
+    st.caption(f"{cache_stats['entries']} réponses en cache, {cache_stats['evictions']} évictions")
+    flight_stats = st.session_state.api_client.flight.stats()
+    st.caption(
+        f"Client partagé : {flight_stats['calls']} appels, "
+        f"{flight_stats['shared']} lectures mutualisées entre sessions"
+    )
+    if st.button("🧹 Vider le cache"):
+        st.session_state.api_client.cache.clear()
+        st.rerun()
+
 with col_info2:
     st.subheader("🔍 Logs de debug")
 
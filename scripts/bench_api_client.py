@@ -0,0 +1,91 @@
+"""
+Benchmark de latence par appel du client API : requête isolée vs session keep-alive.
+
+Démarre l'API (main:app) dans un thread uvicorn sur un port libre, puis
+mesure la latence de N appels identiques :
+- "isolé"   : requests.request, une connexion TCP par appel (ancien APIClient) ;
+- "session" : APIClient, connexion réutilisée par la session.
+
+Usage :
+    python scripts/bench_api_client.py --calls 500 --endpoint /employees/1
+"""
+
+import argparse
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import requests
+import uvicorn
+
+from main import app
+from utils.api_client import APIClient
+
+
+def start_api() -> tuple:
+    """
+    Lance l'API dans un thread sur un port libre.
+
+    Returns:
+        Tuple (URL de base, serveur uvicorn)
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}", server
+
+
+def measure(call, calls: int) -> list:
+    """Latences (ms) de `calls` appels successifs, après un appel de chauffe."""
+    call()
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=300, help="Nombre d'appels par profil")
+    parser.add_argument("--endpoint", default="/health", help="Endpoint GET appelé")
+    args = parser.parse_args()
+
+    base_url, server = start_api()
+    print(f"🚀 API de test sur {base_url}, {args.calls} appels GET {args.endpoint}")
+
+    client = APIClient(base_url=base_url)
+    url = f"{base_url}/{args.endpoint.lstrip('/')}"
+    profiles = {
+        "isolé": lambda: requests.request("GET", url, timeout=10).raise_for_status(),
+        "session": lambda: client._send("GET", args.endpoint),
+    }
+
+    results = {}
+    for name, call in profiles.items():
+        latencies = sorted(measure(call, args.calls))
+        results[name] = statistics.mean(latencies)
+        print(
+            f"⏱️  {name:<8} moyenne {results[name]:6.2f} ms"
+            f"  p50 {latencies[len(latencies) // 2]:6.2f} ms"
+            f"  p95 {latencies[int(len(latencies) * 0.95)]:6.2f} ms"
+        )
+
+    print(f"\n✅ Gain par appel : {results['isolé'] / results['session']:.1f}x")
+    client.close()
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
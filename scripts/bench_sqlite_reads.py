@@ -0,0 +1,163 @@
+"""
+Benchmark de débit en lecture SQLite : profil d'origine vs profil "tuned".
+
+Copie database.db dans un répertoire temporaire, la multiplie jusqu'à
+--rows lignes, puis mesure le nombre de requêtes/s (pages de 100 employés
+et lectures par ID) avec plusieurs threads lecteurs et, en option, un
+écrivain concurrent qui simule une migration ou un rafraîchissement.
+
+Usage :
+    python scripts/bench_sqlite_reads.py --rows 200000 --threads 8 --duration 5 --with-writer
+"""
+
+import argparse
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, text
+
+from database.config import create_sqlite_engine
+
+BASE_DIR = Path(__file__).parent.parent
+SOURCE_DB = BASE_DIR / "database.db"
+
+
+def build_scaled_database(target: Path, rows: int) -> int:
+    """
+    Crée une copie de database.db contenant au moins `rows` employés.
+
+    Args:
+        target: Chemin de la copie à créer
+        rows: Nombre de lignes visé
+
+    Returns:
+        Nombre de lignes effectivement présentes
+    """
+    shutil.copy(SOURCE_DB, target)
+    conn = sqlite3.connect(target)
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(employees)")]
+    other_columns = ", ".join(c for c in columns if c != "id")
+
+    count = conn.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+    while count < rows:
+        max_id = conn.execute("SELECT MAX(id) FROM employees").fetchone()[0]
+        conn.execute(
+            f"INSERT INTO employees (id, {other_columns}) "
+            f"SELECT id + {max_id}, {other_columns} FROM employees LIMIT {rows - count}"
+        )
+        conn.commit()
+        count = conn.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+    # Repartir d'un journal classique pour comparer les deux profils à armes égales
+    conn.execute("PRAGMA journal_mode=delete")
+    conn.close()
+    return count
+
+
+def run_readers(engine, total_rows: int, threads: int, duration: float, with_writer: bool):
+    """
+    Lance des lecteurs concurrents pendant `duration` secondes.
+
+    Returns:
+        Tuple (requêtes de lecture réalisées, erreurs, écritures réalisées)
+    """
+    stop = threading.Event()
+    counts = [0] * threads
+    errors = [0] * threads
+    writes = [0]
+
+    def reader(slot: int):
+        rng = random.Random(slot)
+        while not stop.is_set():
+            try:
+                with engine.connect() as conn:
+                    if rng.random() < 0.5:
+                        offset = rng.randrange(0, max(total_rows - 100, 1))
+                        conn.execute(
+                            text("SELECT * FROM employees LIMIT 100 OFFSET :offset"),
+                            {"offset": offset},
+                        ).fetchall()
+                    else:
+                        conn.execute(
+                            text("SELECT * FROM employees WHERE id = :id"),
+                            {"id": rng.randrange(1, total_rows)},
+                        ).fetchone()
+                counts[slot] += 1
+            except Exception:
+                errors[slot] += 1
+
+    def writer():
+        rng = random.Random(-1)
+        while not stop.is_set():
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text(
+                            "UPDATE employees SET satisfaction_moyenne = :value "
+                            "WHERE id BETWEEN :start AND :start + 500"
+                        ),
+                        {"value": rng.random() * 4, "start": rng.randrange(1, total_rows)},
+                    )
+                writes[0] += 1
+            except Exception:
+                pass
+            time.sleep(0.01)
+
+    workers = [threading.Thread(target=reader, args=(i,)) for i in range(threads)]
+    if with_writer:
+        workers.append(threading.Thread(target=writer))
+
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+
+    return sum(counts), sum(errors), writes[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000, help="Taille de la table simulée")
+    parser.add_argument("--threads", type=int, default=8, help="Nombre de lecteurs")
+    parser.add_argument("--duration", type=float, default=5.0, help="Durée par profil (s)")
+    parser.add_argument("--with-writer", action="store_true", help="Ajoute un écrivain concurrent")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "bench.db"
+        total = build_scaled_database(db_path, args.rows)
+        print(f"📦 Base de test : {total} employés ({db_path.stat().st_size / 1e6:.1f} Mo)")
+
+        profiles = {
+            "default": lambda: create_engine(
+                f"sqlite:///{db_path}",
+                connect_args={"check_same_thread": False},
+                pool_pre_ping=True,
+            ),
+            "tuned": lambda: create_sqlite_engine(db_path),
+        }
+
+        for name, factory in profiles.items():
+            engine = factory()
+            reads, errors, writes = run_readers(
+                engine, total, args.threads, args.duration, args.with_writer
+            )
+            engine.dispose()
+            print(
+                f"⏱️  {name:<8} {reads / args.duration:>10.0f} lectures/s"
+                f"  erreurs={errors}  écritures={writes}"
+            )
+
+
+if __name__ == "__main__":
+    main()
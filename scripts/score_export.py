@@ -0,0 +1,76 @@
+"""
+Scoring par lot d'un export RH, brut ou préparé, sans passer par l'API.
+
+Lit le fichier, calcule les colonnes dérivées (utils/features.py) sur
+l'ensemble de l'export, puis score toutes les lignes en un seul appel
+predict_proba. Écrit id, probabilité, prédiction et niveau de risque.
+
+La source peut aussi être un dossier de snapshots Parquet (database/snapshot.py) :
+seules les colonnes du modèle sont lues, en mémoire mappée.
+
+Usage :
+    python scripts/score_export.py data/dataset_employe.csv --output scores.csv
+    python scripts/score_export.py data/snapshots --output scores.csv
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import joblib
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.features import MODEL_FEATURES, derive_features
+from utils.scoring import score_frame
+from utils.snapshot import read_snapshot, snapshot_manifest
+
+BASE_DIR = Path(__file__).parent.parent
+MODEL_PATH = BASE_DIR / "data" / "export-api" / "attrition_model.joblib"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scoring par lot d'un export RH")
+    parser.add_argument(
+        "csv", type=Path, help="Export dataset_employe.csv ou préparé, ou dossier de snapshots"
+    )
+    parser.add_argument("--output", type=Path, default=Path("scores.csv"), help="Fichier de sortie")
+    parser.add_argument("--model", type=Path, default=MODEL_PATH, help="Modèle joblib")
+    args = parser.parse_args()
+
+    if not args.csv.exists():
+        print(f"❌ Erreur: Fichier CSV introuvable: {args.csv}")
+        return False
+
+    model = joblib.load(args.model)
+
+    start = time.perf_counter()
+    if args.csv.is_dir():
+        available = snapshot_manifest(args.csv)["columns"]
+        columns = [column for column in ["id", *MODEL_FEATURES] if column in available]
+        df = derive_features(read_snapshot(columns, root=args.csv))
+    else:
+        df = derive_features(pd.read_csv(args.csv))
+    loaded = time.perf_counter()
+    scores = score_frame(model, df)
+    scored = time.perf_counter()
+
+    if "id" in df.columns:
+        scores.insert(0, "id", df["id"])
+    scores.to_csv(args.output, index=False)
+
+    print(f"✓ {len(df):,} employés lus et préparés en {loaded - start:.2f}s")
+    print(
+        f"✓ Scoring en {scored - loaded:.2f}s ({len(df) / (scored - start):,.0f} lignes/s au total)"
+    )
+    print("\n📊 Répartition des niveaux de risque :")
+    print(scores["risk_level"].value_counts().to_string())
+    print(f"\n✅ Scores écrits dans {args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
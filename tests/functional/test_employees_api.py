@@ -0,0 +1,453 @@
+"""Tests fonctionnels pour les endpoints employés."""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+from api.conditional import DataVersionCache
+from api.schemas import EmployeeListResponse, EmployeeResponse
+from api import serialization
+from api.serialization import ARROW_STREAM_MEDIA_TYPE
+from database.config import SessionLocal
+from database.data_version import DataVersionInfo
+from database.models import Employee
+from utils.api_client import arrow_to_frame
+
+
+@pytest.mark.api
+@pytest.mark.functional
+@pytest.mark.database
+class TestEmployeesList:
+    """Tests pour l'endpoint /employees."""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self):
+        """Setup du client de test."""
+        self.client = TestClient(app)
+
+    def test_fast_path_matches_orm_contract(self):
+        """Test que le chemin rapide renvoie le même JSON que la sérialisation ORM."""
+        response = self.client.get("/employees", params={"skip": 10, "limit": 25})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+        db = SessionLocal()
+        try:
+            employees = db.query(Employee).order_by(Employee.id).offset(10).limit(25).all()
+            total = db.query(Employee).count()
+        finally:
+            db.close()
+
+        # Le curseur de la page suivante n'existe pas côté ORM
+        next_cursor = response.json()["next_cursor"]
+        expected = EmployeeListResponse(
+            total=total, employees=employees, next_cursor=next_cursor
+        ).model_dump(mode="json")
+        assert response.json() == expected
+
+    def test_limit_is_capped(self):
+        """Test que la limite est plafonnée à 100."""
+        response = self.client.get("/employees", params={"limit": 1000})
+        assert response.status_code == 200
+        assert len(response.json()["employees"]) <= 100
+
+    @pytest.mark.parametrize("limit", [0, -5])
+    def test_empty_page_for_non_positive_limit(self, limit):
+        """Test qu'une limite nulle ou négative renvoie une page vide."""
+        response = self.client.get("/employees", params={"limit": limit})
+        assert response.status_code == 200
+        assert response.json()["employees"] == []
+        assert response.json()["next_cursor"] is None
+
+    def test_fields_projection(self):
+        """Test que `fields` ne renvoie que les colonnes demandées (plus l'ID)."""
+        response = self.client.get("/employees", params={"limit": 5, "fields": "age,departement"})
+        assert response.status_code == 200
+
+        for employee in response.json()["employees"]:
+            assert list(employee) == ["age", "departement", "id"]
+
+    def test_fields_unknown_column(self):
+        """Test qu'un champ inconnu renvoie une erreur 400."""
+        response = self.client.get("/employees", params={"fields": "age,salaire_secret"})
+        assert response.status_code == 400
+        assert "salaire_secret" in response.json()["detail"]
+
+    def test_arrow_format(self):
+        """Test que le flux Arrow contient les mêmes données que le JSON."""
+        params = {"limit": 20, "fields": "age,departement,satisfaction_moyenne"}
+        expected = self.client.get("/employees", params=params).json()
+
+        response = self.client.get(
+            "/employees", params=params, headers={"Accept": ARROW_STREAM_MEDIA_TYPE}
+        )
+        assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+        assert response.headers["vary"] == "Accept"
+
+        df = arrow_to_frame(response.content)
+        assert df.attrs["total"] == expected["total"]
+        assert df.astype(object).to_dict("records") == expected["employees"]
+
+    def test_msgpack_format(self):
+        """Test que MessagePack reprend la structure du JSON."""
+        msgpack = pytest.importorskip("msgpack")
+        expected = self.client.get("/employees", params={"limit": 5}).json()
+
+        response = self.client.get(
+            "/employees", params={"limit": 5}, headers={"Accept": "application/msgpack"}
+        )
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content) == expected
+
+    def test_msgpack_unavailable_serves_json(self, monkeypatch):
+        """Test que, sans le paquet msgpack côté API, la demande du client reçoit du JSON."""
+        monkeypatch.setattr(
+            serialization, "MEDIA_TYPES", ["application/json", ARROW_STREAM_MEDIA_TYPE]
+        )
+        response = self.client.get(
+            "/employees",
+            params={"limit": 2},
+            headers={"Accept": "application/msgpack, application/json;q=0.9"},
+        )
+        assert response.headers["content-type"] == "application/json"
+        assert len(response.json()["employees"]) == 2
+
+    @pytest.mark.parametrize(
+        "accept",
+        [None, "*/*", "text/html", f"application/json, {ARROW_STREAM_MEDIA_TYPE};q=0.1"],
+    )
+    def test_json_remains_default(self, accept):
+        """Test que le JSON reste servi sans préférence explicite pour un format binaire."""
+        headers = {"Accept": accept} if accept else {}
+        response = self.client.get("/employees", params={"limit": 2}, headers=headers)
+        assert response.headers["content-type"] == "application/json"
+
+
+@pytest.mark.api
+@pytest.mark.functional
+@pytest.mark.database
+class TestEmployeeDetail:
+    """Tests pour l'endpoint /employees/{id}."""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self):
+        """Setup du client de test."""
+        self.client = TestClient(app)
+
+    def test_full_employee(self):
+        """Test que l'employé complet respecte EmployeeResponse."""
+        response = self.client.get("/employees/1")
+        assert response.status_code == 200
+        assert set(response.json()) == set(EmployeeResponse.model_fields)
+
+    def test_fields_projection(self):
+        """Test la projection de colonnes sur un employé."""
+        response = self.client.get("/employees/1", params={"fields": "poste"})
+        assert response.status_code == 200
+        assert response.json().keys() == {"id", "poste"}
+
+    def test_not_found(self):
+        """Test qu'un ID inexistant renvoie 404."""
+        response = self.client.get("/employees/999999")
+        assert response.status_code == 404
+
+
+@pytest.mark.api
+@pytest.mark.functional
+@pytest.mark.database
+class TestEmployeeStats:
+    """Tests pour l'endpoint /employees/stats (agrégats de la page Statistiques)."""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self):
+        """Setup du client de test."""
+        self.client = TestClient(app)
+
+    def test_summary_matches_table(self):
+        """Test que les agrégats couvrent toute la table."""
+        response = self.client.get("/employees/stats")
+        assert response.status_code == 200
+        summary = response.json()
+
+        db = SessionLocal()
+        try:
+            total = db.query(Employee).count()
+        finally:
+            db.close()
+
+        assert summary["total"] == total
+        assert sum(d["count"] for d in summary["departements"]) == total
+        assert sum(b["count"] for b in summary["age_histogram"]) == total
+        assert summary["revenu_box"]["count"] == total
+        assert len(summary["sample"]) == min(total, 5000)
+
+    def test_filters_are_applied(self):
+        """Test que les filtres de /employees s'appliquent aux agrégats."""
+        params = {"departement": "Commercial", "age_min": 30}
+        summary = self.client.get("/employees/stats", params=params).json()
+        listed = self.client.get("/employees", params={**params, "limit": 1}).json()
+
+        assert summary["total"] == listed["total"]
+        assert [d["departement"] for d in summary["departements"]] == ["Commercial"]
+
+
+@pytest.mark.api
+@pytest.mark.functional
+@pytest.mark.database
+class TestEmployeeSelection:
+    """Tests pour la sélection par IDs (/employees?ids=, /employees/batch)."""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self):
+        """Setup du client de test."""
+        self.client = TestClient(app)
+
+    def test_get_keeps_requested_order(self):
+        """Test que les employés suivent l'ordre demandé et que les absents sont listés."""
+        response = self.client.get("/employees", params={"ids": "5,999999,1,3,1"})
+        assert response.status_code == 200
+
+        payload = response.json()
+        assert [employee["id"] for employee in payload["employees"]] == [5, 1, 3]
+        assert payload["missing"] == [999999]
+        assert payload["total"] == 3
+
+        expected = self.client.get("/employees/5").json()
+        assert payload["employees"][0] == expected
+
+    def test_post_matches_get(self):
+        """Test que la variante POST renvoie la même sélection, avec projection."""
+        get = self.client.get("/employees", params={"ids": "2,4", "fields": "age"})
+        post = self.client.post("/employees/batch", json={"ids": [2, 4], "fields": ["age"]})
+
+        assert post.status_code == 200
+        assert post.json() == get.json()
+        assert post.json()["employees"][0].keys() == {"id", "age"}
+
+    def test_arrow_selection(self):
+        """Test la sélection au format Arrow (absents dans les métadonnées)."""
+        response = self.client.get(
+            "/employees", params={"ids": "3,999999,2"}, headers={"Accept": ARROW_STREAM_MEDIA_TYPE}
+        )
+        df = arrow_to_frame(response.content)
+
+        assert df["id"].tolist() == [3, 2]
+        assert df.attrs["missing"] == "999999"
+
+    def test_invalid_and_oversized_selection(self):
+        """Test les erreurs 400 (ID non entier, trop d'IDs)."""
+        assert self.client.get("/employees", params={"ids": "1,abc"}).status_code == 400
+
+        response = self.client.post("/employees/batch", json={"ids": list(range(1, 1002))})
+        assert response.status_code == 400
+
+
+@pytest.mark.api
+@pytest.mark.functional
+@pytest.mark.database
+class TestConditionalRequests:
+    """Tests pour les réponses conditionnelles (ETag / Last-Modified)."""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self, monkeypatch):
+        """Setup du client de test avec une version des données fixée."""
+        self.info = DataVersionInfo(1767225600000, datetime(2026, 1, 1, 12, 0, 0))
+        cache = DataVersionCache()
+        monkeypatch.setattr(cache, "get", lambda db: self.info)
+        monkeypatch.setattr(main, "data_version", cache)
+        self.client = TestClient(app)
+
+    def test_validators_present(self):
+        """Test que la réponse porte ETag, Last-Modified et Cache-Control."""
+        response = self.client.get("/employees", params={"limit": 5})
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"1767225600000-json"'
+        assert response.headers["last-modified"] == "Thu, 01 Jan 2026 12:00:00 GMT"
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_stats_are_conditional(self):
+        """Test que les agrégats de /employees/stats donnent aussi un 304 à jour."""
+        etag = self.client.get("/employees/stats").headers["etag"]
+
+        response = self.client.get("/employees/stats", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    def test_if_none_match_returns_304(self):
+        """Test qu'un ETag à jour donne un 304 sans corps."""
+        etag = self.client.get("/employees", params={"limit": 5}).headers["etag"]
+
+        response = self.client.get(
+            "/employees", params={"limit": 5}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_returns_200(self):
+        """Test qu'un ETag d'une version précédente redonne la représentation."""
+        response = self.client.get(
+            "/employees", params={"limit": 5}, headers={"If-None-Match": '"1-json"'}
+        )
+        assert response.status_code == 200
+        assert len(response.json()["employees"]) == 5
+
+    def test_etag_depends_on_format(self):
+        """Test qu'un ETag JSON ne valide pas la représentation Arrow."""
+        etag = self.client.get("/employees").headers["etag"]
+
+        response = self.client.get(
+            "/employees", headers={"Accept": ARROW_STREAM_MEDIA_TYPE, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_if_modified_since(self):
+        """Test If-Modified-Since sur un employé."""
+        fresh = {"If-Modified-Since": "Thu, 01 Jan 2026 12:00:00 GMT"}
+        stale = {"If-Modified-Since": "Wed, 31 Dec 2025 12:00:00 GMT"}
+
+        assert self.client.get("/employees/1", headers=fresh).status_code == 304
+        assert self.client.get("/employees/1", headers=stale).status_code == 200
+
+    def test_data_version_endpoint(self):
+        """Test que /data-version expose la version et sa date."""
+        response = self.client.get("/data-version")
+        assert response.status_code == 200
+        assert response.json() == {
+            "version": 1767225600000,
+            "updated_at": "2026-01-01T12:00:00",
+        }
+
+
+@pytest.mark.api
+@pytest.mark.functional
+@pytest.mark.database
+class TestCursorPagination:
+    """Tests pour la pagination par curseur, le tri et les filtres de /employees."""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self):
+        """Setup du client de test."""
+        self.client = TestClient(app)
+
+    def walk(self, params):
+        """Parcourt toutes les pages en suivant next_cursor."""
+        ids, cursor, pages = [], None, 0
+        while True:
+            page_params = {**params, "cursor": cursor} if cursor else params
+            payload = self.client.get("/employees", params=page_params).json()
+            ids += [employee["id"] for employee in payload["employees"]]
+            pages += 1
+            cursor = payload["next_cursor"]
+            if cursor is None:
+                return ids, payload["total"], pages
+
+    def test_cursor_walk_matches_sorted_table(self):
+        """Test que le parcours par curseur couvre la table dans l'ordre du tri."""
+        ids, total, pages = self.walk({"limit": 40, "sort": "-revenu_mensuel", "fields": "id"})
+
+        db = SessionLocal()
+        try:
+            expected = [
+                employee.id
+                for employee in db.query(Employee).order_by(
+                    Employee.revenu_mensuel.desc().nulls_last(), Employee.id.desc()
+                )
+            ]
+        finally:
+            db.close()
+
+        assert ids == expected
+        assert total == len(expected)
+        assert pages == -(-total // 40)
+
+    def test_filters_are_applied_in_sql(self):
+        """Test que les filtres réduisent les lignes et le total."""
+        params = {"departement": "Commercial,Consulting", "age_min": 30, "age_max": 40}
+        response = self.client.get("/employees", params={**params, "limit": 100, "sort": "age"})
+        payload = response.json()
+
+        db = SessionLocal()
+        try:
+            expected = (
+                db.query(Employee)
+                .filter(Employee.departement.in_(["Commercial", "Consulting"]))
+                .filter(Employee.age.between(30, 40))
+                .count()
+            )
+        finally:
+            db.close()
+
+        assert payload["total"] == expected
+        ages = [employee["age"] for employee in payload["employees"]]
+        assert ages == sorted(ages)
+        assert all(30 <= age <= 40 for age in ages)
+        assert {e["departement"] for e in payload["employees"]} <= {"Commercial", "Consulting"}
+
+    def test_search_is_applied_in_sql(self):
+        """Test que la recherche texte filtre les lignes et le total, sans casse."""
+        payload = self.client.get("/employees", params={"search": "cOnSuLt", "limit": 100}).json()
+
+        db = SessionLocal()
+        try:
+            expected = (
+                db.query(Employee)
+                .filter(
+                    Employee.poste.ilike("%consult%")
+                    | Employee.departement.ilike("%consult%")
+                    | Employee.domaine_etude.ilike("%consult%")
+                    | Employee.statut_marital.ilike("%consult%")
+                )
+                .count()
+            )
+        finally:
+            db.close()
+
+        assert 0 < payload["total"] == expected
+        assert all(
+            "consult" in " ".join([e["poste"], e["departement"], e["domaine_etude"]]).lower()
+            for e in payload["employees"]
+        )
+
+    def test_search_wildcards_are_literal(self):
+        """Test que % et _ saisis ne sont pas des jokers."""
+        payload = self.client.get("/employees", params={"search": "%"}).json()
+        assert payload["total"] == 0
+
+    def test_last_page_has_no_cursor(self):
+        """Test qu'une page couvrant tout le reste ne renvoie pas de curseur."""
+        payload = self.client.get(
+            "/employees", params={"departement": "Ressources Humaines"}
+        ).json()
+        assert payload["total"] == len(payload["employees"])
+        assert payload["next_cursor"] is None
+
+    def test_arrow_carries_next_cursor(self):
+        """Test que le curseur est transmis dans les métadonnées Arrow."""
+        response = self.client.get(
+            "/employees",
+            params={"limit": 10, "fields": "age"},
+            headers={"Accept": ARROW_STREAM_MEDIA_TYPE},
+        )
+        df = arrow_to_frame(response.content)
+        following = self.client.get(
+            "/employees", params={"limit": 10, "fields": "age", "cursor": df.attrs["next_cursor"]}
+        ).json()
+        assert following["employees"][0]["id"] == df["id"].iloc[-1] + 1
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"sort": "inconnu"},
+            {"cursor": "pas-un-curseur"},
+            {"sort": "age", "cursor": "WyJpZCIsMTAsMTBd"},
+        ],
+    )
+    def test_invalid_sort_or_cursor(self, params):
+        """Test qu'un tri inconnu ou un curseur invalide (ou d'un autre tri) donne un 400."""
+        response = self.client.get("/employees", params=params)
+        assert response.status_code == 400
@@ -1,9 +1,13 @@
 """Tests fonctionnels pour l'endpoint de prédiction API."""
 
+import json
+
+import pandas as pd
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch
 from main import app
+from utils.api_client import arrow_to_frame
 
 
 @pytest.mark.api
@@ -80,7 +84,6 @@ class TestPredictionAPI:
             for key in ["attrition_risk", "attrition_probability", "prediction", "risk_level"]
         )
 
-    @pytest.mark.skip(reason="TODO: Corriger la gestion des données vides dans l'API (erreur 500)")
     @pytest.mark.api
     @pytest.mark.functional
     def test_predict_endpoint_empty_data(self):
@@ -253,3 +256,121 @@ class TestPredictionAPI:
         # Pas de NaN ou inf
         assert data["attrition_probability"] == data["attrition_probability"]  # Pas de NaN
         assert abs(data["attrition_probability"]) < float("inf")  # Pas de inf
+
+
+@pytest.mark.api
+@pytest.mark.functional
+class TestBatchPredictionAPI:
+    """Tests pour l'endpoint /predict/batch."""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self):
+        """Setup du client de test."""
+        self.client = TestClient(app)
+
+    def test_raw_export_records(self):
+        """Test que des lignes brutes de dataset_employe.csv sont scorées directement."""
+        raw = pd.read_csv("data/dataset_employe.csv").head(20)
+        records = json.loads(raw.to_json(orient="records"))
+
+        response = self.client.post("/predict/batch", json={"employees": records})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 20
+        assert [item["id"] for item in data["predictions"]] == raw["id_employee"].tolist()
+        for item in data["predictions"]:
+            assert 0 <= item["attrition_probability"] <= 1
+            assert item["risk_level"] in ["Faible", "Moyen", "Élevé", "Très élevé"]
+
+    def test_batch_matches_single_predictions(self):
+        """Test que le lot donne les mêmes résultats que /predict, dans le même ordre."""
+        records = json.loads(
+            pd.read_csv("data/export-api/test_employees.csv").head(5).to_json(orient="records")
+        )
+
+        batch = self.client.post("/predict/batch", json={"employees": records}).json()
+        singles = [self.client.post("/predict", json=record).json() for record in records]
+
+        for item, single in zip(batch["predictions"], singles, strict=True):
+            assert item["id"] is None
+            assert item["attrition_probability"] == single["attrition_probability"]
+            assert item["risk_level"] == single["risk_level"]
+
+    def test_arrow_format(self):
+        """Test que les scores peuvent être reçus en flux Arrow."""
+        records = json.loads(
+            pd.read_csv("data/dataset_employe.csv").head(10).to_json(orient="records")
+        )
+        expected = self.client.post("/predict/batch", json={"employees": records}).json()
+
+        response = self.client.post(
+            "/predict/batch",
+            json={"employees": records},
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+        assert response.status_code == 200
+
+        df = arrow_to_frame(response.content)
+        assert df.attrs["total"] == 10
+        assert df["id"].tolist() == [item["id"] for item in expected["predictions"]]
+        assert df["risk_level"].tolist() == [item["risk_level"] for item in expected["predictions"]]
+
+    def test_empty_batch(self):
+        """Test d'un lot vide."""
+        response = self.client.post("/predict/batch", json={"employees": []})
+        assert response.status_code == 200
+        assert response.json() == {"total": 0, "predictions": []}
+
+    def test_score_by_id_matches_predict(self):
+        """Test que le score par ID équivaut à /predict avec la fiche de l'employé."""
+        employee = self.client.get("/employees/5").json()
+
+        response = self.client.get("/employees/5/prediction")
+        assert response.status_code == 200
+        assert response.json() == self.client.post("/predict", json=employee).json()
+
+    def test_score_by_id_unknown_employee(self):
+        """Test qu'un ID inconnu donne un 404."""
+        response = self.client.get("/employees/999999/prediction")
+        assert response.status_code == 404
+
+    def test_team_scoring_matches_single_predictions(self):
+        """Test que le scoring d'une équipe équivaut au score par ID de chacun."""
+        response = self.client.get(
+            "/predict/employees",
+            params={"departement": "Ressources Humaines", "fields": "poste,departement"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["total"] == len(data["predictions"]) > 0
+        for item in data["predictions"][:5]:
+            assert item["departement"] == "Ressources Humaines"
+            single = self.client.get(f"/employees/{item['id']}/prediction").json()
+            assert item["attrition_probability"] == single["attrition_probability"]
+            assert item["risk_level"] == single["risk_level"]
+
+    def test_team_scoring_arrow(self):
+        """Test le scoring d'une équipe en flux Arrow, filtré par poste."""
+        response = self.client.get(
+            "/predict/employees",
+            params={"poste": "Tech Lead", "fields": "poste"},
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+        df = arrow_to_frame(response.content)
+        assert df.attrs["total"] == len(df) > 0
+        assert set(df["poste"]) == {"Tech Lead"}
+        assert df["id"].is_monotonic_increasing
+
+    def test_team_scoring_too_large(self, monkeypatch):
+        """Test qu'une équipe au-delà de la limite est refusée."""
+        monkeypatch.setattr("main.MAX_SCORED_SELECTION", 10)
+        response = self.client.get("/predict/employees")
+        assert response.status_code == 400
+
+    def test_batch_too_large(self):
+        """Test qu'un lot trop grand est refusé."""
+        records = [{"age": 30}] * 5001
+        response = self.client.post("/predict/batch", json={"employees": records})
+        assert response.status_code == 400
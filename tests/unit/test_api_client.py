@@ -1,8 +1,15 @@
 """Tests unitaires pour le client API."""
 
+import itertools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
+import requests
 from unittest.mock import Mock, patch
-from utils.api_client import APIClient
+from utils import api_client as api_client_module
+from utils.api_client import CONNECT_TIMEOUT, APIClient
 
 
 @pytest.fixture
@@ -21,6 +28,39 @@ def mock_response():
     return mock
 
 
+@pytest.fixture
+def flaky_server():
+    """Serveur HTTP local : 503 au premier appel de chaque chemin, puis 200."""
+    calls = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self):
+            calls[self.path] = calls.get(self.path, 0) + 1
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            status = 503 if calls[self.path] == 1 else 200
+            body = json.dumps({"calls": calls[self.path]}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = _reply
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", calls
+    server.shutdown()
+    server.server_close()
+
+
 class TestAPIClient:
     """Tests pour la classe APIClient."""
 
@@ -29,7 +69,7 @@ class TestAPIClient:
         assert api_client.base_url == "http://test-api:8000"
         assert api_client.timeout == 10
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_health_check_success(self, mock_request, api_client, mock_response):
         """Test le health check avec succès."""
         mock_request.return_value = mock_response
@@ -38,7 +78,7 @@ class TestAPIClient:
         assert result == {"status": "healthy"}
         mock_request.assert_called_once()
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_health_check_failure(self, mock_request, api_client):
         """Test le health check avec échec."""
         import requests
@@ -50,7 +90,7 @@ class TestAPIClient:
 
         assert "Erreur API : Connection error" in str(exc_info.value)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_employees(self, mock_request, api_client):
         """Test la récupération des employés."""
         mock_response = Mock()
@@ -68,7 +108,7 @@ class TestAPIClient:
         assert len(result["employees"]) == 1
         mock_request.assert_called_once()
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_employee(self, mock_request, api_client):
         """Test la récupération d'un employé spécifique."""
         mock_response = Mock()
@@ -98,3 +138,527 @@ class TestAPIClient:
             # Filtre par âge
             result = api_client.filter_employees(age_min=30)
             assert len(result) == 2
+
+    @patch("requests.Session.request")
+    def test_get_employees_with_fields(self, mock_request, api_client, mock_response):
+        """Test que les colonnes demandées sont transmises au paramètre `fields`."""
+        mock_request.return_value = mock_response
+
+        api_client.get_employees(skip=0, limit=10, fields=["id", "age", "poste"])
+
+        params = mock_request.call_args.kwargs["params"]
+        assert params["fields"] == "id,age,poste"
+
+    @patch("requests.Session.request")
+    def test_get_employees_frame_decodes_arrow(self, mock_request, api_client):
+        """Test que la réponse Arrow est décodée en DataFrame typé."""
+        import pyarrow as pa
+
+        table = pa.table({"id": [1, 2], "age": [41, None], "poste": ["Manager", "Consultant"]})
+        table = table.replace_schema_metadata({b"total": b"294"})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "application/vnd.apache.arrow.stream"}
+        mock_response.content = sink.getvalue().to_pybytes()
+        mock_request.return_value = mock_response
+
+        df = api_client.get_employees_frame(limit=2, fields=["age", "poste"])
+
+        assert "application/vnd.apache.arrow.stream" in (
+            mock_request.call_args.kwargs["headers"]["Accept"]
+        )
+        assert df.attrs["total"] == 294
+        assert df["id"].tolist() == [1, 2]
+        assert str(df["age"].dtype) == "Int64"
+
+    @patch("requests.Session.request")
+    def test_get_employees_frame_json_fallback(self, mock_request, api_client):
+        """Test le repli JSON quand l'API ne propose pas Arrow."""
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.json.return_value = {"total": 1, "employees": [{"id": 7, "age": 30}]}
+        mock_request.return_value = mock_response
+
+        df = api_client.get_employees_frame()
+
+        assert df.attrs["total"] == 1
+        assert df.to_dict("records") == [{"id": 7, "age": 30}]
+
+    @patch("requests.Session.request")
+    def test_get_employees_frame_cursor_sort_and_filters(self, mock_request, api_client):
+        """Test que curseur, tri et filtres sont transmis à l'API (skip omis)."""
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.json.return_value = {
+            "total": 40,
+            "employees": [{"id": 7}],
+            "next_cursor": "abc",
+        }
+        mock_request.return_value = mock_response
+
+        df = api_client.get_employees_frame(
+            limit=20,
+            sort="-age",
+            cursor="xyz",
+            filters={"departement": ["Commercial", "Consulting"], "age_min": None},
+        )
+
+        assert mock_request.call_args.kwargs["params"] == {
+            "sort": "-age",
+            "departement": "Commercial,Consulting",
+            "limit": 20,
+            "cursor": "xyz",
+        }
+        assert df.attrs == {"total": 40, "next_cursor": "abc"}
+
+    @patch("requests.Session.request")
+    def test_conditional_get_reuses_response_on_304(self, mock_request, api_client):
+        """Test qu'un 304 renvoie la réponse gardée et que l'ETag est renvoyé."""
+        first = Mock()
+        first.status_code = 200
+        first.headers = {"ETag": '"42-json"', "Last-Modified": "Thu, 01 Jan 2026 12:00:00 GMT"}
+        first.json.return_value = {"id": 1, "poste": "Manager"}
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {"ETag": '"42-json"'}
+        mock_request.side_effect = [first, not_modified]
+
+        assert api_client.get_employee(1) == {"id": 1, "poste": "Manager"}
+        assert api_client.get_employee(1) == {"id": 1, "poste": "Manager"}
+
+        headers = mock_request.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"42-json"'
+        assert headers["If-Modified-Since"] == "Thu, 01 Jan 2026 12:00:00 GMT"
+        not_modified.json.assert_not_called()
+
+    @patch("requests.Session.request")
+    def test_msgpack_is_negotiated(self, mock_request, api_client):
+        """Test que MessagePack est demandé puis décodé selon le Content-Type."""
+        msgpack = pytest.importorskip("msgpack")
+        body = {"total": 1, "employees": [{"id": 1, "age": 41}], "next_cursor": None}
+        mock_request.return_value = Mock(
+            status_code=200,
+            headers={"content-type": "application/msgpack"},
+            content=msgpack.packb(body),
+        )
+
+        assert api_client.get_employees(limit=1) == body
+        assert mock_request.call_args.kwargs["headers"]["Accept"].startswith("application/msgpack")
+
+    @patch("requests.Session.request")
+    def test_json_without_msgpack(self, mock_request, api_client, monkeypatch):
+        """Test que, sans le paquet msgpack, le client reste en JSON."""
+        monkeypatch.setattr(api_client_module, "msgpack", None)
+        mock_request.return_value = Mock(
+            status_code=200, headers={"content-type": "application/json"}
+        )
+        mock_request.return_value.json.return_value = {"total": 0, "employees": []}
+
+        assert api_client.get_employees(limit=1) == {"total": 0, "employees": []}
+        assert "Accept" not in (mock_request.call_args.kwargs.get("headers") or {})
+
+    @patch("requests.Session.request")
+    def test_get_employees_by_ids_single_get(self, mock_request, api_client):
+        """Test qu'une petite sélection part en un seul GET /employees?ids=."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"total": 1, "employees": [{"id": 3}], "missing": [9]}
+        mock_request.return_value = mock_response
+
+        result = api_client.get_employees_by_ids([3, 9, 3], fields=["age"])
+
+        assert result["missing"] == [9]
+        mock_request.assert_called_once()
+        assert mock_request.call_args.kwargs["params"] == {"ids": "3,9", "fields": "age"}
+
+    @patch("requests.Session.request")
+    def test_get_employees_by_ids_large_selection(self, mock_request, api_client):
+        """Test qu'une grande sélection passe par POST, par paquets, dans l'ordre."""
+
+        def respond(method, url, json=None, **kwargs):
+            response = Mock()
+            response.json.return_value = {
+                "total": len(json["ids"]),
+                "employees": [{"id": i} for i in json["ids"]],
+                "missing": [],
+            }
+            return response
+
+        mock_request.side_effect = respond
+        ids = list(range(1500, 0, -1))
+
+        result = api_client.get_employees_by_ids(ids)
+
+        assert mock_request.call_count == 2
+        assert mock_request.call_args.args[0] == "POST"
+        assert [employee["id"] for employee in result["employees"]] == ids
+
+    def test_timeout_per_endpoint(self, api_client):
+        """Test que chaque endpoint a son délai de lecture (défaut : self.timeout)."""
+        with patch("requests.Session.request") as mock_request:
+            api_client.predict_batch([])
+            assert mock_request.call_args.kwargs["timeout"] == (CONNECT_TIMEOUT, 60)
+
+            api_client.get_employee(3)
+            assert mock_request.call_args.kwargs["timeout"] == (CONNECT_TIMEOUT, 10)
+
+
+class TestSessionTransport:
+    """Tests du transport HTTP réel (pool keep-alive et nouvelles tentatives)."""
+
+    def test_idempotent_call_is_retried(self, flaky_server):
+        """Test qu'un GET ayant reçu un 503 transitoire est retenté."""
+        url, calls = flaky_server
+        client = APIClient(base_url=url)
+
+        assert client.health_check() == {"calls": 2}
+        client.close()
+
+    def test_post_is_not_retried(self, flaky_server):
+        """Test qu'un POST n'est pas rejoué automatiquement."""
+        url, calls = flaky_server
+        client = APIClient(base_url=url)
+
+        with pytest.raises(Exception, match="503"):
+            client.predict_attrition({"age": 30})
+        assert calls["/predict"] == 1
+        client.close()
+
+
+def cached_response(body, etag=None):
+    """Réponse simulée, avec ETag optionnel."""
+    response = Mock()
+    response.status_code = 200
+    response.headers = {"ETag": etag} if etag else {}
+    response.json.return_value = body
+    return response
+
+
+class TestResponseCache:
+    """Tests pour le cache de réponses de APIClient."""
+
+    @pytest.fixture
+    def cached_client(self):
+        return APIClient(base_url="http://test-api:8000", cache=True)
+
+    @patch("requests.Session.request")
+    def test_fresh_response_served_without_request(self, mock_request, cached_client):
+        """Test qu'une réponse encore fraîche est resservie sans requête."""
+        mock_request.return_value = cached_response({"total": 1, "employees": []})
+
+        cached_client.get_employees(limit=10)
+        cached_client.get_employees(limit=10)
+        cached_client.get_employees(limit=20)
+
+        assert mock_request.call_count == 2
+        assert cached_client.cache.stats()["hits"] == 1
+        assert cached_client.cache.stats()["misses"] == 2
+
+    @patch("requests.Session.request")
+    def test_expired_response_is_revalidated(self, mock_request, cached_client):
+        """Test qu'une entrée expirée est revalidée par ETag et prolongée sur 304."""
+        not_modified = Mock(status_code=304, headers={})
+        mock_request.side_effect = [cached_response({"id": 1}, etag='"7-json"'), not_modified]
+        cached_client.cache.ttls["/employees/{id}"] = 0
+
+        assert cached_client.get_employee(1) == {"id": 1}
+        assert cached_client.get_employee(1) == {"id": 1}
+
+        assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"7-json"'
+        stats = cached_client.cache.stats()
+        assert stats["revalidated"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @patch("requests.Session.request")
+    def test_304_after_eviction_refetches(self, mock_request, cached_client):
+        """Test qu'un 304 sur une entrée évincée entre-temps relance une requête complète."""
+        not_modified = Mock(status_code=304, headers={"ETag": '"7-json"'})
+        responses = iter(
+            [
+                cached_response({"id": 1}, etag='"7-json"'),
+                not_modified,
+                cached_response({"id": 1, "poste": "Manager"}, etag='"8-json"'),
+            ]
+        )
+
+        def respond(method, url, **kwargs):
+            response = next(responses)
+            if response is not_modified:
+                # Éviction par une autre session pendant la requête conditionnelle
+                cached_client.cache.clear()
+            return response
+
+        mock_request.side_effect = respond
+        cached_client.cache.ttls["/employees/{id}"] = 0
+
+        cached_client.get_employee(1)
+        assert cached_client.get_employee(1) == {"id": 1, "poste": "Manager"}
+
+        assert mock_request.call_count == 3
+        assert "If-None-Match" not in (mock_request.call_args.kwargs.get("headers") or {})
+        not_modified.json.assert_not_called()
+
+    @patch("requests.Session.request")
+    def test_lru_eviction(self, mock_request, cached_client):
+        """Test que l'entrée la moins récemment utilisée est évincée."""
+        mock_request.return_value = cached_response({"id": 0})
+        cached_client.cache.max_entries = 2
+
+        cached_client.get_employee(1)
+        cached_client.get_employee(2)
+        cached_client.get_employee(1)
+        cached_client.get_employee(3)
+        cached_client.get_employee(1)
+        cached_client.get_employee(2)
+
+        assert mock_request.call_count == 4
+        assert cached_client.cache.stats()["evictions"] == 2
+
+    @patch("requests.Session.request")
+    def test_posts_are_not_cached(self, mock_request, cached_client):
+        """Test que les prédictions (POST) ne passent pas par le cache."""
+        mock_request.return_value = cached_response({"prediction": 0})
+
+        cached_client.predict_attrition({"age": 30})
+        cached_client.predict_attrition({"age": 30})
+
+        assert mock_request.call_count == 2
+        assert cached_client.cache.stats()["entries"] == 0
+
+
+def paged_responses(total=250, cursor=False):
+    """Simule GET /employees : pages par skip, ou par curseur (sans total)."""
+
+    def respond(method, url, params=None, **kwargs):
+        start = int(params.get("cursor") or params.get("skip") or 0)
+        ids = list(range(start + 1, min(start + params["limit"], total) + 1))
+        payload = {"employees": [{"id": i} for i in ids]}
+        if cursor:
+            payload["next_cursor"] = str(ids[-1]) if ids and ids[-1] < total else None
+        else:
+            payload["total"] = total
+        response = Mock()
+        response.headers = {"content-type": "application/json"}
+        response.json.return_value = payload
+        return response
+
+    return respond
+
+
+class TestIterEmployees:
+    """Tests pour iter_employees."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    @patch("requests.Session.request")
+    def test_walks_all_pages_in_order(self, mock_request, api_client, prefetch):
+        """Test que toute la table est parcourue, dans l'ordre, page par page."""
+        mock_request.side_effect = paged_responses()
+
+        ids = [employee["id"] for employee in api_client.iter_employees(prefetch=prefetch)]
+
+        assert ids == list(range(1, 251))
+        assert mock_request.call_count == 3
+
+    @patch("requests.Session.request")
+    def test_frames(self, mock_request, api_client):
+        """Test le parcours en DataFrame (un par page)."""
+        mock_request.side_effect = paged_responses()
+
+        frames = list(api_client.iter_employees(page_size=100, as_frames=True))
+
+        assert [len(frame) for frame in frames] == [100, 100, 50]
+
+    @patch("requests.Session.request")
+    def test_cursor_pagination(self, mock_request, api_client):
+        """Test que le curseur renvoyé par l'API remplace skip."""
+        mock_request.side_effect = paged_responses(total=120, cursor=True)
+
+        ids = [employee["id"] for employee in api_client.iter_employees(page_size=50)]
+
+        assert ids == list(range(1, 121))
+        assert mock_request.call_args.kwargs["params"]["cursor"] == "100"
+        assert "skip" not in mock_request.call_args.kwargs["params"]
+
+    @patch("requests.Session.request")
+    def test_early_stop_fetches_at_most_one_page_ahead(self, mock_request, api_client):
+        """Test qu'un arrêt anticipé ne parcourt pas le reste de la table."""
+        mock_request.side_effect = paged_responses(total=10_000)
+
+        iterator = api_client.iter_employees()
+        assert len(list(itertools.islice(iterator, 5))) == 5
+        iterator.close()
+
+        assert mock_request.call_count <= 2
+
+
+def scoring_api(with_batch=True, with_score_by_id=False):
+    """
+    Simule GET /, /predict, /predict/batch et le score par ID.
+
+    Un enregistrement "bad" est refusé ; la fiche de l'employé n vaut {"id": n}.
+    """
+    calls = []
+
+    def respond(method, url, json=None, **kwargs):
+        path = url.split("test-api:8000", 1)[1]
+        calls.append(path)
+        response = Mock()
+        response.headers = {}
+        if path == "/":
+            endpoints = {"predict_attrition": "/predict"}
+            if with_batch:
+                endpoints["predict_batch"] = "/predict/batch"
+            if with_score_by_id:
+                endpoints["predict_employee"] = "/employees/{id}/prediction"
+            response.json.return_value = {"endpoints": endpoints}
+        elif path.startswith("/employees/") and path.endswith("/prediction"):
+            response.json.return_value = {"prediction": int(path.split("/")[2]) % 2}
+        elif path.startswith("/employees/"):
+            response.json.return_value = {"id": int(path.split("/")[2])}
+        elif path == "/predict/batch" and not any("bad" in r for r in json["employees"]):
+            predictions = [{"id": r["id"], "prediction": r["id"] % 2} for r in json["employees"]]
+            response.json.return_value = {"total": len(predictions), "predictions": predictions}
+        elif path == "/predict" and "bad" not in json:
+            response.json.return_value = {"prediction": json["id"] % 2}
+        else:
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError("422")
+        return response
+
+    return respond, calls
+
+
+class TestPredictMany:
+    """Tests pour predict_many."""
+
+    @patch("requests.Session.request")
+    def test_batch_endpoint_preserves_order(self, mock_request, api_client):
+        """Test le scoring par lots : ordre conservé et progression rapportée."""
+        mock_request.side_effect, calls = scoring_api()
+        records = [{"id": i} for i in range(25)]
+        progress = []
+
+        result = api_client.predict_many(
+            records, chunk_size=10, progress=lambda done, total: progress.append((done, total))
+        )
+
+        assert [p["id"] for p in result.predictions] == list(range(25))
+        assert result.errors == {} and result.succeeded == 25
+        assert calls.count("/predict/batch") == 3 and "/predict" not in calls
+        assert sorted(progress)[-1] == (25, 25)
+
+    @patch("requests.Session.request")
+    def test_failed_chunk_isolates_record_errors(self, mock_request, api_client):
+        """Test qu'un lot refusé est rejoué un par un et que seule l'erreur est isolée."""
+        mock_request.side_effect, calls = scoring_api()
+        records = [{"id": i} for i in range(6)]
+        records[4]["bad"] = True
+
+        result = api_client.predict_many(records, chunk_size=3)
+
+        assert list(result.errors) == [4]
+        assert result.predictions[4] is None
+        scored = [p["prediction"] for i, p in enumerate(result.predictions) if i != 4]
+        assert scored == [0, 1, 0, 1, 1]
+        assert calls.count("/predict") == 3
+
+    @patch("requests.Session.request")
+    def test_fallback_to_single_calls(self, mock_request, api_client):
+        """Test le repli sur /predict quand l'API n'annonce pas de lot."""
+        mock_request.side_effect, calls = scoring_api(with_batch=False)
+
+        result = api_client.predict_many([{"id": i} for i in range(5)], max_concurrency=2)
+
+        assert [p["prediction"] for p in result.predictions] == [0, 1, 0, 1, 0]
+        assert calls.count("/predict") == 5 and "/predict/batch" not in calls
+
+
+class TestEmployeeStats:
+    """Tests pour get_employee_stats (agrégats côté API)."""
+
+    @patch("requests.Session.request")
+    def test_stats_fetched_in_one_call(self, mock_request, api_client):
+        """Test que les agrégats sont demandés en une requête, filtres compris."""
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.json.return_value = {"total": 2, "departements": []}
+        mock_request.return_value = mock_response
+
+        result = api_client.get_employee_stats({"departement": ["Consulting"], "age_min": 30})
+
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.args[1].endswith("/employees/stats")
+        assert mock_request.call_args.kwargs["params"] == {
+            "departement": "Consulting",
+            "age_min": 30,
+        }
+        assert result == {"total": 2, "departements": []}
+
+
+class TestSearchEmployees:
+    """Tests pour search_employees (recherche côté API)."""
+
+    @patch("requests.Session.request")
+    def test_search_sent_in_one_call(self, mock_request, api_client):
+        """Test que la recherche est déléguée à l'API en une seule requête."""
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.json.return_value = {"total": 1, "employees": [{"id": 7}]}
+        mock_request.return_value = mock_response
+
+        result = api_client.search_employees("Consultant", limit=5)
+
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.args[1].endswith("/employees")
+        assert mock_request.call_args.kwargs["params"] == {"search": "Consultant", "limit": 5}
+        assert result == [{"id": 7}]
+
+
+class TestPredictSelection:
+    """Tests pour predict_selection (scoring d'une équipe)."""
+
+    @patch("requests.Session.request")
+    def test_filters_and_fields_sent_in_one_call(self, mock_request, api_client):
+        """Test qu'une équipe est scorée en un seul GET /predict/employees."""
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.json.return_value = {
+            "total": 1,
+            "predictions": [{"id": 3, "attrition_risk": 42.0, "poste": "Manager"}],
+        }
+        mock_request.return_value = mock_response
+
+        df = api_client.predict_selection(
+            filters={"departement": ["Consulting"], "poste": ["Manager"]}, fields=["poste"]
+        )
+
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.args[1].endswith("/predict/employees")
+        assert mock_request.call_args.kwargs["params"] == {
+            "fields": "poste",
+            "departement": "Consulting",
+            "poste": "Manager",
+        }
+        assert df.to_dict("records") == [{"id": 3, "attrition_risk": 42.0, "poste": "Manager"}]
+
+
+class TestPredictEmployee:
+    """Tests pour predict_employee (score par ID)."""
+
+    @patch("requests.Session.request")
+    def test_score_by_id(self, mock_request, api_client):
+        """Test que le score par ID est utilisé sans charger la fiche."""
+        mock_request.side_effect, calls = scoring_api(with_score_by_id=True)
+
+        assert api_client.predict_employee(7) == {"prediction": 1}
+        assert calls == ["/", "/employees/7/prediction"]
+
+    @patch("requests.Session.request")
+    def test_fallback_sends_record_to_predict(self, mock_request, api_client):
+        """Test le repli sur /predict avec la fiche, chargée si elle n'est pas fournie."""
+        mock_request.side_effect, calls = scoring_api()
+
+        assert api_client.predict_employee(7) == {"prediction": 1}
+        assert api_client.predict_employee(8, {"id": 8}) == {"prediction": 0}
+        assert calls == ["/", "/employees/7", "/predict", "/predict"]
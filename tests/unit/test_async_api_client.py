@@ -0,0 +1,130 @@
+"""Tests unitaires pour le client API asynchrone et sa façade synchrone."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from utils.async_api_client import AsyncAPIClient, AsyncAPIFacade, gather_limited
+
+TOTAL = 250
+
+
+def employees_handler(state):
+    """Transport simulé : pages de /employees, sélection par IDs, /health."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        state["requests"].append(request)
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+
+        if request.url.path == "/health":
+            return httpx.Response(200, json={"status": "healthy"})
+        if request.url.path == "/employees":
+            skip = int(request.url.params["skip"])
+            limit = int(request.url.params["limit"])
+            ids = range(skip + 1, min(skip + limit, TOTAL) + 1)
+            return httpx.Response(
+                200, json={"total": TOTAL, "employees": [{"id": i, "age": 30} for i in ids]}
+            )
+        if request.url.path == "/employees/batch":
+            ids = json.loads(request.content)["ids"]
+            return httpx.Response(
+                200,
+                json={
+                    "total": len(ids),
+                    "employees": [{"id": i} for i in ids if i <= TOTAL],
+                    "missing": [i for i in ids if i > TOTAL],
+                },
+            )
+        return httpx.Response(404, json={"detail": "Not Found"})
+
+    return handler
+
+
+@pytest.fixture
+def state():
+    return {"in_flight": 0, "max_in_flight": 0, "requests": []}
+
+
+@pytest.fixture
+def transport(state):
+    return httpx.MockTransport(employees_handler(state))
+
+
+@pytest.mark.unit
+class TestAsyncAPIClient:
+    """Tests pour AsyncAPIClient."""
+
+    def test_fetch_all_pages_concurrently(self, transport, state):
+        """Test que toutes les pages sont récupérées, dans l'ordre, en parallèle bornée."""
+
+        async def scenario():
+            async with AsyncAPIClient("http://test-api", 2, transport=transport) as client:
+                return await client.fetch_all_employees_frame(fields=["age"], page_size=50)
+
+        df = asyncio.run(scenario())
+
+        assert df["id"].tolist() == list(range(1, TOTAL + 1))
+        assert df.attrs["total"] == TOTAL
+        assert len(state["requests"]) == 5
+        assert state["max_in_flight"] == 2
+
+    def test_fetch_employees_by_ids_keeps_order(self, transport, state):
+        """Test que la sélection par paquets conserve l'ordre et agrège les absents."""
+        ids = [300, 5, 120, 7, 999]
+
+        async def scenario():
+            async with AsyncAPIClient("http://test-api", transport=transport) as client:
+                return await client.fetch_employees_by_ids(ids, chunk_size=2)
+
+        result = asyncio.run(scenario())
+
+        assert [employee["id"] for employee in result["employees"]] == [5, 120, 7]
+        assert result["missing"] == [300, 999]
+        assert len(state["requests"]) == 3
+
+    def test_http_error_message(self, transport):
+        """Test qu'une erreur HTTP est remontée comme pour APIClient."""
+
+        async def scenario():
+            async with AsyncAPIClient("http://test-api", transport=transport) as client:
+                await client.get_employee(1)
+
+        with pytest.raises(Exception, match="Erreur API"):
+            asyncio.run(scenario())
+
+    def test_gather_limited_propagates_errors(self):
+        """Test que la première erreur d'un fan-out est propagée."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        async def ok():
+            return 1
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(gather_limited([ok, fail, ok], 2))
+
+
+@pytest.mark.unit
+class TestAsyncAPIFacade:
+    """Tests pour la façade synchrone."""
+
+    def test_blocking_calls_and_gather(self, transport, state):
+        """Test les appels bloquants et l'exécution simultanée de plusieurs appels."""
+        facade = AsyncAPIFacade("http://test-api", transport=transport)
+        try:
+            assert facade.health_check() == {"status": "healthy"}
+
+            health, page = facade.gather(
+                facade.client.health_check(), facade.client.get_employees(limit=10)
+            )
+            assert health["status"] == "healthy"
+            assert len(page["employees"]) == 10
+            assert state["max_in_flight"] == 2
+        finally:
+            facade.close()
@@ -0,0 +1,106 @@
+"""Tests unitaires pour l'insertion en masse."""
+
+import math
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import IntegrityError
+
+import database.bulk as bulk
+from database.bulk import bulk_insert, prepare_frame
+from database.models import Employee
+
+TABLE = Employee.__table__
+
+
+@pytest.fixture
+def frame():
+    """Petit DataFrame au format de l'export CSV (avec une colonne inconnue)."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "genre": ["F", "M", None],
+            "age": [41.0, math.nan, 37.0],
+            "revenu_mensuel": [5993, 5130, 2090],
+            "satisfaction_moyenne": [2.5, 3.25, math.nan],
+            "colonne_inconnue": ["x", "y", "z"],
+        }
+    )
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    TABLE.create(engine)
+    yield engine
+    engine.dispose()
+
+
+def read_back(engine):
+    columns = [TABLE.c[name] for name in ("id", "genre", "age", "revenu_mensuel")]
+    with engine.connect() as conn:
+        return [tuple(row) for row in conn.execute(select(*columns).order_by(TABLE.c.id))]
+
+
+EXPECTED = [(1, "F", 41, 5993), (2, "M", None, 5130), (3, None, 37, 2090)]
+
+
+@pytest.mark.unit
+class TestPrepareFrame:
+    """Tests pour la conversion vectorisée des colonnes."""
+
+    def test_columns_and_types(self, frame):
+        """Test que seules les colonnes de la table sont gardées, en types Python natifs."""
+        prepared = prepare_frame(frame, TABLE)
+
+        assert list(prepared.columns) == [
+            "id",
+            "genre",
+            "age",
+            "revenu_mensuel",
+            "satisfaction_moyenne",
+        ]
+        first = list(prepared.iloc[0])
+        assert first == [1, "F", 41, 5993, 2.5]
+        assert [type(value) for value in first] == [int, str, int, int, float]
+
+    def test_missing_values_become_none(self, frame):
+        """Test que NaN / None deviennent None."""
+        prepared = prepare_frame(frame, TABLE)
+
+        assert prepared.loc[1, "age"] is None
+        assert prepared.loc[2, "genre"] is None
+        assert prepared.loc[2, "satisfaction_moyenne"] is None
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestBulkInsert:
+    """Tests pour bulk_insert."""
+
+    def test_driver_executemany_in_batches(self, engine, frame):
+        """Test de l'insertion SQLite par lots (executemany natif)."""
+        with engine.begin() as conn:
+            result = bulk_insert(conn, TABLE, frame, batch_size=2)
+
+        assert (result.rows, result.batches) == (3, 2)
+        assert read_back(engine) == EXPECTED
+
+    def test_core_executemany(self, engine, frame, monkeypatch):
+        """Test du chemin insert Core (autres moteurs, schéma compact)."""
+        monkeypatch.setattr(bulk, "_uses_driver_executemany", lambda conn, table: False)
+        with engine.begin() as conn:
+            result = bulk_insert(conn, TABLE, frame, batch_size=10)
+
+        assert (result.rows, result.batches) == (3, 1)
+        assert read_back(engine) == EXPECTED
+
+    def test_rollback_on_error(self, engine, frame):
+        """Test que l'import est atomique (doublon d'ID dans le second lot)."""
+        duplicated = pd.concat([frame, frame.head(1)], ignore_index=True)
+        with pytest.raises(IntegrityError):
+            with engine.begin() as conn:
+                bulk_insert(conn, TABLE, duplicated, batch_size=3)
+
+        assert read_back(engine) == []
@@ -0,0 +1,110 @@
+"""Tests unitaires pour les données de graphiques pré-agrégées."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.chart_data import (
+    box_summary,
+    density_grid,
+    histogram_bins,
+    population_summary,
+    stratified_sample,
+)
+
+
+@pytest.fixture
+def population():
+    """Population synthétique de 50 000 employés, départements déséquilibrés."""
+    rng = np.random.default_rng(0)
+    n = 50_000
+    return pd.DataFrame(
+        {
+            "departement": rng.choice(
+                ["Commercial", "Consulting", "Ressources Humaines"], size=n, p=[0.3, 0.69, 0.01]
+            ),
+            "annee_experience_totale": rng.integers(0, 40, size=n),
+            "revenu_mensuel": rng.normal(6000, 2000, size=n).round(),
+        }
+    )
+
+
+@pytest.mark.unit
+class TestChartData:
+    """Tests pour utils.chart_data."""
+
+    def test_histogram_counts_every_value(self, population):
+        """Test que les classes couvrent toute la population en nbins lignes."""
+        bins = histogram_bins(population["revenu_mensuel"], nbins=20)
+        assert len(bins) == 20
+        assert bins["count"].sum() == len(population)
+
+    def test_histogram_ignores_missing(self):
+        """Test que les valeurs manquantes sont ignorées."""
+        bins = histogram_bins(pd.Series([1, None, 3]), nbins=2)
+        assert bins["count"].tolist() == [1, 1]
+
+    def test_box_summary_matches_tukey(self):
+        """Test les quartiles et des moustaches arrêtées avant la valeur aberrante."""
+        summary = box_summary(pd.Series([1, 2, 3, 4, 5, 6, 7, 8, 100]))
+        assert (summary["q1"], summary["median"], summary["q3"]) == (3, 5, 7)
+        assert summary["lowerfence"] == 1
+        assert summary["upperfence"] == 8
+        assert summary["count"] == 9
+
+    def test_stratified_sample_is_bounded_and_proportional(self, population):
+        """Test la taille bornée, les parts par groupe et la présence des petits groupes."""
+        sample = stratified_sample(population, "departement", n=1000)
+
+        assert len(sample) <= 1000
+        shares = sample["departement"].value_counts(normalize=True)
+        expected = population["departement"].value_counts(normalize=True)
+        assert (shares - expected).abs().max() < 0.02
+        assert "Ressources Humaines" in shares.index
+
+    def test_stratified_sample_keeps_small_frames(self):
+        """Test qu'une petite population est renvoyée telle quelle."""
+        df = pd.DataFrame({"departement": ["A", "B"], "x": [1, 2]})
+        assert stratified_sample(df, "departement", n=10) is df
+
+    def test_density_grid_shape(self, population):
+        """Test que la grille est bornée et compte tous les points."""
+        x, y, counts = density_grid(
+            population, "annee_experience_totale", "revenu_mensuel", bins=30
+        )
+        assert (len(x), len(y), counts.shape) == (30, 30, (30, 30))
+        assert counts.sum() == len(population)
+
+    def test_population_summary_is_bounded(self, population):
+        """Test que le résumé a une taille fixe et reste cohérent avec la population."""
+        population = population.assign(
+            age=np.arange(len(population)) % 40 + 20,
+            genre=np.where(np.arange(len(population)) % 3, "M", "F"),
+            satisfaction_moyenne=np.arange(len(population)) % 4 + 1.0,
+        )
+        summary = population_summary(population, sample_size=1000)
+
+        assert summary["total"] == len(population)
+        assert sum(d["count"] for d in summary["departements"]) == len(population)
+        assert summary["departements"][0]["departement"] == "Consulting"
+        assert sum(b["count"] for b in summary["age_histogram"]) == len(population)
+        assert len(summary["age_histogram"]) == 20
+        assert np.array(summary["density"]["counts"]).shape == (40, 40)
+        assert len(summary["sample"]) <= 1000
+        assert summary["means"]["age"] == pytest.approx(population["age"].mean())
+
+    def test_population_summary_of_empty_frame(self):
+        """Test qu'une sélection vide donne un résumé sans NaN (sérialisable en JSON)."""
+        columns = [
+            "age",
+            "genre",
+            "departement",
+            "revenu_mensuel",
+            "annee_experience_totale",
+            "satisfaction_moyenne",
+        ]
+        summary = population_summary(pd.DataFrame(columns=columns))
+
+        assert summary["total"] == 0
+        assert summary["means"]["age"] is None and summary["revenu_box"] is None
+        assert summary["departements"] == summary["sample"] == []
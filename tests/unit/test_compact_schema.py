@@ -0,0 +1,126 @@
+"""Tests unitaires pour le schéma de stockage compact."""
+
+import pytest
+from sqlalchemy import MetaData, Table, create_engine, insert, inspect, select, text
+
+from database.compact import CATEGORY_COLUMNS, build_compact_table, lookup_table
+from database.migrate_compact import migrate_to_compact, revert_to_standard
+from database.models import Employee
+
+ROWS = [
+    {
+        "id": 1,
+        "genre": "F",
+        "departement": "Consulting",
+        "poste": "Manager",
+        "age": 41,
+        "revenu_mensuel": 5993,
+        "satisfaction_moyenne": 2.5,
+    },
+    {
+        "id": 2,
+        "genre": "M",
+        "departement": "Commercial",
+        "poste": "Consultant",
+        "age": 49,
+        "revenu_mensuel": 5130,
+        "satisfaction_moyenne": 3.25,
+    },
+    {
+        "id": 3,
+        "genre": "M",
+        "departement": "Consulting",
+        "poste": None,
+        "age": 37,
+        "revenu_mensuel": 2090,
+        "satisfaction_moyenne": None,
+    },
+]
+
+
+@pytest.fixture
+def standard_engine(tmp_path):
+    """Base SQLite temporaire au schéma standard avec quelques employés."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'compact.db'}")
+    Employee.__table__.create(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Employee.__table__), ROWS)
+    yield engine
+    engine.dispose()
+
+
+def read_rows(engine, table):
+    columns = [
+        "id",
+        "genre",
+        "departement",
+        "poste",
+        "age",
+        "revenu_mensuel",
+        "satisfaction_moyenne",
+    ]
+    with engine.connect() as conn:
+        result = conn.execute(select(*[table.c[c] for c in columns]).order_by(table.c.id))
+        return [dict(row._mapping) for row in result]
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestCompactSchema:
+    """Tests pour la migration et le décodage du schéma compact."""
+
+    def test_migration_stores_codes(self, standard_engine):
+        """Test que les catégories sont stockées sous forme de codes."""
+        assert migrate_to_compact(standard_engine) == len(ROWS)
+
+        with standard_engine.connect() as conn:
+            codes = conn.execute(text("SELECT departement FROM employees ORDER BY id")).scalars()
+            assert list(codes) == [2, 1, 2]  # codes dans l'ordre alphabétique
+            lookup = conn.execute(text("SELECT value FROM lookup_departement ORDER BY id"))
+            assert list(lookup.scalars()) == ["Commercial", "Consulting"]
+
+    def test_decoded_reads_are_unchanged(self, standard_engine):
+        """Test que la lecture via DictionaryEncoded renvoie les valeurs d'origine."""
+        migrate_to_compact(standard_engine)
+
+        metadata = MetaData()
+        for column in CATEGORY_COLUMNS:
+            lookup_table(metadata, column)
+        reflected = Table("employees", MetaData(), autoload_with=standard_engine)
+        compact = build_compact_table(reflected, metadata)
+
+        assert read_rows(standard_engine, compact) == ROWS
+
+        with standard_engine.connect() as conn:
+            ids = conn.execute(
+                select(compact.c.id).where(compact.c.departement.in_(["Consulting", "RH"]))
+            ).scalars()
+            assert sorted(ids) == [1, 3]
+            ids = conn.execute(select(compact.c.id).where(compact.c.poste.like("Cons%")))
+            assert list(ids.scalars()) == [2]
+
+    def test_revert_roundtrip(self, standard_engine):
+        """Test que le retour au schéma standard restitue les données à l'identique."""
+        migrate_to_compact(standard_engine)
+        assert revert_to_standard(standard_engine) == len(ROWS)
+
+        reflected = Table("employees", MetaData(), autoload_with=standard_engine)
+        assert read_rows(standard_engine, reflected) == ROWS
+
+    def test_indexes_survive_both_migrations(self, standard_engine):
+        """Test que la table recréée garde les index du modèle (ID, paie, clés de tri)."""
+        expected = {index.name for index in Employee.__table__.indexes}
+
+        migrate_to_compact(standard_engine)
+        indexes = {index["name"] for index in inspect(standard_engine).get_indexes("employees")}
+        assert indexes == expected
+
+        revert_to_standard(standard_engine)
+        indexes = {index["name"] for index in inspect(standard_engine).get_indexes("employees")}
+        assert indexes == expected
+
+    def test_migration_refuses_twice(self, standard_engine):
+        """Test qu'une base déjà compacte n'est pas migrée une seconde fois."""
+        migrate_to_compact(standard_engine)
+        with pytest.raises(RuntimeError):
+            migrate_to_compact(standard_engine)
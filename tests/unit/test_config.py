@@ -159,3 +159,51 @@ class TestDatabaseConfiguration:
             modules_to_delete = [key for key in sys.modules.keys() if key.startswith("database")]
             for module in modules_to_delete:
                 del sys.modules[module]
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestSQLiteProfile:
+    """Tests pour le profil de performance SQLite."""
+
+    def test_pragmas_applied_on_connect(self, tmp_path):
+        """Test que les PRAGMAs du profil sont appliqués à chaque connexion."""
+        from sqlalchemy import text
+        from database.config import create_sqlite_engine
+
+        engine = create_sqlite_engine(tmp_path / "profile.db")
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+        engine.dispose()
+
+    def test_pool_without_pre_ping(self, tmp_path):
+        """Test que le pool est dimensionné et sans ping à chaque emprunt."""
+        from database.config import create_sqlite_engine
+
+        engine = create_sqlite_engine(tmp_path / "pool.db", pool_size=4, max_overflow=2)
+        assert engine.pool.size() == 4
+        assert engine.pool._pre_ping is False
+        engine.dispose()
+
+    def test_read_only_mode_rejects_writes(self, tmp_path):
+        """Test que le mode lecture seule refuse les écritures."""
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+        from database.config import create_sqlite_engine
+
+        db_path = tmp_path / "ro.db"
+        writer = create_sqlite_engine(db_path)
+        with writer.begin() as conn:
+            conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+        writer.dispose()
+
+        reader = create_sqlite_engine(db_path, read_only=True)
+        with reader.connect() as conn:
+            assert conn.execute(text("SELECT x FROM t")).scalar() == 1
+            with pytest.raises(OperationalError):
+                conn.execute(text("INSERT INTO t VALUES (2)"))
+        reader.dispose()
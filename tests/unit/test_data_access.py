@@ -0,0 +1,96 @@
+"""Tests unitaires pour la couche d'accès aux données des pages Streamlit."""
+
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from utils import data_access
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client API simulé et caches Streamlit vidés avant et après le test."""
+    client = Mock()
+    client.get_employees_frame.side_effect = lambda **kwargs: pd.DataFrame({"id": [1, 2]})
+    client.get_employee.side_effect = lambda employee_id: {"id": employee_id}
+    client.get_data_version.return_value = {"version": 1}
+    monkeypatch.setattr(data_access, "get_client", lambda: client)
+    data_access.refresh()
+    yield client
+    data_access.refresh()
+
+
+@pytest.mark.unit
+class TestDataAccess:
+    """Tests pour utils.data_access."""
+
+    def test_reruns_reuse_cached_page(self, client):
+        """Test qu'une relance sans changement de version ne refait pas l'appel."""
+        first = data_access.employees_page(0, 100)
+        second = data_access.employees_page(0, 100)
+
+        assert client.get_employees_frame.call_count == 1
+        assert first.equals(second)
+
+    def test_version_change_refetches(self, client):
+        """Test qu'une nouvelle version des données invalide le résultat."""
+        data_access.employee(7)
+        data_access.employee(7)
+        assert client.get_employee.call_count == 1
+
+        # Écriture côté base : la prochaine lecture de la version voit 2
+        client.get_data_version.return_value = {"version": 2}
+        data_access.data_version.clear()
+        data_access.employee(7)
+
+        assert data_access.data_version() == 2
+        assert client.get_employee.call_count == 2
+
+    def test_refresh_clears_caches(self, client):
+        """Test que le rafraîchissement manuel force une nouvelle lecture."""
+        data_access.employee(7)
+        data_access.refresh()
+        data_access.employee(7)
+
+        assert client.get_employee.call_count == 2
+        client.cache.clear.assert_called()
+
+    def test_stale_snapshot_falls_back_to_api(self, client, monkeypatch):
+        """Test qu'un snapshot d'une ancienne version des données n'est pas servi."""
+        monkeypatch.setattr(data_access, "current_version", lambda: "v1")
+        monkeypatch.setattr(data_access, "snapshot_manifest", lambda version: {"data_version": 1})
+        assert data_access.current_snapshot() == "v1"
+
+        client.get_data_version.return_value = {"version": 2}
+        data_access.data_version.clear()
+        assert data_access.current_snapshot() is None
+
+    def test_stats_cached_per_filters(self, client):
+        """Test que les agrégats sont en cache par filtre et transmis tels quels à l'API."""
+        client.get_employee_stats.side_effect = lambda filters: {"total": 3}
+
+        data_access.employee_stats({"departement": ["Consulting"]})
+        data_access.employee_stats({"departement": ["Consulting"]})
+        data_access.employee_stats()
+
+        assert client.get_employee_stats.call_count == 2
+        client.get_employee_stats.assert_any_call({"departement": ["Consulting"]})
+
+    def test_health_is_cached(self, client):
+        """Test que l'état de l'API est resservi entre deux relances rapprochées."""
+        client.health_check.return_value = {"status": "healthy"}
+
+        assert data_access.health() == data_access.health() == {"status": "healthy"}
+        assert client.health_check.call_count == 1
+
+
+@pytest.mark.unit
+def test_client_keeps_nothing_without_revalidation():
+    """Test que le client de la couche ne resert aucune réponse sans revalidation."""
+    client = data_access.get_client()
+
+    assert client is data_access.get_client()
+    assert client.cache.ttl_for("/employees") == 0
+    assert client.cache.ttl_for("/employees/12") == 0
+    assert client.flight.ttl == 0
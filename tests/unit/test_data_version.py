@@ -0,0 +1,85 @@
+"""Tests unitaires pour la version des données et les validateurs HTTP."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+
+from api.conditional import is_not_modified, validator_headers
+from database.data_version import DataVersionInfo, bump_data_version, read_data_version
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'version.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestDataVersion:
+    """Tests pour bump_data_version et read_data_version."""
+
+    def test_bump_is_strictly_increasing(self, engine):
+        """Test que chaque écriture donne une version plus grande."""
+        with engine.begin() as conn:
+            first = bump_data_version(conn)
+            second = bump_data_version(conn)
+            third = bump_data_version(conn)
+
+        assert first < second < third
+        with engine.connect() as conn:
+            assert read_data_version(conn).version == third
+
+    def test_rolled_back_write_keeps_version(self, engine):
+        """Test qu'une écriture annulée ne change pas la version."""
+        with engine.begin() as conn:
+            version = bump_data_version(conn)
+
+        with pytest.raises(RuntimeError):
+            with engine.begin() as conn:
+                bump_data_version(conn)
+                raise RuntimeError("échec de l'écriture")
+
+        with engine.connect() as conn:
+            assert read_data_version(conn).version == version
+
+
+@pytest.mark.unit
+class TestIsNotModified:
+    """Tests pour is_not_modified."""
+
+    @pytest.fixture
+    def headers(self):
+        return validator_headers(DataVersionInfo(7, datetime(2026, 1, 1, 12, 0, 30)), "json")
+
+    @pytest.mark.parametrize(
+        "if_none_match, expected",
+        [
+            ('"7-json"', True),
+            ('W/"7-json"', True),
+            ('"1-json", "7-json"', True),
+            ("*", True),
+            ('"6-json"', False),
+        ],
+    )
+    def test_if_none_match(self, headers, if_none_match, expected):
+        """Test la comparaison des ETag (faibles, listes, joker)."""
+        assert is_not_modified(headers, if_none_match, None) is expected
+
+    def test_if_none_match_takes_precedence(self, headers):
+        """Test qu'If-Modified-Since est ignoré en présence d'If-None-Match."""
+        assert not is_not_modified(headers, '"6-json"', headers["Last-Modified"])
+
+    @pytest.mark.parametrize(
+        "since, expected",
+        [
+            ("Thu, 01 Jan 2026 12:00:30 GMT", True),
+            ("Thu, 01 Jan 2026 12:00:29 GMT", False),
+            ("pas une date", False),
+        ],
+    )
+    def test_if_modified_since(self, headers, since, expected):
+        """Test la comparaison de dates à la seconde près."""
+        assert is_not_modified(headers, None, since) is expected
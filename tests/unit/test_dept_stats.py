@@ -0,0 +1,165 @@
+"""Tests unitaires pour les statistiques de revenu incrémentales."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, delete, select
+
+from database.bulk import bulk_insert, bulk_upsert
+from database.dept_stats import (
+    PAY_COLUMNS,
+    apply_pay_changes,
+    histogram_median,
+    load_pay_medians,
+    pay_rows,
+    rebuild_pay_stats,
+)
+from database.models import Employee, PayGroupStats
+from utils.features import pay_medians
+
+TABLE = Employee.__table__
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    TABLE.create(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def population():
+    """Quelques groupes département/niveau avec des revenus variés."""
+    rng = np.random.default_rng(42)
+    size = 200
+    return pd.DataFrame(
+        {
+            "id": range(1, size + 1),
+            "departement": rng.choice(["Commercial", "Consulting", "RH"], size),
+            "niveau_hierarchique_poste": rng.integers(1, 4, size),
+            "revenu_mensuel": rng.integers(1000, 20000, size),
+        }
+    )
+
+
+def read_table(connection) -> pd.DataFrame:
+    columns = [TABLE.c.id, *[TABLE.c[name] for name in PAY_COLUMNS], TABLE.c.sous_paye_niveau_dept]
+    rows = connection.execute(select(*columns).order_by(TABLE.c.id)).all()
+    return pd.DataFrame(rows, columns=[column.key for column in columns])
+
+
+def assert_matches_full_recompute(connection):
+    """Médianes et indicateurs identiques à un recalcul complet par pandas."""
+    df = read_table(connection)
+    expected = pay_medians(df)
+    stored = load_pay_medians(connection)
+    pd.testing.assert_series_equal(
+        stored.sort_index(), expected.sort_index(), check_names=False, check_index_type=False
+    )
+
+    keys = pd.MultiIndex.from_frame(df[["departement", "niveau_hierarchique_poste"]])
+    flags = (df["revenu_mensuel"] < expected.reindex(keys).to_numpy()).astype(int)
+    assert (df["sous_paye_niveau_dept"] == flags).all()
+
+    counts = df.groupby(["departement", "niveau_hierarchique_poste"]).size()
+    stats = pd.DataFrame(connection.execute(select(PayGroupStats.__table__)).all())
+    assert stats["count"].sum() == counts.sum() == len(df)
+
+
+@pytest.mark.unit
+class TestHistogramMedian:
+    """Tests pour histogram_median."""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 50])
+    def test_matches_numpy_median(self, size):
+        """Test que la médiane d'un histogramme est celle des valeurs dépliées."""
+        values = np.random.default_rng(size).integers(0, 10, size)
+        distinct, counts = np.unique(values, return_counts=True)
+
+        assert histogram_median(distinct, counts) == np.median(values)
+
+    def test_empty_histogram(self):
+        """Test qu'un groupe vide n'a pas de médiane."""
+        assert histogram_median(np.array([]), np.array([], dtype=int)) is None
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestIncrementalPayStats:
+    """Tests pour rebuild_pay_stats et apply_pay_changes."""
+
+    def test_rebuild_sets_medians_and_flags(self, engine, population):
+        """Test que la reconstruction équivaut au calcul pandas."""
+        with engine.begin() as conn:
+            bulk_insert(conn, TABLE, population)
+            assert (
+                rebuild_pay_stats(conn)
+                == population.groupby(["departement", "niveau_hierarchique_poste"]).ngroups
+            )
+            assert_matches_full_recompute(conn)
+
+    def test_inserts_updates_and_deletes_stay_exact(self, engine, population):
+        """Test qu'une suite d'écritures incrémentales reste égale au recalcul complet."""
+        rng = np.random.default_rng(0)
+        with engine.begin() as conn:
+            bulk_insert(conn, TABLE, population.iloc[:120])
+            apply_pay_changes(conn, pay_rows(conn, []), population.iloc[:120])
+
+        for _ in range(10):
+            ids = rng.choice(population["id"], 15, replace=False)
+            rows = population.set_index("id").loc[ids].reset_index()
+            rows["revenu_mensuel"] = rng.integers(1000, 20000, len(rows))
+            with engine.begin() as conn:
+                before = pay_rows(conn, rows["id"].tolist())
+                bulk_upsert(conn, TABLE, rows)
+                apply_pay_changes(conn, before, rows)
+
+                removed = rows["id"].head(2).tolist()
+                before = pay_rows(conn, removed)
+                conn.execute(delete(TABLE).where(TABLE.c.id.in_(removed)))
+                apply_pay_changes(conn, before, pd.DataFrame(columns=["id"]))
+
+        with engine.connect() as conn:
+            assert_matches_full_recompute(conn)
+
+    def test_group_change_moves_employee(self, engine, population):
+        """Test qu'un changement de département met à jour les deux groupes."""
+        with engine.begin() as conn:
+            bulk_insert(conn, TABLE, population)
+            rebuild_pay_stats(conn)
+
+            moved = population.iloc[[0]].assign(departement="Direction")
+            before = pay_rows(conn, moved["id"].tolist())
+            bulk_upsert(conn, TABLE, moved)
+            apply_pay_changes(conn, before, moved)
+
+            assert_matches_full_recompute(conn)
+            assert load_pay_medians(conn)[("Direction", moved.iloc[0, 2])] == float(
+                moved.iloc[0, 3]
+            )
+
+    def test_rewritten_rows_in_unchanged_group_keep_flags(self, engine, population):
+        """Test qu'une ligne réécrite sans changement de revenu retrouve son indicateur."""
+        with engine.begin() as conn:
+            bulk_insert(conn, TABLE, population)
+            rebuild_pay_stats(conn)
+
+            # Ligne réécrite à l'identique (indicateur remis à NULL par l'écriture)
+            # et changement de revenu dans un autre groupe, dans la même écriture
+            same = population.iloc[[0]]
+            other_group = population[
+                (population["departement"] != same.iloc[0]["departement"])
+                | (
+                    population["niveau_hierarchique_poste"]
+                    != same.iloc[0]["niveau_hierarchique_poste"]
+                )
+            ].iloc[[0]]
+            rows = pd.concat([same, other_group.assign(revenu_mensuel=25000)])
+            rows = rows.assign(sous_paye_niveau_dept=None)
+            before = pay_rows(conn, rows["id"].tolist())
+            bulk_upsert(conn, TABLE, rows)
+            apply_pay_changes(conn, before, rows)
+
+            assert read_table(conn)["sous_paye_niveau_dept"].notna().all()
+            assert_matches_full_recompute(conn)
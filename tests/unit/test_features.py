@@ -0,0 +1,119 @@
+"""Tests unitaires pour le feature engineering partagé."""
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.features import (
+    CATEGORICAL_FEATURES,
+    MODEL_FEATURES,
+    NUMERIC_FEATURES,
+    derive_features,
+    model_frame,
+    normalize_flag,
+    parse_percentage,
+)
+from utils.scoring import risk_levels
+
+RAW_CSV = "data/dataset_employe.csv"
+PREPARED_CSV = "data/export-api/test_employees.csv"
+DERIVED = [
+    "satisfaction_moyenne",
+    "distance_categorie",
+    "parent_burnout",
+    "sous_paye_niveau_dept",
+    "augementation_salaire_precedente",
+]
+
+
+@pytest.mark.unit
+class TestConversions:
+    """Tests pour les conversions de colonnes brutes."""
+
+    def test_parse_percentage(self):
+        """Test des différents formats de pourcentage."""
+        values = pd.Series(["11 %", "23%", " 12,5 % ", None, "n/a"])
+        parsed = parse_percentage(values)
+
+        assert parsed.tolist()[:3] == [11.0, 23.0, 12.5]
+        assert parsed.iloc[3:].isna().all()
+
+    def test_normalize_flag(self):
+        """Test que Y/Oui/True/1 et N/Non/False/0 sont ramenés aux modalités du modèle."""
+        values = pd.Series(["Y", "oui", "True", "1", "N", "Non", "false", "?"])
+        normalized = normalize_flag(values, "Oui", "Non").tolist()
+
+        assert normalized == ["Oui"] * 4 + ["Non"] * 3 + ["?"]
+
+    def test_model_features_match_training(self):
+        """Test que l'ordre des colonnes est celui de l'entraînement."""
+        assert MODEL_FEATURES == joblib.load("data/export-api/original_features.joblib")
+
+
+@pytest.mark.unit
+class TestDeriveFeatures:
+    """Tests pour derive_features et model_frame."""
+
+    def test_raw_export_matches_prepared_export(self):
+        """Test que les colonnes dérivées d'un export brut sont celles de l'export préparé."""
+        raw = pd.read_csv(RAW_CSV)
+        prepared = pd.read_csv(PREPARED_CSV)
+        keys = [c for c in prepared.columns if c in raw.columns and c not in DERIVED]
+
+        merged = prepared.merge(derive_features(raw), on=keys, suffixes=("_ref", "_new"))
+        assert len(merged) == len(prepared)
+        for column in DERIVED:
+            reference, derived = merged[f"{column}_ref"], merged[f"{column}_new"]
+            if column == "distance_categorie":
+                assert (reference == derived).all()
+            else:
+                np.testing.assert_allclose(reference.astype(float), derived.astype(float))
+
+    def test_prepared_records_are_unchanged(self):
+        """Test qu'un enregistrement déjà préparé traverse model_frame sans changement."""
+        prepared = pd.read_csv(PREPARED_CSV)
+        frame = model_frame(prepared)
+
+        pd.testing.assert_frame_equal(
+            frame[CATEGORICAL_FEATURES], prepared[CATEGORICAL_FEATURES].astype(object)
+        )
+        pd.testing.assert_frame_equal(
+            frame[NUMERIC_FEATURES].astype(float), prepared[NUMERIC_FEATURES].astype(float)
+        )
+
+    def test_explicit_values_win(self):
+        """Test qu'une colonne dérivée fournie n'est pas recalculée."""
+        df = pd.DataFrame(
+            {
+                "distance_domicile_travail": [5, 15],
+                "distance_categorie": ["20-30 km", None],
+            }
+        )
+        assert derive_features(df)["distance_categorie"].tolist() == ["20-30 km", "10-20 km"]
+
+    def test_reference_medians(self):
+        """Test du calcul de sous_paye_niveau_dept avec une population de référence."""
+        df = pd.DataFrame(
+            {"departement": ["RH", "RH", "IT"], "niveau_hierarchique_poste": [1, 1, 2]}
+        )
+        df["revenu_mensuel"] = [2000, 4000, 3000]
+        derived = derive_features(df, medians={("RH", 1): 3000.0})
+
+        assert derived["sous_paye_niveau_dept"].iloc[:2].tolist() == [1.0, 0.0]
+        assert pd.isna(derived["sous_paye_niveau_dept"].iloc[2])
+
+    def test_empty_record_defaults(self):
+        """Test des valeurs par défaut historiques (0 et "Inconnu")."""
+        frame = model_frame(pd.DataFrame([{}]))
+
+        assert list(frame.columns) == MODEL_FEATURES
+        assert frame["genre"].iloc[0] == "Inconnu"
+        assert frame["age"].iloc[0] == 0
+
+
+@pytest.mark.unit
+def test_risk_levels_thresholds():
+    """Test des seuils vectorisés (bornes incluses dans le niveau supérieur)."""
+    levels = risk_levels([0.0, 0.29, 0.3, 0.6, 0.8, 1.0]).tolist()
+    assert levels == ["Faible", "Faible", "Moyen", "Élevé", "Très élevé", "Très élevé"]
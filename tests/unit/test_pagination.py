@@ -0,0 +1,178 @@
+"""Tests unitaires pour la pagination par curseur (keyset) de /employees."""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import Column, Index, Integer, MetaData, Table, create_engine, insert, select
+
+from api.pagination import (
+    TotalCache,
+    after_position,
+    decode_cursor,
+    encode_cursor,
+    order_by,
+    parse_sort,
+    resume_conditions,
+    sort_expression,
+)
+from database.compact import DictionaryEncoded, lookup_table
+
+# Valeurs triées avec doublons et nulles
+SCORES = [3, None, 1, 3, 2, None, 1, 3]
+
+
+@pytest.fixture
+def table(tmp_path):
+    """Table SQLite (id, score) remplie avec SCORES."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'keyset.db'}")
+    metadata = MetaData()
+    table = Table(
+        "scores", metadata, Column("id", Integer, primary_key=True), Column("score", Integer)
+    )
+    Index("ix_scores_score_id", table.c.score, table.c.id)
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            table.insert(), [{"id": i, "score": score} for i, score in enumerate(SCORES, 1)]
+        )
+    yield engine, table
+    engine.dispose()
+
+
+@pytest.fixture
+def compact_table(tmp_path):
+    """Table (id, departement) encodée par dictionnaire, codes hors ordre alphabétique."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'compact.db'}")
+    metadata = MetaData()
+    lookup = lookup_table(metadata, "departement")
+    table = Table(
+        "employees",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("departement", DictionaryEncoded(lookup)),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        # Valeurs enregistrées au fil des imports : "RH" a reçu le premier code
+        conn.execute(
+            insert(lookup),
+            [{"id": i, "value": v} for i, v in enumerate(["RH", "Consulting", "Commercial"], 1)],
+        )
+        conn.execute(
+            insert(table),
+            [
+                {"id": i, "departement": departement}
+                for i, departement in enumerate(["RH", "Commercial", "Consulting", "RH"], 1)
+            ],
+        )
+    yield engine, table
+    engine.dispose()
+
+
+def keyset_walk(engine, table, descending, page_size, column=None, ranges=False):
+    """
+    Parcourt la table par pages successives en reprenant après la dernière ligne.
+
+    ranges=True reprend plage par plage (resume_conditions) comme GET /employees,
+    sinon par la condition unique after_position.
+    """
+    column = table.c.score if column is None else column
+    id_column = table.c.id
+    ids, position = [], None
+    with engine.connect() as conn:
+        while True:
+            query = select(id_column, column).order_by(*order_by(column, id_column, descending))
+            if position is None:
+                rows = conn.execute(query.limit(page_size)).all()
+            elif ranges:
+                rows = []
+                for condition in resume_conditions(column, id_column, descending, *position):
+                    rows += conn.execute(query.where(condition).limit(page_size - len(rows))).all()
+                    if len(rows) == page_size:
+                        break
+            else:
+                query = query.where(after_position(column, id_column, descending, *position))
+                rows = conn.execute(query.limit(page_size)).all()
+            if not rows:
+                return ids
+            ids += [row.id for row in rows]
+            position = (rows[-1][1], rows[-1].id)
+
+
+@pytest.mark.unit
+class TestPagination:
+    """Tests pour api.pagination."""
+
+    def test_parse_sort(self):
+        """Test le sens du tri et le refus d'une colonne inconnue."""
+        assert parse_sort(None) == ("id", False)
+        assert parse_sort("-age") == ("age", True)
+        with pytest.raises(ValueError, match="Tri inconnu"):
+            parse_sort("salaire")
+
+    def test_cursor_round_trip(self):
+        """Test qu'un curseur restitue sa position et reste lié à son tri."""
+        cursor = encode_cursor("-age", 42, 7)
+        assert decode_cursor(cursor, "-age") == (42, 7)
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "age")
+        with pytest.raises(ValueError):
+            decode_cursor("%%%", "age")
+
+    @pytest.mark.database
+    @pytest.mark.parametrize("ranges", [False, True])
+    @pytest.mark.parametrize("descending", [False, True])
+    @pytest.mark.parametrize("page_size", [1, 2, 3])
+    def test_walk_covers_duplicates_and_nulls(self, table, descending, page_size, ranges):
+        """Test que chaque ligne est servie une fois, nulles en fin, quel que soit le découpage."""
+        engine, scores = table
+        ids = keyset_walk(engine, scores, descending, page_size, ranges=ranges)
+
+        known = [i for i, score in enumerate(SCORES, 1) if score is not None]
+        nulls = [i for i, score in enumerate(SCORES, 1) if score is None]
+        expected = sorted(known, key=lambda i: (SCORES[i - 1], i), reverse=descending)
+        assert ids == expected + (nulls[::-1] if descending else nulls)
+
+    @pytest.mark.database
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_compact_category_sorted_on_value(self, compact_table, descending):
+        """Test qu'une colonne encodée par dictionnaire est triée sur sa valeur, pas son code."""
+        engine, table = compact_table
+        column = sort_expression(table.c.departement)
+        ids = keyset_walk(engine, table, descending, 1, column=column)
+
+        # Commercial (2), Consulting (3), RH (1, 4) ; l'ID départage les égalités
+        assert ids == ([4, 1, 3, 2] if descending else [2, 3, 1, 4])
+
+    @pytest.mark.database
+    @pytest.mark.parametrize("descending", [False, True])
+    @pytest.mark.parametrize("value", [2, None])
+    def test_resume_ranges_search_the_index(self, table, descending, value):
+        """Test que chaque plage de reprise est une recherche dans l'index (colonne, id)."""
+        engine, scores = table
+        column, id_column = scores.c.score, scores.c.id
+        with engine.connect() as conn:
+            for condition in resume_conditions(column, id_column, descending, value, 4):
+                query = (
+                    select(id_column)
+                    .where(condition)
+                    .order_by(*order_by(column, id_column, descending))
+                    .limit(2)
+                )
+                compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+                plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+                details = " ".join(row[-1] for row in plan)
+                assert "SEARCH" in details and "ix_scores_score_id" in details
+
+    def test_total_counted_once_per_version(self):
+        """Test qu'un total est recompté seulement pour une nouvelle version ou un autre filtre."""
+        totals, count = TotalCache(max_entries=2), Mock(return_value=12)
+
+        assert totals.get(1, ("Consulting",), count) == 12
+        assert totals.get(1, ("Consulting",), count) == 12
+        assert count.call_count == 1
+
+        totals.get(2, ("Consulting",), count)
+        totals.get(2, ("RH",), count)
+        totals.get(None, ("RH",), count)
+        assert count.call_count == 4
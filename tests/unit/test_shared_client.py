@@ -0,0 +1,113 @@
+"""Tests unitaires pour le client API partagé (single-flight)."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from utils.shared_client import SharedAPIClient, SingleFlight, get_shared_client
+
+
+def slow_call(counter, delay=0.05, result="ok"):
+    """Appel lent qui compte ses exécutions."""
+
+    def call():
+        counter.append(threading.get_ident())
+        time.sleep(delay)
+        return result
+
+    return call
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Tests pour SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test que des appels simultanés identiques ne s'exécutent qu'une fois."""
+        flight, executions = SingleFlight(ttl=0), []
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(
+                executor.map(lambda _: flight.do("k", slow_call(executions, delay=0.2)), range(10))
+            )
+
+        assert results == ["ok"] * 10
+        assert len(executions) == 1
+        assert flight.stats() == {"calls": 1, "shared": 9}
+
+    def test_result_kept_for_ttl(self):
+        """Test que le résultat est resservi pendant la durée de rétention, puis relu."""
+        flight, executions = SingleFlight(ttl=0.1), []
+
+        flight.do("k", slow_call(executions, delay=0))
+        flight.do("k", slow_call(executions, delay=0))
+        assert len(executions) == 1
+
+        time.sleep(0.15)
+        flight.do("k", slow_call(executions, delay=0))
+        assert len(executions) == 2
+
+    def test_errors_reach_waiters_and_are_not_kept(self):
+        """Test qu'une erreur est transmise aux appelants en attente puis oubliée."""
+        flight = SingleFlight(ttl=10)
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.05)
+            raise RuntimeError("API indisponible")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, "k", failing)
+            started.wait()
+            waiter = executor.submit(flight.do, "k", failing)
+            for future in (leader, waiter):
+                with pytest.raises(RuntimeError, match="indisponible"):
+                    future.result()
+
+        assert flight.do("k", lambda: "rétabli") == "rétabli"
+
+
+@pytest.mark.unit
+class TestSharedAPIClient:
+    """Tests pour SharedAPIClient."""
+
+    @patch("requests.Session.request")
+    def test_identical_gets_share_one_http_call(self, mock_request):
+        """Test que des sessions concurrentes partagent un seul GET /employees."""
+
+        def respond(*args, **kwargs):
+            time.sleep(0.05)
+            response = Mock()
+            response.headers = {}
+            response.json.return_value = {"total": 1, "employees": [{"id": 1}]}
+            return response
+
+        mock_request.side_effect = respond
+        client = SharedAPIClient(base_url="http://test-api:8000")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: client.get_employees(limit=10), range(8)))
+
+        assert mock_request.call_count == 1
+        assert all(result == results[0] for result in results)
+        # Copie par appelant : une clé ajoutée reste locale
+        results[0]["local"] = True
+        assert "local" not in results[1]
+
+    @patch("requests.Session.request")
+    def test_posts_are_not_coalesced(self, mock_request):
+        """Test que les prédictions ne sont pas mutualisées."""
+        mock_request.return_value = Mock(headers={})
+        client = SharedAPIClient(base_url="http://test-api:8000")
+
+        client.predict_attrition({"age": 30})
+        client.predict_attrition({"age": 30})
+
+        assert mock_request.call_count == 2
+
+    def test_process_wide_singleton(self):
+        """Test que toutes les sessions reçoivent le même client."""
+        assert get_shared_client() is get_shared_client()
@@ -0,0 +1,94 @@
+"""Tests unitaires pour l'export et la lecture des snapshots Parquet."""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from database.bulk import bulk_insert
+from database.data_version import bump_data_version
+from database.models import Employee
+from database.snapshot import export_snapshot
+from utils.snapshot import current_version, read_snapshot, snapshot_arrays, snapshot_manifest
+
+TABLE = Employee.__table__
+TEST_CSV = "data/export-api/test_employees.csv"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Base SQLite chargée avec test_employees.csv."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'snapshot.db'}")
+    TABLE.create(engine)
+    df = pd.read_csv(TEST_CSV)
+    df.insert(0, "id", range(1, len(df) + 1))
+    with engine.begin() as conn:
+        bulk_insert(conn, TABLE, df)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestSnapshot:
+    """Tests pour export_snapshot et read_snapshot."""
+
+    def test_export_is_partitioned_and_versioned(self, engine, tmp_path):
+        """Test qu'un export publie une version partitionnée par département."""
+        root = tmp_path / "snapshots"
+        result = export_snapshot(engine, root)
+
+        assert current_version(root) == result.version
+        manifest = snapshot_manifest(root)
+        assert manifest["rows"] == 294
+        assert sum(manifest["partitions"].values()) == 294
+        partitions = sorted(path.name for path in result.path.glob("departement=*"))
+        assert len(partitions) == result.partitions == 3
+
+    def test_round_trip(self, engine, tmp_path):
+        """Test que le snapshot relu est identique au CSV chargé."""
+        root = tmp_path / "snapshots"
+        export_snapshot(engine, root)
+
+        df = read_snapshot(root=root)
+        source = pd.read_csv(TEST_CSV)
+        assert df["id"].tolist() == list(range(1, 295))
+        assert df["departement"].tolist() == source["departement"].tolist()
+        assert df["revenu_mensuel"].tolist() == source["revenu_mensuel"].tolist()
+
+    def test_partition_filter_and_arrays(self, engine, tmp_path):
+        """Test la lecture d'une seule partition en tableaux NumPy."""
+        root = tmp_path / "snapshots"
+        export_snapshot(engine, root)
+
+        arrays = snapshot_arrays(["revenu_mensuel"], departements=["Commercial"], root=root)
+        source = pd.read_csv(TEST_CSV).query("departement == 'Commercial'")
+        assert sorted(arrays["revenu_mensuel"].tolist()) == sorted(source["revenu_mensuel"])
+
+    def test_unchanged_content_is_reused(self, engine, tmp_path):
+        """Test qu'un contenu inchangé ne produit pas de nouvelle version."""
+        root = tmp_path / "snapshots"
+        first = export_snapshot(engine, root)
+
+        assert export_snapshot(engine, root).reused
+        assert not export_snapshot(engine, root, force=True).reused
+        assert current_version(root) != first.version
+
+    def test_manifest_records_data_version(self, engine, tmp_path):
+        """Test que le manifeste suit la version des données, même si le contenu est réutilisé."""
+        root = tmp_path / "snapshots"
+        export_snapshot(engine, root)
+        assert snapshot_manifest(root)["data_version"] is None
+
+        with engine.begin() as conn:
+            version = bump_data_version(conn)
+        assert export_snapshot(engine, root).reused
+        assert snapshot_manifest(root)["data_version"] == version
+
+    def test_with_scores(self, engine, tmp_path):
+        """Test que les scores du modèle sont ajoutés à chaque ligne."""
+        root = tmp_path / "snapshots"
+        export_snapshot(engine, root, with_scores=True)
+
+        df = read_snapshot(["id", "attrition_probability", "risk_level"], root=root)
+        assert df["attrition_probability"].between(0, 1).all()
+        assert df["risk_level"].notna().all()
@@ -0,0 +1,144 @@
+"""Tests unitaires pour l'import en flux avec reprise."""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from database.models import Employee, IngestCheckpoint
+from database.stream_ingest import CSV_FILE, iter_chunks, stream_ingest
+from database.sync import sync_csv
+from utils.features import derive_features
+
+
+class Interrupted(Exception):
+    """Simule un arrêt brutal en cours d'import."""
+
+
+@pytest.fixture
+def export(tmp_path):
+    """Extrait de 10 lignes de dataset_employe.csv."""
+    path = tmp_path / "export.csv"
+    with open(CSV_FILE, encoding="utf-8") as source:
+        path.write_text("".join(source.readline() for _ in range(11)), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}")
+    yield engine
+    engine.dispose()
+
+
+def count(engine, table):
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(table)).scalar()
+
+
+@pytest.mark.unit
+class TestChunks:
+    """Tests pour la lecture par lots et les colonnes dérivées."""
+
+    def test_chunks_cover_file(self, export):
+        """Test que les lots couvrent le fichier et que la reprise saute les lignes lues."""
+        chunks = list(iter_chunks(export, chunk_size=4))
+
+        assert [len(chunk) for chunk, _ in chunks] == [4, 4, 2]
+        assert chunks[-1][1] == export.stat().st_size
+
+        resumed = list(iter_chunks(export, start_offset=chunks[0][1], chunk_size=4))
+        assert resumed[0][0]["id_employee"].tolist() == chunks[1][0]["id_employee"].tolist()
+
+    def test_explicit_dtypes(self, export):
+        """Test que les types ne sont pas inférés."""
+        chunk, _ = next(iter_chunks(export, chunk_size=4))
+
+        assert chunk["age"].dtype == "Int16"
+        assert chunk["genre"].dtype == "string"
+
+    def test_quoted_header(self, export):
+        """Test que les noms de colonnes entre guillemets sont reconnus."""
+        lines = export.read_text(encoding="utf-8").splitlines(keepends=True)
+        names = lines[0].strip().split(",")
+        export.write_text(",".join(f'"{name}"' for name in names) + "\n" + "".join(lines[1:]))
+
+        chunk, _ = next(iter_chunks(export, chunk_size=4))
+        assert list(chunk.columns) == names
+        assert chunk["age"].dtype == "Int16"
+
+    def test_derive_columns(self, export):
+        """Test des colonnes calculées ligne à ligne."""
+        chunk = derive_features(next(iter_chunks(export, chunk_size=1))[0], medians={})
+        row = chunk.iloc[0]
+
+        assert row["id"] == 1
+        assert row["satisfaction_moyenne"] == pytest.approx((2 + 4 + 1 + 1) / 4)
+        assert row["distance_categorie"] == "< 10 km"
+        assert row["augementation_salaire_precedente"] == 11
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestStreamIngest:
+    """Tests pour stream_ingest."""
+
+    def test_full_import(self, engine, export):
+        """Test d'un import complet : toutes les lignes, plus de checkpoint."""
+        progress = stream_ingest(engine, export, chunk_size=4, on_progress=None)
+
+        assert (progress.rows, progress.new_rows) == (10, 10)
+        assert progress.percent == 100.0
+        assert count(engine, Employee.__table__) == 10
+        assert count(engine, IngestCheckpoint.__table__) == 0
+
+    def test_underpaid_flag_follows_whole_population(self, engine, export):
+        """Test que sous_paye_niveau_dept est celui du fichier complet, lot après lot."""
+        stream_ingest(engine, export, chunk_size=3, on_progress=None)
+
+        expected = derive_features(pd.read_csv(export))["sous_paye_niveau_dept"].astype(int)
+        stored = pd.read_sql(select(Employee.sous_paye_niveau_dept).order_by(Employee.id), engine)[
+            "sous_paye_niveau_dept"
+        ]
+        assert stored.tolist() == expected.tolist()
+
+    def test_resume_after_interruption(self, engine, export):
+        """Test qu'un import interrompu reprend après le dernier lot validé."""
+        seen = []
+
+        def stop_after_two_chunks(progress):
+            seen.append(progress.rows)
+            if len(seen) == 2:
+                raise Interrupted
+
+        with pytest.raises(Interrupted):
+            stream_ingest(engine, export, chunk_size=4, on_progress=stop_after_two_chunks)
+        assert count(engine, Employee.__table__) == 8
+
+        progress = stream_ingest(engine, export, chunk_size=4, on_progress=None)
+        assert (progress.rows, progress.new_rows) == (10, 2)
+
+        ids = pd.read_sql(select(Employee.id).order_by(Employee.id), engine)["id"].tolist()
+        assert ids == pd.read_csv(export)["id_employee"].tolist()
+
+    def test_sync_after_import_rewrites_nothing(self, engine, export):
+        """Test que les empreintes enregistrées évitent de tout réécrire à la synchronisation."""
+        stream_ingest(engine, export, chunk_size=4, on_progress=None)
+
+        result = sync_csv(engine, export)
+        assert (result.inserted, result.updated, result.unchanged) == (0, 0, 10)
+
+    def test_other_file_with_same_name_restarts(self, engine, export):
+        """Test qu'un autre fichier de même nom n'hérite pas du checkpoint."""
+
+        def stop_after_first_chunk(progress):
+            raise Interrupted
+
+        with pytest.raises(Interrupted):
+            stream_ingest(engine, export, chunk_size=4, on_progress=stop_after_first_chunk)
+
+        # Nouvel export, plus long, déposé sous le même nom
+        lines = export.read_text(encoding="utf-8").splitlines(keepends=True)
+        export.write_text(lines[0] + "".join(lines[:0:-1]) + lines[1], encoding="utf-8")
+
+        progress = stream_ingest(engine, export, chunk_size=4, on_progress=None)
+        assert (progress.rows, progress.new_rows) == (11, 11)
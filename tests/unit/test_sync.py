@@ -0,0 +1,137 @@
+"""Tests unitaires pour la synchronisation incrémentale."""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from database.bulk import bulk_insert
+from database.dept_stats import rebuild_pay_stats
+from database.models import Employee, EmployeeRowHash, PayBucket, PayGroupStats
+from database.sync import record_row_hashes, sync_csv
+
+TABLE = Employee.__table__
+
+
+@pytest.fixture
+def source():
+    """Export minimal avec ID explicite."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "genre": ["F", "M", "M"],
+            "departement": ["Consulting", "Commercial", "Consulting"],
+            "revenu_mensuel": [5993, 5130, 2090],
+            "satisfaction_moyenne": [2.5, 3.25, 3.0],
+        }
+    )
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'sync.db'}")
+    yield engine
+    engine.dispose()
+
+
+def write(df, path):
+    df.to_csv(path, index=False)
+    return path
+
+
+def read_back(engine):
+    columns = [TABLE.c.id, TABLE.c.departement, TABLE.c.revenu_mensuel]
+    with engine.connect() as conn:
+        return [tuple(row) for row in conn.execute(select(*columns).order_by(TABLE.c.id))]
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestSync:
+    """Tests pour sync_csv."""
+
+    def test_initial_sync_inserts_everything(self, engine, source, tmp_path):
+        """Test qu'une base vide reçoit toutes les lignes."""
+        result = sync_csv(engine, write(source, tmp_path / "export.csv"))
+
+        assert (result.inserted, result.updated, result.unchanged) == (3, 0, 0)
+        assert read_back(engine) == [
+            (1, "Consulting", 5993),
+            (2, "Commercial", 5130),
+            (3, "Consulting", 2090),
+        ]
+
+    def test_unchanged_file_is_skipped(self, engine, source, tmp_path):
+        """Test que le même fichier n'est pas relu."""
+        path = write(source, tmp_path / "export.csv")
+        sync_csv(engine, path)
+
+        assert sync_csv(engine, path).skipped
+        assert not sync_csv(engine, path, force=True).skipped
+
+    def test_only_changed_rows_are_written(self, engine, source, tmp_path):
+        """Test que seules les lignes nouvelles ou modifiées sont upsertées."""
+        path = tmp_path / "export.csv"
+        sync_csv(engine, write(source, path))
+
+        source.loc[1, "revenu_mensuel"] = 6000
+        source.loc[3] = [4, "F", "RH", 3000, 2.0]
+        result = sync_csv(engine, write(source, path))
+
+        assert (result.inserted, result.updated, result.unchanged) == (1, 1, 2)
+        assert read_back(engine)[1] == (2, "Commercial", 6000)
+        assert read_back(engine)[3] == (4, "RH", 3000)
+
+    def test_delete_missing(self, engine, source, tmp_path):
+        """Test que les absents ne sont supprimés qu'avec delete_missing."""
+        path = tmp_path / "export.csv"
+        sync_csv(engine, write(source, path))
+
+        result = sync_csv(engine, write(source.drop(index=0), path))
+        assert result.deleted == 0
+        assert len(read_back(engine)) == 3
+
+        result = sync_csv(engine, path, delete_missing=True, force=True)
+        assert (result.deleted, result.unchanged) == (1, 2)
+        assert [row[0] for row in read_back(engine)] == [2, 3]
+
+    def test_first_sync_after_migration_counts_updates(self, engine, source, tmp_path):
+        """Test que des employés migrés (sans empreinte) ne sont pas comptés comme ajoutés."""
+        TABLE.create(engine)
+        with engine.begin() as conn:
+            bulk_insert(conn, TABLE, source)
+
+        source.loc[3] = [4, "F", "RH", 3000, 2.0]
+        result = sync_csv(engine, write(source, tmp_path / "export.csv"))
+
+        assert (result.inserted, result.updated, result.unchanged) == (1, 3, 0)
+        assert len(read_back(engine)) == 4
+
+    def test_first_sync_after_migration_keeps_pay_stats(self, engine, source, tmp_path):
+        """Test qu'une synchronisation après migration ne compte pas les revenus deux fois."""
+        source["niveau_hierarchique_poste"] = [1, 2, 1]
+        TABLE.create(engine)
+        with engine.begin() as conn:
+            bulk_insert(conn, TABLE, source)
+            rebuild_pay_stats(conn)
+
+        source.loc[0, "revenu_mensuel"] = 6100
+        sync_csv(engine, write(source, tmp_path / "export.csv"))
+
+        with engine.connect() as conn:
+            employees = conn.execute(select(func.count()).select_from(TABLE)).scalar()
+            buckets = conn.execute(select(func.sum(PayBucket.__table__.c.count))).scalar()
+            groups = conn.execute(select(func.sum(PayGroupStats.__table__.c.count))).scalar()
+        assert buckets == groups == employees == 3
+
+    def test_recorded_hashes_skip_migrated_rows(self, engine, source, tmp_path):
+        """Test qu'une migration qui enregistre les empreintes n'entraîne aucune réécriture."""
+        TABLE.create(engine)
+        EmployeeRowHash.__table__.create(engine)
+        with engine.begin() as conn:
+            bulk_insert(conn, TABLE, source)
+            assert record_row_hashes(conn, source) == 3
+
+        source.loc[1, "revenu_mensuel"] = 6000
+        result = sync_csv(engine, write(source, tmp_path / "export.csv"))
+
+        assert (result.inserted, result.updated, result.unchanged) == (0, 1, 2)
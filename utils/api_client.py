@@ -1,45 +1,311 @@
 """Client API réutilisable pour communiquer avec l'API FastAPI."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+import pandas as pd
+import pyarrow as pa
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from typing import Optional, Callable, Dict, Any, Iterator, List, Union
+from urllib3.util.retry import Retry
 from config import API_URL
+from utils.response_cache import CACHE_TTLS, ResponseCache
+
+try:
+    import msgpack
+except ImportError:  # Format binaire optionnel : JSON sinon
+    msgpack = None
+
+# Format binaire colonnaire négocié avec l'API (voir api/serialization.py)
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+# Même structure que le JSON, encodage binaire (si msgpack est installé des deux côtés)
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Connexions HTTP gardées ouvertes (keep-alive) par hôte
+POOL_MAXSIZE = 10
+
+# Nouvelles tentatives des méthodes idempotentes (GET, HEAD, PUT, DELETE...) sur
+# erreur réseau ou 502/503/504 : attente 0.2 s, 0.4 s, 0.8 s + aléa jusqu'à 0.1 s
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.2
+RETRY_JITTER = 0.1
+RETRY_STATUSES = (502, 503, 504)
+
+# Délais (secondes) : établissement de connexion, puis lecture par endpoint
+CONNECT_TIMEOUT = 3.05
+DEFAULT_TIMEOUT = 10
+ENDPOINT_TIMEOUTS = {
+    "/health": 3,
+    "/data-version": 3,
+    "/model-status": 5,
+    "/predict": 15,
+    "/predict/batch": 60,
+    "/predict/employees": 60,
+    "/employees/batch": 30,
+}
+
+# Taille de page maximale acceptée par GET /employees
+EMPLOYEES_PAGE_SIZE = 100
+
+# Scoring de masse (predict_many) : enregistrements par appel /predict/batch
+# (5000 au plus côté API) et appels simultanés
+PREDICT_CHUNK_SIZE = 500
+PREDICT_CONCURRENCY = 4
+
+# Sélection par IDs : GET (revalidable) jusqu'à ce nombre d'IDs, POST au-delà
+SELECTION_GET_MAX_IDS = 100
+# Nombre maximal d'IDs par appel accepté par l'API
+SELECTION_MAX_IDS = 1000
+
+
+def arrow_to_frame(content: bytes) -> pd.DataFrame:
+    """
+    Décode un flux IPC Arrow en DataFrame, sans dictionnaire Python par ligne.
+
+    Les entiers restent entiers (Int64 nullable) même avec des valeurs
+    manquantes ; les métadonnées du schéma (ex. total) sont copiées dans
+    `DataFrame.attrs`.
+
+    Args:
+        content: Corps de réponse application/vnd.apache.arrow.stream
+
+    Returns:
+        DataFrame
+    """
+    table = pa.ipc.open_stream(content).read_all()
+    df = table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+    metadata = table.schema.metadata or {}
+    df.attrs.update(
+        {key.decode(): value.decode() for key, value in metadata.items() if key != b"pandas"}
+    )
+    if "total" in df.attrs:
+        df.attrs["total"] = int(df.attrs["total"])
+    return df
+
+
+def decode_body(response: requests.Response) -> Any:
+    """
+    Corps d'une réponse, décodé selon son Content-Type (MessagePack ou JSON).
+
+    Args:
+        response: Réponse HTTP
+
+    Returns:
+        Contenu décodé (dict, liste...)
+    """
+    content_type = response.headers.get("content-type")
+    if (
+        msgpack is not None
+        and isinstance(content_type, str)
+        and content_type.startswith(MSGPACK_MEDIA_TYPE)
+    ):
+        return msgpack.unpackb(response.content)
+    return response.json()
+
+
+def employee_query_params(
+    fields: Optional[List[str]] = None,
+    sort: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Paramètres de GET /employees pour des colonnes, un tri et des filtres.
+
+    Les filtres vides (None, liste vide) sont omis ; les listes sont jointes
+    par des virgules.
+
+    Returns:
+        Paramètres de requête
+    """
+    params: Dict[str, Any] = {}
+    if fields:
+        params["fields"] = ",".join(fields)
+    if sort:
+        params["sort"] = sort
+    for name, value in (filters or {}).items():
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(item) for item in value)
+        if value is not None and value != "":
+            params[name] = value
+    return params
+
+
+@dataclass
+class PredictManyResult:
+    """Résultat de predict_many, aligné sur les enregistrements d'entrée."""
+
+    # Prédiction de chaque enregistrement (None en cas d'erreur)
+    predictions: List[Optional[Dict[str, Any]]]
+    # Message d'erreur par position d'enregistrement
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> int:
+        """Nombre d'enregistrements scorés."""
+        return len(self.predictions) - len(self.errors)
 
 
 class APIClient:
     """Client pour interagir avec l'API Attrition."""
 
-    def __init__(self, base_url: str = API_URL):
+    def __init__(self, base_url: str = API_URL, cache: bool = False):
         """
         Initialise le client API.
 
         Args:
             base_url: URL de base de l'API
+            cache: Resservir les GET récents sans requête (durées CACHE_TTLS,
+                voir utils/response_cache.py) ; sinon une réponse n'est réutilisée
+                qu'après revalidation par le serveur (304)
         """
         self.base_url = base_url.rstrip("/")
-        self.timeout = 10
+        self.timeout = DEFAULT_TIMEOUT
+        self.timeouts = dict(ENDPOINT_TIMEOUTS)
+        self.session = self._build_session()
+        self.cache = ResponseCache(CACHE_TTLS if cache else None)
+        # Endpoints annoncés par l'API (None : pas encore vérifié)
+        self._endpoints: Optional[set] = None
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Session persistante : pool de connexions keep-alive et nouvelles tentatives."""
+        retry = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF,
+            backoff_jitter=RETRY_JITTER,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            # Le dernier statut d'erreur remonte via raise_for_status
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self):
+        """Ferme les connexions gardées ouvertes."""
+        self.session.close()
+
+    def _timeout_for(self, endpoint: str) -> tuple:
+        """Délais (connexion, lecture) d'un endpoint."""
+        path = "/" + endpoint.strip("/")
+        return CONNECT_TIMEOUT, self.timeouts.get(path, self.timeout)
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict[str, Any]]:
         """
         Effectue une requête HTTP vers l'API.
 
+        MessagePack est préféré au JSON si le paquet msgpack est installé.
+
         Args:
             method: Méthode HTTP (GET, POST, etc.)
             endpoint: Endpoint de l'API
             **kwargs: Arguments supplémentaires pour requests
 
         Returns:
-            Réponse JSON ou None en cas d'erreur
+            Réponse décodée ou None en cas d'erreur
+        """
+        if msgpack is not None:
+            # Les endpoints qui ne négocient pas le format répondent en JSON
+            kwargs["headers"] = {
+                "Accept": f"{MSGPACK_MEDIA_TYPE}, application/json;q=0.9",
+                **(kwargs.get("headers") or {}),
+            }
+        return decode_body(self._send(method, endpoint, **kwargs))
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Effectue une requête HTTP et renvoie la réponse brute (corps binaire compris).
+
+        La connexion est réutilisée d'un appel à l'autre ; les méthodes
+        idempotentes sont retentées sur erreur transitoire (voir _build_session).
+
+        Les GET passent par le cache : réponse encore fraîche resservie telle
+        quelle, sinon requête conditionnelle (ETag / Last-Modified) dont le 304
+        réutilise la réponse gardée. Si l'entrée a été évincée entre-temps, la
+        requête est refaite sans validateurs.
+
+        Raises:
+            Exception: Erreur réseau ou statut HTTP d'erreur
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("timeout", self._timeout_for(endpoint))
+
+        key = None
+        headers = kwargs.get("headers")
+        if method.upper() == "GET":
+            key = self._cache_key(method, url, kwargs)
+            ttl = self.cache.ttl_for(endpoint)
+            entry = self.cache.get(key)
+            if entry is not None and entry.fresh:
+                self.cache.record("hit")
+                return entry.response
+            if entry is not None:
+                kwargs["headers"] = {**(headers or {}), **self._validators(entry.response)}
 
         try:
-            response = requests.request(method, url, **kwargs)
+            response = self.session.request(method, url, **kwargs)
+            if key is not None and response.status_code == 304:
+                cached = self.cache.refresh(key, ttl)
+                if cached is not None:
+                    self.cache.record("revalidated")
+                    return cached
+                # Entrée évincée (LRU) depuis la lecture : le 304 n'a pas de corps
+                kwargs["headers"] = headers
+                response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
-            return response.json()
         except requests.exceptions.RequestException as e:
             raise Exception(f"Erreur API : {str(e)}")
 
+        if key is not None:
+            self.cache.record("miss")
+            if ttl > 0 or self._validators(response):
+                self.cache.put(key, response, ttl)
+        return response
+
+    @staticmethod
+    def _cache_key(method: str, url: str, kwargs: Dict[str, Any]) -> tuple:
+        """Clé d'une représentation : méthode, URL, paramètres et format demandé."""
+        params = tuple(sorted((kwargs.get("params") or {}).items()))
+        accept = (kwargs.get("headers") or {}).get("Accept", "")
+        return method.upper(), url, params, accept
+
+    @staticmethod
+    def _validators(response: requests.Response) -> Dict[str, str]:
+        """En-têtes conditionnels correspondant aux validateurs d'une réponse."""
+        validators = {}
+        etag = response.headers.get("ETag")
+        if isinstance(etag, str):
+            validators["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if isinstance(last_modified, str):
+            validators["If-Modified-Since"] = last_modified
+        return validators
+
+    def _send_for_frame(
+        self, method: str, endpoint: str, records_key: str, **kwargs
+    ) -> pd.DataFrame:
+        """
+        Requête en négociant le format Arrow ; repli JSON pour une API plus ancienne.
+
+        Returns:
+            DataFrame (attrs["total"] renseigné)
+        """
+        headers = {"Accept": f"{ARROW_STREAM_MEDIA_TYPE}, application/json;q=0.5"}
+        response = self._send(method, endpoint, headers=headers, **kwargs)
+        if response.headers.get("content-type", "").startswith(ARROW_STREAM_MEDIA_TYPE):
+            return arrow_to_frame(response.content)
+
+        payload = response.json()
+        df = pd.DataFrame(payload.get(records_key, []))
+        df.attrs["total"] = payload.get("total", len(df))
+        if payload.get("next_cursor"):
+            df.attrs["next_cursor"] = payload["next_cursor"]
+        return df
+
     def health_check(self) -> Dict[str, Any]:
         """
         Vérifie l'état de l'API.
@@ -49,31 +315,207 @@ class APIClient:
         """
         return self._make_request("GET", "/health")
 
-    def get_employees(self, skip: int = 0, limit: int = 100) -> Dict[str, Any]:
+    def get_data_version(self) -> Dict[str, Any]:
+        """
+        Version courante des données côté API.
+
+        Returns:
+            Dictionnaire contenant 'version' (None si non versionnée) et 'updated_at'
+        """
+        return self._make_request("GET", "/data-version")
+
+    def get_employees(
+        self, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Récupère la liste des employés avec pagination.
 
         Args:
             skip: Nombre d'employés à ignorer
             limit: Nombre maximum d'employés à retourner
+            fields: Colonnes à récupérer (toutes si None, l'ID est toujours inclus)
 
         Returns:
             Dictionnaire contenant 'total' et 'employees'
         """
         params = {"skip": skip, "limit": limit}
+        if fields:
+            params["fields"] = ",".join(fields)
         return self._make_request("GET", "/employees", params=params)
 
-    def get_employee(self, employee_id: int) -> Dict[str, Any]:
+    def get_employees_frame(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> pd.DataFrame:
+        """
+        Récupère une page d'employés directement en DataFrame (format Arrow).
+
+        Args:
+            skip: Nombre d'employés à ignorer (ignoré si `cursor` est fourni)
+            limit: Nombre maximum d'employés à retourner
+            fields: Colonnes à récupérer (toutes si None, l'ID est toujours inclus)
+            sort: Colonne de tri, "-colonne" pour l'ordre décroissant (ID par défaut)
+            cursor: Curseur de la page précédente (df.attrs["next_cursor"])
+            filters: Filtres appliqués par l'API (departement, age_min, age_max)
+
+        Returns:
+            DataFrame des employés ; le total (filtres compris) est dans
+            df.attrs["total"], le curseur suivant dans df.attrs["next_cursor"]
+            (absent sur la dernière page)
+        """
+        params = {**employee_query_params(fields, sort, filters), "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        else:
+            params["skip"] = skip
+        return self._send_for_frame("GET", "/employees", "employees", params=params)
+
+    def _employees_page(self, params: Dict[str, Any], as_frame: bool) -> tuple:
+        """
+        Une page de GET /employees.
+
+        Returns:
+            Tuple (lignes : liste de dicts ou DataFrame, total, curseur suivant ou None)
+        """
+        if as_frame:
+            df = self._send_for_frame("GET", "/employees", "employees", params=params)
+            return df, df.attrs.get("total"), df.attrs.get("next_cursor") or None
+        payload = self._make_request("GET", "/employees", params=params)
+        return payload["employees"], payload.get("total"), payload.get("next_cursor")
+
+    def iter_employees(
+        self,
+        page_size: int = EMPLOYEES_PAGE_SIZE,
+        fields: Optional[List[str]] = None,
+        as_frames: bool = False,
+        prefetch: bool = True,
+        sort: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Union[Dict[str, Any], pd.DataFrame]]:
+        """
+        Parcourt toute la table employees page par page, à la demande.
+
+        La page suivante est demandée dans un thread d'arrière-plan pendant que
+        l'appelant traite la page courante : au plus deux pages sont en mémoire.
+        Si l'API renvoie un curseur (`next_cursor`), il est utilisé à la place
+        de skip pour les pages suivantes.
+
+        Args:
+            page_size: Employés par page (100 au plus côté API)
+            fields: Colonnes à récupérer (toutes si None, l'ID est toujours inclus)
+            as_frames: Produit un DataFrame par page au lieu d'un dict par employé
+            prefetch: Demande la page suivante en arrière-plan
+            sort: Colonne de tri, "-colonne" pour l'ordre décroissant (ID par défaut)
+            filters: Filtres appliqués par l'API (departement, age_min, age_max)
+
+        Yields:
+            Employés (dicts) ou pages (DataFrame, format Arrow)
+        """
+        base_params = {**employee_query_params(fields, sort, filters), "limit": page_size}
+
+        def next_params(skip: int, cursor: Optional[str]) -> Dict[str, Any]:
+            position = {"cursor": cursor} if cursor else {"skip": skip}
+            return {**base_params, **position}
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            skip = 0
+            rows, total, cursor = self._employees_page(next_params(0, None), as_frames)
+            while True:
+                skip += len(rows)
+                # Sans total (mode curseur), une page incomplète est la dernière
+                more = len(rows) > 0 and (
+                    skip < total if total is not None else len(rows) == page_size
+                )
+                pending = None
+                if more and executor is not None:
+                    pending = executor.submit(
+                        self._employees_page, next_params(skip, cursor), as_frames
+                    )
+
+                if as_frames:
+                    yield rows
+                else:
+                    yield from rows
+
+                if not more:
+                    return
+                if pending is not None:
+                    rows, total, cursor = pending.result()
+                else:
+                    rows, total, cursor = self._employees_page(next_params(skip, cursor), as_frames)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_employee(self, employee_id: int, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Récupère un employé spécifique par son ID.
 
         Args:
             employee_id: ID de l'employé
+            fields: Colonnes à récupérer (toutes si None, l'ID est toujours inclus)
 
         Returns:
             Données de l'employé
         """
-        return self._make_request("GET", f"/employees/{employee_id}")
+        params = {"fields": ",".join(fields)} if fields else None
+        return self._make_request("GET", f"/employees/{employee_id}", params=params)
+
+    def get_employees_by_ids(
+        self, ids: List[int], fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Récupère plusieurs employés par IDs en une requête (une requête `IN` côté base).
+
+        Les petites sélections passent par GET /employees?ids= (réponse revalidable
+        par ETag), les grandes par POST /employees/batch, par paquets de
+        SELECTION_MAX_IDS.
+
+        Args:
+            ids: IDs demandés ; l'ordre est conservé
+            fields: Colonnes à récupérer (toutes si None, l'ID est toujours inclus)
+
+        Returns:
+            Dictionnaire contenant 'total', 'employees' (ordre des IDs) et
+            'missing' (IDs introuvables)
+        """
+        ids = list(dict.fromkeys(int(employee_id) for employee_id in ids))
+        if len(ids) <= SELECTION_GET_MAX_IDS:
+            params = {"ids": ",".join(map(str, ids))}
+            if fields:
+                params["fields"] = ",".join(fields)
+            return self._make_request("GET", "/employees", params=params)
+
+        employees, missing = [], []
+        for start in range(0, len(ids), SELECTION_MAX_IDS):
+            payload = {"ids": ids[start : start + SELECTION_MAX_IDS], "fields": fields}
+            result = self._make_request("POST", "/employees/batch", json=payload)
+            employees.extend(result["employees"])
+            missing.extend(result["missing"])
+        return {"total": len(employees), "employees": employees, "missing": missing}
+
+    def get_employee_stats(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Agrégats de la page Statistiques, calculés par l'API (GET /employees/stats).
+
+        Aucune fiche ne transite : la réponse a une taille bornée quelle que
+        soit la population (voir utils/chart_data.population_summary).
+
+        Args:
+            filters: Filtres (departement, poste, age_min, age_max, search ; tous si vide)
+
+        Returns:
+            Dictionnaire total, means, departements, genres, satisfaction,
+            age_histogram, revenu_box, density et sample
+        """
+        params = employee_query_params(filters=filters)
+        return self._make_request("GET", "/employees/stats", params=params)
 
     def filter_employees(
         self,
@@ -131,43 +573,177 @@ class APIClient:
         """
         return self._make_request("POST", "/predict", json=employee_data)
 
-    def search_employees(self, name: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def predict_batch(self, employees: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Recherche des employés par nom (recherche côté client).
+        Prédit le risque d'attrition d'un lot d'employés en un seul appel.
 
         Args:
-            name: Nom ou partie du nom à rechercher
-            limit: Nombre maximum de résultats
+            employees: Enregistrements (bruts ou préparés), 5000 au plus
 
         Returns:
-            Liste d'employés correspondant à la recherche
+            Dictionnaire contenant 'total' et 'predictions' (ordre de la requête)
         """
-        # Récupère tous les employés
-        data = self.get_employees(skip=0, limit=1000)  # Grande limite pour la recherche
-        employees = data.get("employees", [])
+        return self._make_request("POST", "/predict/batch", json={"employees": employees})
 
-        # Recherche insensible à la casse dans le nom et prénom
-        name_lower = name.lower()
-        filtered = []
+    def predict_batch_frame(self, employees: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Prédit un lot d'employés et renvoie les scores en DataFrame (format Arrow).
 
-        for employee in employees:
-            # Combinaison nom/prénom pour la recherche
-            full_name = f"{employee.get('poste', '')} {employee.get('departement', '')}".lower()
+        Args:
+            employees: Enregistrements (bruts ou préparés), 5000 au plus
 
-            # Recherche dans plusieurs champs
-            searchable_text = " ".join(
-                [
-                    str(employee.get("poste", "")),
-                    str(employee.get("departement", "")),
-                    str(employee.get("domaine_etude", "")),
-                    str(employee.get("statut_marital", "")),
-                ]
-            ).lower()
+        Returns:
+            DataFrame id, attrition_probability, attrition_risk, prediction, risk_level
+        """
+        return self._send_for_frame(
+            "POST", "/predict/batch", "predictions", json={"employees": employees}
+        )
 
-            if name_lower in searchable_text or name_lower in full_name:
-                filtered.append(employee)
+    def supports_endpoint(self, path: str) -> bool:
+        """
+        Indique si l'API annonce un endpoint (liste `endpoints` de GET /).
 
-                if len(filtered) >= limit:
-                    break
+        La liste est mémorisée ; une API injoignable n'annonce rien (sans
+        mémorisation, pour revérifier au prochain appel).
 
-        return filtered
+        Args:
+            path: Chemin tel qu'annoncé (ex. "/predict/batch", "/employees/{id}/prediction")
+        """
+        if self._endpoints is None:
+            try:
+                endpoints = self._make_request("GET", "/").get("endpoints", {})
+                self._endpoints = set(endpoints.values())
+            except Exception:
+                return False
+        return path in self._endpoints
+
+    def predict_selection(
+        self, filters: Optional[Dict[str, Any]] = None, fields: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Score en un seul appel tous les employés correspondant à des filtres.
+
+        Les employés sont lus et scorés côté API (GET /predict/employees) : aucune
+        fiche ne transite par le client.
+
+        Args:
+            filters: Filtres (departement, poste, age_min, age_max ; tous les employés si vide)
+            fields: Colonnes de l'employé ajoutées aux scores (ex. ["poste", "departement"])
+
+        Returns:
+            DataFrame id, attrition_probability, attrition_risk, prediction,
+            risk_level et colonnes demandées, trié par ID
+        """
+        params = employee_query_params(fields, None, filters)
+        return self._send_for_frame("GET", "/predict/employees", "predictions", params=params)
+
+    def supports_batch_prediction(self) -> bool:
+        """Indique si l'API annonce /predict/batch."""
+        return self.supports_endpoint("/predict/batch")
+
+    def predict_employee(
+        self, employee_id: int, employee: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Prédit le risque d'attrition d'un employé de la base, par son ID.
+
+        Utilise GET /employees/{id}/prediction si l'API l'annonce (la fiche ne
+        fait pas l'aller-retour) ; sinon envoie la fiche à /predict, en la
+        récupérant d'abord si elle n'est pas fournie.
+
+        Args:
+            employee_id: ID de l'employé
+            employee: Fiche déjà chargée (utilisée seulement sans score par ID)
+
+        Returns:
+            Résultats de la prédiction avec risque, probabilité et niveau
+        """
+        if self.supports_endpoint("/employees/{id}/prediction"):
+            return self._make_request("GET", f"/employees/{employee_id}/prediction")
+        return self.predict_attrition(employee or self.get_employee(employee_id))
+
+    def predict_many(
+        self,
+        records: List[Dict[str, Any]],
+        chunk_size: int = PREDICT_CHUNK_SIZE,
+        max_concurrency: int = PREDICT_CONCURRENCY,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> PredictManyResult:
+        """
+        Score une liste d'enregistrements, par lots envoyés en parallèle.
+
+        Avec /predict/batch, les enregistrements partent par paquets de
+        `chunk_size` ; un paquet refusé est rejoué enregistrement par
+        enregistrement pour isoler les erreurs. Sans lot, chaque enregistrement
+        est envoyé à /predict, `max_concurrency` appels à la fois. Une erreur
+        n'interrompt jamais le reste du scoring.
+
+        Args:
+            records: Enregistrements (bruts ou préparés)
+            chunk_size: Enregistrements par appel /predict/batch
+            max_concurrency: Appels simultanés
+            progress: Appelée avec (enregistrements traités, total) après chaque
+                appel terminé, depuis le thread appelant (utilisable par Streamlit)
+
+        Returns:
+            PredictManyResult dans l'ordre de `records`
+        """
+        total = len(records)
+        result = PredictManyResult(predictions=[None] * total)
+        done = 0
+
+        def report(count: int):
+            nonlocal done
+            done += count
+            if progress is not None:
+                progress(done, total)
+
+        with ThreadPoolExecutor(max_workers=max(max_concurrency, 1)) as executor:
+            if self.supports_batch_prediction():
+                starts = range(0, total, chunk_size)
+                futures = {
+                    executor.submit(self.predict_batch, records[start : start + chunk_size]): start
+                    for start in starts
+                }
+                retry = []
+                for future in as_completed(futures):
+                    start = futures[future]
+                    try:
+                        predictions = future.result()["predictions"]
+                    except Exception:
+                        retry.extend(range(start, min(start + chunk_size, total)))
+                        continue
+                    result.predictions[start : start + len(predictions)] = predictions
+                    report(len(predictions))
+            else:
+                retry = list(range(total))
+
+            futures = {executor.submit(self.predict_attrition, records[i]): i for i in retry}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result.predictions[index] = future.result()
+                except Exception as e:
+                    result.errors[index] = str(e)
+                report(1)
+
+        return result
+
+    def search_employees(self, name: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Recherche des employés par nom (filtre `search` appliqué par l'API).
+
+        La recherche, insensible à la casse, porte sur le poste, le département,
+        le domaine d'étude et le statut marital : une seule requête, quelle que
+        soit la taille de la table.
+
+        Args:
+            name: Nom ou partie du nom à rechercher
+            limit: Nombre maximum de résultats (100 au plus)
+
+        Returns:
+            Liste d'employés correspondant à la recherche
+        """
+        params = employee_query_params(filters={"search": name})
+        params["limit"] = min(limit, EMPLOYEES_PAGE_SIZE)
+        return self._make_request("GET", "/employees", params=params).get("employees", [])
@@ -0,0 +1,329 @@
+"""
+Client API asynchrone (httpx) et façade synchrone pour les pages Streamlit.
+
+AsyncAPIClient reprend les méthodes de APIClient sur un `httpx.AsyncClient`
+unique : toutes les requêtes partagent son pool de connexions keep-alive.
+Les helpers `fetch_all_employees_frame` et `fetch_employees_by_ids` lancent
+plusieurs requêtes en parallèle, au plus `max_concurrency` à la fois.
+
+Streamlit exécute les pages de façon synchrone : AsyncAPIFacade fait tourner
+le client dans une boucle asyncio dédiée (thread d'arrière-plan) et expose
+les mêmes méthodes en appels bloquants, plus `gather` pour lancer plusieurs
+appels en même temps.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import pandas as pd
+
+from config import API_URL
+from utils.api_client import (
+    ARROW_STREAM_MEDIA_TYPE,
+    CONNECT_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    EMPLOYEES_PAGE_SIZE,
+    ENDPOINT_TIMEOUTS,
+    POOL_MAXSIZE,
+    RETRY_TOTAL,
+    SELECTION_MAX_IDS,
+    arrow_to_frame,
+)
+
+# Nombre maximal de requêtes simultanées lancées par les helpers de fan-out
+DEFAULT_CONCURRENCY = 8
+
+
+async def gather_limited(factories: List[Callable[[], Awaitable]], limit: int) -> List[Any]:
+    """
+    Exécute des coroutines en parallèle, au plus `limit` à la fois.
+
+    Args:
+        factories: Fonctions sans argument renvoyant chacune une coroutine
+        limit: Nombre maximal de coroutines en cours
+
+    Returns:
+        Résultats dans l'ordre de `factories` (la première erreur est propagée)
+    """
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def run(factory):
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(*(run(factory) for factory in factories))
+
+
+class AsyncAPIClient:
+    """Client asynchrone pour l'API Attrition (mêmes méthodes que APIClient)."""
+
+    def __init__(
+        self,
+        base_url: str = API_URL,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialise le client API asynchrone.
+
+        Args:
+            base_url: URL de base de l'API
+            max_concurrency: Requêtes simultanées des helpers de fan-out
+            transport: Transport httpx (par défaut : pool keep-alive avec nouvelles
+                tentatives de connexion)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = DEFAULT_TIMEOUT
+        self.timeouts = dict(ENDPOINT_TIMEOUTS)
+        self.max_concurrency = max_concurrency
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=httpx.Limits(
+                max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_MAXSIZE
+            ),
+            # httpx ne retente que l'établissement de connexion
+            transport=transport or httpx.AsyncHTTPTransport(retries=RETRY_TOTAL),
+        )
+
+    async def aclose(self):
+        """Ferme le pool de connexions."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _timeout_for(self, endpoint: str) -> httpx.Timeout:
+        """Délais (connexion, lecture) d'un endpoint."""
+        path = "/" + endpoint.strip("/")
+        return httpx.Timeout(self.timeouts.get(path, self.timeout), connect=CONNECT_TIMEOUT)
+
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """
+        Effectue une requête HTTP et renvoie la réponse brute.
+
+        Raises:
+            Exception: Erreur réseau ou statut HTTP d'erreur
+        """
+        kwargs.setdefault("timeout", self._timeout_for(endpoint))
+        try:
+            response = await self.client.request(method, "/" + endpoint.lstrip("/"), **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            raise Exception(f"Erreur API : {str(e)}")
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Effectue une requête HTTP et renvoie la réponse JSON."""
+        return (await self._send(method, endpoint, **kwargs)).json()
+
+    async def _send_for_frame(
+        self, method: str, endpoint: str, records_key: str, **kwargs
+    ) -> pd.DataFrame:
+        """Requête en négociant le format Arrow ; repli JSON pour une API plus ancienne."""
+        headers = {"Accept": f"{ARROW_STREAM_MEDIA_TYPE}, application/json;q=0.5"}
+        response = await self._send(method, endpoint, headers=headers, **kwargs)
+        if response.headers.get("content-type", "").startswith(ARROW_STREAM_MEDIA_TYPE):
+            return arrow_to_frame(response.content)
+
+        payload = response.json()
+        df = pd.DataFrame(payload.get(records_key, []))
+        df.attrs["total"] = payload.get("total", len(df))
+        return df
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Vérifie l'état de l'API et de la base de données."""
+        return await self._make_request("GET", "/health")
+
+    async def get_employees(
+        self, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Récupère une page d'employés ('total' et 'employees')."""
+        params = {"skip": skip, "limit": limit}
+        if fields:
+            params["fields"] = ",".join(fields)
+        return await self._make_request("GET", "/employees", params=params)
+
+    async def get_employees_frame(
+        self, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Récupère une page d'employés en DataFrame (format Arrow)."""
+        params = {"skip": skip, "limit": limit}
+        if fields:
+            params["fields"] = ",".join(fields)
+        return await self._send_for_frame("GET", "/employees", "employees", params=params)
+
+    async def get_employee(
+        self, employee_id: int, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Récupère un employé par son ID."""
+        params = {"fields": ",".join(fields)} if fields else None
+        return await self._make_request("GET", f"/employees/{employee_id}", params=params)
+
+    async def get_employees_by_ids(
+        self, ids: List[int], fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Récupère jusqu'à SELECTION_MAX_IDS employés par IDs (POST /employees/batch)."""
+        payload = {"ids": [int(employee_id) for employee_id in ids], "fields": fields}
+        return await self._make_request("POST", "/employees/batch", json=payload)
+
+    async def predict_attrition(self, employee_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Prédit le risque d'attrition pour un employé."""
+        return await self._make_request("POST", "/predict", json=employee_data)
+
+    async def predict_batch(self, employees: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Prédit le risque d'attrition d'un lot d'employés en un seul appel."""
+        return await self._make_request("POST", "/predict/batch", json={"employees": employees})
+
+    async def predict_batch_frame(self, employees: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Prédit un lot d'employés et renvoie les scores en DataFrame (format Arrow)."""
+        return await self._send_for_frame(
+            "POST", "/predict/batch", "predictions", json={"employees": employees}
+        )
+
+    async def fetch_all_employees_frame(
+        self,
+        fields: Optional[List[str]] = None,
+        page_size: int = EMPLOYEES_PAGE_SIZE,
+        max_rows: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Récupère toutes les pages d'employés en parallèle.
+
+        La première page donne le total ; les suivantes sont demandées
+        simultanément (au plus max_concurrency à la fois).
+
+        Args:
+            fields: Colonnes à récupérer (toutes si None, l'ID est toujours inclus)
+            page_size: Taille des pages (100 au plus côté API)
+            max_rows: Nombre maximal de lignes (toute la table si None)
+
+        Returns:
+            DataFrame dans l'ordre des pages (attrs["total"] = total de la table)
+        """
+        first = await self.get_employees_frame(0, page_size, fields)
+        total = first.attrs.get("total", len(first))
+        wanted = total if max_rows is None else min(total, max_rows)
+
+        factories = [
+            lambda skip=skip: self.get_employees_frame(skip, page_size, fields)
+            for skip in range(page_size, wanted, page_size)
+        ]
+        pages = [first, *await gather_limited(factories, self.max_concurrency)]
+
+        df = pd.concat(pages, ignore_index=True).head(wanted)
+        df.attrs["total"] = total
+        return df
+
+    async def fetch_employees_by_ids(
+        self,
+        ids: List[int],
+        fields: Optional[List[str]] = None,
+        chunk_size: int = SELECTION_MAX_IDS,
+    ) -> Dict[str, Any]:
+        """
+        Récupère une grande sélection d'employés par paquets envoyés en parallèle.
+
+        Args:
+            ids: IDs demandés ; l'ordre est conservé
+            fields: Colonnes à récupérer
+            chunk_size: IDs par requête (SELECTION_MAX_IDS au plus)
+
+        Returns:
+            Dictionnaire contenant 'total', 'employees' et 'missing'
+        """
+        ids = list(dict.fromkeys(int(employee_id) for employee_id in ids))
+        factories = [
+            lambda chunk=ids[start : start + chunk_size]: self.get_employees_by_ids(chunk, fields)
+            for start in range(0, len(ids), chunk_size)
+        ]
+        results = await gather_limited(factories, self.max_concurrency)
+
+        employees = [employee for result in results for employee in result["employees"]]
+        missing = [employee_id for result in results for employee_id in result["missing"]]
+        return {"total": len(employees), "employees": employees, "missing": missing}
+
+
+class AsyncAPIFacade:
+    """
+    Façade synchrone d'un AsyncAPIClient, utilisable depuis une page Streamlit.
+
+    Le client vit dans une boucle asyncio dédiée (thread démon) : son pool de
+    connexions est conservé d'un appel à l'autre. Chaque méthode du client
+    est exposée en appel bloquant (`facade.get_employees(...)`).
+
+    Chaque façade démarre un thread : les pages Streamlit partagent celle du
+    processus (`utils.data_access.get_async_facade`, `st.cache_resource`) au
+    lieu d'en créer une par session.
+    """
+
+    def __init__(
+        self, base_url: str = API_URL, max_concurrency: int = DEFAULT_CONCURRENCY, **kwargs
+    ):
+        """
+        Démarre la boucle d'arrière-plan et y crée le client.
+
+        Args:
+            base_url: URL de base de l'API
+            max_concurrency: Requêtes simultanées des helpers de fan-out
+            **kwargs: Arguments supplémentaires de AsyncAPIClient (ex. transport)
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self.client = self.run(self._create_client(base_url, max_concurrency, **kwargs))
+
+    @staticmethod
+    async def _create_client(base_url: str, max_concurrency: int, **kwargs) -> AsyncAPIClient:
+        # Créé dans la boucle qui l'utilisera
+        return AsyncAPIClient(base_url, max_concurrency, **kwargs)
+
+    def run(self, coroutine: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Exécute une coroutine dans la boucle du client et attend son résultat."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    def gather(self, *coroutines: Awaitable, return_exceptions: bool = False) -> List[Any]:
+        """
+        Exécute plusieurs appels du client simultanément.
+
+        Exemple : `health, page = facade.gather(facade.client.health_check(),
+        facade.client.get_employees(limit=10))`
+
+        Args:
+            *coroutines: Appels du client (coroutines non attendues)
+            return_exceptions: Renvoie les erreurs à leur place au lieu de lever
+                la première
+
+        Returns:
+            Résultats dans l'ordre des arguments
+        """
+
+        async def gather_all():
+            return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+        return self.run(gather_all())
+
+    def close(self):
+        """Ferme le pool de connexions puis arrête la boucle."""
+        if self._loop.is_running():
+            self.run(self.client.aclose())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or name == "client":
+            raise AttributeError(name)
+        method = getattr(self.client, name)
+        if not asyncio.iscoroutinefunction(method):
+            return method
+
+        def call(*args, **kwargs):
+            return self.run(method(*args, **kwargs))
+
+        call.__doc__ = method.__doc__
+        return call
@@ -0,0 +1,222 @@
+"""
+Données de graphiques pré-agrégées pour les grandes populations.
+
+Plotly sérialise chaque point vers le navigateur : au-delà de quelques
+milliers d'employés, histogrammes, boîtes et nuages de points bruts figent
+la page. Ces fonctions réduisent les données côté serveur Streamlit à une
+taille bornée, indépendante de la population :
+
+- histogramme : comptages par classe (nbins barres) ;
+- boîte à moustaches : quartiles et moustaches (5 valeurs) ;
+- nuage de points : grille de densité (bins x bins cellules) ou échantillon
+  stratifié d'au plus MAX_SCATTER_POINTS points, affiché en WebGL.
+
+`population_summary` réunit tous les agrégats de la page Statistiques ; l'API
+le calcule sur toute la population (GET /employees/stats), la page n'en reçoit
+que le résultat.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Au-delà de ce nombre d'employés, la page passe en rendu agrégé
+LARGE_POPULATION_THRESHOLD = 5000
+
+# Nombre maximal de points d'un nuage échantillonné
+MAX_SCATTER_POINTS = 5000
+
+# Colonnes lues pour la page Statistiques
+SUMMARY_COLUMNS = (
+    "age",
+    "genre",
+    "departement",
+    "revenu_mensuel",
+    "annee_experience_totale",
+    "satisfaction_moyenne",
+)
+
+# Colonnes dont la moyenne est affichée en vue d'ensemble
+SUMMARY_MEANS = ("age", "satisfaction_moyenne", "revenu_mensuel")
+
+
+def histogram_bins(values: pd.Series, nbins: int = 20) -> pd.DataFrame:
+    """
+    Comptages par classes de largeur égale (valeurs manquantes ignorées).
+
+    Args:
+        values: Valeurs numériques
+        nbins: Nombre de classes
+
+    Returns:
+        DataFrame left, right, center, count (une ligne par classe)
+    """
+    data = pd.to_numeric(values, errors="coerce").dropna().to_numpy(dtype=float)
+    if data.size == 0:
+        return pd.DataFrame(columns=["left", "right", "center", "count"])
+    counts, edges = np.histogram(data, bins=nbins)
+    return pd.DataFrame(
+        {
+            "left": edges[:-1],
+            "right": edges[1:],
+            "center": (edges[:-1] + edges[1:]) / 2,
+            "count": counts,
+        }
+    )
+
+
+def box_summary(values: pd.Series) -> Dict[str, float]:
+    """
+    Résumé d'une boîte à moustaches (convention de Tukey, comme Plotly).
+
+    Les moustaches s'arrêtent à la valeur la plus extrême située à moins de
+    1,5 écart interquartile des quartiles ; les points au-delà ne sont pas
+    transmis.
+
+    Args:
+        values: Valeurs numériques
+
+    Returns:
+        Dictionnaire q1, median, q3, lowerfence, upperfence, mean, count
+    """
+    data = pd.to_numeric(values, errors="coerce").dropna()
+    q1, median, q3 = data.quantile([0.25, 0.5, 0.75]).tolist()
+    spread = 1.5 * (q3 - q1)
+    return {
+        "q1": q1,
+        "median": median,
+        "q3": q3,
+        "lowerfence": float(data[data >= q1 - spread].min()),
+        "upperfence": float(data[data <= q3 + spread].max()),
+        "mean": float(data.mean()),
+        "count": int(data.size),
+    }
+
+
+def stratified_sample(
+    df: pd.DataFrame, by: str, n: int = MAX_SCATTER_POINTS, seed: int = 0
+) -> pd.DataFrame:
+    """
+    Échantillon d'au plus `n` lignes respectant la part de chaque groupe.
+
+    Chaque groupe garde au moins une ligne : un petit département reste
+    visible dans le nuage. L'échantillon est reproductible (graine fixe).
+
+    Args:
+        df: Données complètes
+        by: Colonne définissant les strates (ex. departement)
+        n: Taille maximale de l'échantillon
+        seed: Graine du tirage
+
+    Returns:
+        Échantillon (df inchangé s'il compte déjà au plus `n` lignes)
+    """
+    if len(df) <= n:
+        return df
+    groups = df.groupby(by, dropna=False, sort=False)
+    sizes = groups.size()
+    quotas = np.maximum(1, np.floor(sizes * n / len(df))).astype(int)
+    # Les minimums à 1 peuvent dépasser n : on retire l'excédent aux plus grands groupes
+    for group in quotas.sort_values(ascending=False).index:
+        excess = quotas.sum() - n
+        if excess <= 0:
+            break
+        quotas[group] -= min(excess, quotas[group] - 1)
+    parts = [
+        frame.sample(n=quotas[key], random_state=seed)
+        for key, frame in groups
+        if quotas.get(key, 0) > 0
+    ]
+    return pd.concat(parts)
+
+
+def density_grid(
+    df: pd.DataFrame, x: str, y: str, bins: int = 40
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Comptages d'un nuage de points sur une grille régulière.
+
+    Args:
+        df: Données
+        x: Colonne en abscisse
+        y: Colonne en ordonnée
+        bins: Nombre de cellules par axe
+
+    Returns:
+        Tuple (centres en x, centres en y, comptages de forme (len(y), len(x)))
+    """
+    points = df[[x, y]].apply(pd.to_numeric, errors="coerce").dropna().to_numpy(dtype=float)
+    counts, x_edges, y_edges = np.histogram2d(points[:, 0], points[:, 1], bins=bins)
+    return (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2, counts.T
+
+
+def _records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Lignes d'un DataFrame en types JSON (NaN devient None)."""
+    return json.loads(df.to_json(orient="records"))
+
+
+def _number(value: Any) -> Optional[float]:
+    """Nombre JSON (None pour NaN)."""
+    return None if pd.isna(value) else float(value)
+
+
+def population_summary(
+    df: pd.DataFrame,
+    nbins: int = 20,
+    density_bins: int = 40,
+    sample_size: int = MAX_SCATTER_POINTS,
+) -> Dict[str, Any]:
+    """
+    Agrégats de la page Statistiques, de taille indépendante de la population.
+
+    Args:
+        df: Employés (colonnes SUMMARY_COLUMNS)
+        nbins: Nombre de classes de l'histogramme des âges
+        density_bins: Nombre de cellules par axe de la grille revenu / expérience
+        sample_size: Taille maximale de l'échantillon du nuage revenu / expérience
+
+    Returns:
+        Dictionnaire sérialisable en JSON : total, means, departements, genres,
+        satisfaction, age_histogram, revenu_box (None sans revenu), density
+        (x, y, counts) et sample
+    """
+    departements = (
+        df.groupby("departement")
+        .agg(
+            count=("departement", "size"),
+            revenu_mensuel=("revenu_mensuel", "mean"),
+            satisfaction_moyenne=("satisfaction_moyenne", "mean"),
+        )
+        .reset_index()
+        .sort_values("count", ascending=False, kind="stable")
+    )
+    genres = df["genre"].value_counts().rename_axis("genre").reset_index(name="count")
+    satisfaction = (
+        df["satisfaction_moyenne"]
+        .value_counts()
+        .sort_index()
+        .rename_axis("satisfaction")
+        .reset_index(name="count")
+    )
+    scatter = df[["annee_experience_totale", "revenu_mensuel", "departement"]]
+    x_centers, y_centers, counts = density_grid(
+        scatter, "annee_experience_totale", "revenu_mensuel", bins=density_bins
+    )
+    has_pay = df["revenu_mensuel"].notna().any()
+    return {
+        "total": len(df),
+        "means": {name: _number(df[name].mean()) for name in SUMMARY_MEANS},
+        "departements": _records(departements),
+        "genres": _records(genres),
+        "satisfaction": _records(satisfaction),
+        "age_histogram": _records(histogram_bins(df["age"], nbins=nbins)),
+        "revenu_box": box_summary(df["revenu_mensuel"]) if has_pay else None,
+        "density": {
+            "x": x_centers.tolist(),
+            "y": y_centers.tolist(),
+            "counts": counts.tolist(),
+        },
+        "sample": _records(stratified_sample(scatter, "departement", n=sample_size)),
+    }
@@ -0,0 +1,360 @@
+"""
+Accès aux données pour les pages Streamlit, avec cache Streamlit.
+
+Chaque interaction relance le script de la page : sans cache, chaque
+mouvement de curseur refait les appels API et reconstruit les DataFrames.
+Ici :
+
+- le client API et la façade asynchrone sont des ressources partagées par
+  le processus (`st.cache_resource`) ; ce client ne resert aucune réponse
+  sans la revalider (ETag/304) : seul `st.cache_data`, indexé par la
+  version, garde les résultats ;
+- les lectures sont mises en cache (`st.cache_data`) avec, dans leur clé,
+  la version des données du serveur (GET /data-version, relue au plus toutes
+  les DATA_VERSION_POLL secondes) : une écriture côté base invalide les
+  résultats, sinon les relances restent locales ;
+- `employee_stats` renvoie les agrégats de la page Statistiques calculés par
+  l'API, sans charger la population ;
+- `render_refresh_control` ajoute un bouton qui vide ces caches ;
+- `prefetch_employees_page` charge une page en arrière-plan (page suivante
+  de l'Explorer) : la navigation la trouve déjà en cache ;
+- `start_prediction` lance le scoring d'un employé en arrière-plan dès sa
+  sélection (page Prédiction).
+
+Les résultats (DataFrame, dicts) sont des copies propres à chaque appel.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+import streamlit as st
+
+from utils.async_api_client import AsyncAPIFacade
+from utils.shared_client import SharedAPIClient
+from utils.snapshot import current_version, read_snapshot, snapshot_manifest
+
+# Délai (secondes) entre deux lectures de la version des données
+DATA_VERSION_POLL = 5
+# Durée de vie maximale d'un résultat, même si la version ne change pas
+DATA_TTL = 600
+# Scorings simultanés lancés par les pages (toutes sessions confondues)
+SCORING_WORKERS = 4
+# Durée (secondes) pendant laquelle l'état de l'API est resservi
+HEALTH_TTL = 5
+
+
+@st.cache_resource
+def get_client() -> SharedAPIClient:
+    """
+    Client API unique du processus, pour les lectures de cette couche.
+
+    Ni durée de vie des réponses ni rétention du single-flight : une réponse
+    gardée par le client survivrait à un changement de version et serait
+    remise en cache sous la nouvelle.
+    """
+    return SharedAPIClient(ttl=0, cache=False)
+
+
+@st.cache_resource
+def get_async_facade() -> AsyncAPIFacade:
+    """Façade asynchrone unique du processus (fan-out des pages)."""
+    return AsyncAPIFacade()
+
+
+@st.cache_resource
+def get_prefetch_executor() -> ThreadPoolExecutor:
+    """Thread d'arrière-plan des préchargements (un seul par processus)."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+
+@st.cache_resource
+def get_scoring_executor() -> ThreadPoolExecutor:
+    """Threads des scorings lancés en arrière-plan (partagés par les sessions)."""
+    return ThreadPoolExecutor(max_workers=SCORING_WORKERS, thread_name_prefix="scoring")
+
+
+@st.cache_data(ttl=DATA_VERSION_POLL, show_spinner=False)
+def data_version() -> Optional[int]:
+    """
+    Version des données côté API.
+
+    Returns:
+        Version, None si l'API ne la fournit pas (les résultats expirent
+        alors après DATA_TTL secondes ou sur rafraîchissement)
+    """
+    try:
+        return get_client().get_data_version().get("version")
+    except Exception:
+        return None
+
+
+@st.cache_data(ttl=HEALTH_TTL, show_spinner=False)
+def health() -> Dict[str, Any]:
+    """
+    État de l'API et de la base (voir APIClient.health_check).
+
+    Returns:
+        Dictionnaire d'état, resservi HEALTH_TTL secondes (les erreurs ne
+        sont pas gardées : une nouvelle tentative refait l'appel)
+    """
+    return get_client().health_check()
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _employees_page(
+    skip: int,
+    limit: int,
+    fields: Optional[tuple],
+    sort: Optional[str],
+    cursor: Optional[str],
+    filters: tuple,
+    version: Optional[int],
+) -> pd.DataFrame:
+    return get_client().get_employees_frame(
+        skip=skip,
+        limit=limit,
+        fields=list(fields) if fields else None,
+        sort=sort,
+        cursor=cursor,
+        filters=_thaw_filters(filters),
+    )
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _all_employees(fields: Optional[tuple], version: Optional[int]) -> pd.DataFrame:
+    return get_async_facade().fetch_all_employees_frame(fields=list(fields) if fields else None)
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _employee(employee_id: int, version: Optional[int]) -> Dict[str, Any]:
+    return get_client().get_employee(employee_id)
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _employees_by_ids(ids: tuple, version: Optional[int]) -> Dict[str, Any]:
+    return get_client().get_employees_by_ids(list(ids))
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _employee_stats(filters: tuple, version: Optional[int]) -> Dict[str, Any]:
+    return get_client().get_employee_stats(_thaw_filters(filters))
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _snapshot(columns: Optional[tuple], version: str) -> pd.DataFrame:
+    return read_snapshot(list(columns) if columns else None, version=version)
+
+
+def _freeze_filters(filters: Optional[Dict[str, Any]]) -> tuple:
+    """Filtres sous forme hachable (clé de cache) : paires triées, listes en tuples."""
+    return tuple(
+        sorted(
+            (name, tuple(value) if isinstance(value, (list, tuple)) else value)
+            for name, value in (filters or {}).items()
+        )
+    )
+
+
+def _thaw_filters(filters: tuple) -> Dict[str, Any]:
+    """Filtres d'une clé de cache, sous la forme attendue par APIClient."""
+    return {name: list(value) if isinstance(value, tuple) else value for name, value in filters}
+
+
+def _page_key(
+    skip: int,
+    limit: int,
+    fields: Optional[Sequence[str]],
+    sort: Optional[str],
+    cursor: Optional[str],
+    filters: Optional[Dict[str, Any]],
+) -> tuple:
+    """Arguments hachables de `_employees_page` (hors version)."""
+    fields = tuple(fields) if fields else None
+    return skip, limit, fields, sort, cursor, _freeze_filters(filters)
+
+
+def employees_page(
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    sort: Optional[str] = None,
+    cursor: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> pd.DataFrame:
+    """
+    Page d'employés (DataFrame), en cache jusqu'au prochain changement de version.
+
+    Args:
+        skip: Nombre d'employés à ignorer (ignoré si `cursor` est fourni)
+        limit: Taille de la page (100 au plus)
+        fields: Colonnes à récupérer (toutes si None)
+        sort: Colonne de tri, "-colonne" pour l'ordre décroissant
+        cursor: Curseur de la page précédente (attrs["next_cursor"])
+        filters: Filtres appliqués par l'API (departement, age_min, age_max)
+
+    Returns:
+        DataFrame (attrs["total"] et, hors dernière page, attrs["next_cursor"])
+    """
+    key = _page_key(skip, limit, fields, sort, cursor, filters)
+    return _employees_page(*key, data_version())
+
+
+def prefetch_employees_page(
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    sort: Optional[str] = None,
+    cursor: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+):
+    """
+    Charge une page en arrière-plan pour la trouver en cache au prochain affichage.
+
+    Mêmes arguments que `employees_page`. Le résultat n'est pas attendu : en
+    cas d'erreur, la page sera simplement redemandée à l'affichage.
+    """
+    key = _page_key(skip, limit, fields, sort, cursor, filters)
+    get_prefetch_executor().submit(_employees_page, *key, data_version())
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _prediction(
+    employee_id: int, version: Optional[int], _employee: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    # _employee (hors clé de cache) ne sert que si l'API ne score pas par ID
+    return get_client().predict_employee(employee_id, _employee)
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _team_scores(filters: tuple, fields: Optional[tuple], version: Optional[int]) -> pd.DataFrame:
+    return get_client().predict_selection(
+        filters=_thaw_filters(filters),
+        fields=list(fields) if fields else None,
+    )
+
+
+def team_scores(
+    filters: Optional[Dict[str, Any]] = None, fields: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Scores de tous les employés d'une équipe (voir APIClient.predict_selection).
+
+    Args:
+        filters: Filtres (departement, poste, age_min, age_max)
+        fields: Colonnes de l'employé ajoutées aux scores
+
+    Returns:
+        DataFrame des scores, en cache jusqu'au prochain changement de version
+    """
+    fields = tuple(fields) if fields else None
+    return _team_scores(_freeze_filters(filters), fields, data_version())
+
+
+def start_prediction(employee_id: int, employee: Optional[Dict[str, Any]] = None) -> Future:
+    """
+    Lance le scoring d'un employé en arrière-plan (voir APIClient.predict_employee).
+
+    Le résultat est en cache jusqu'au prochain changement de version : une
+    nouvelle sélection du même employé est servie immédiatement.
+
+    Args:
+        employee_id: ID de l'employé
+        employee: Fiche déjà chargée, si disponible
+
+    Returns:
+        Future dont le résultat est le dictionnaire de prédiction
+    """
+    return get_scoring_executor().submit(_prediction, int(employee_id), data_version(), employee)
+
+
+def current_snapshot() -> Optional[str]:
+    """
+    Snapshot Parquet à jour des données de l'API.
+
+    Un snapshot exporté avant la dernière écriture en base (version des
+    données différente) est ignoré. Si l'API ne fournit pas de version, le
+    snapshot courant est utilisé tel quel.
+
+    Returns:
+        Version du snapshot, None si aucun snapshot à jour
+    """
+    snapshot = current_version()
+    if snapshot is None:
+        return None
+    version = data_version()
+    if version is not None and snapshot_manifest(version=snapshot).get("data_version") != version:
+        return None
+    return snapshot
+
+
+def all_employees(fields: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Toute la population : snapshot Parquet à jour s'il existe, sinon toutes les pages de l'API.
+
+    Args:
+        fields: Colonnes à récupérer (toutes si None)
+
+    Returns:
+        DataFrame (attrs["source"] : version du snapshot ou "api")
+    """
+    columns = tuple(fields) if fields else None
+    snapshot = current_snapshot()
+    if snapshot:
+        df = _snapshot(columns, snapshot)
+        df.attrs["source"] = snapshot
+    else:
+        df = _all_employees(columns, data_version())
+        df.attrs["source"] = "api"
+    return df
+
+
+def employee_stats(filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Agrégats de la page Statistiques (voir APIClient.get_employee_stats).
+
+    Args:
+        filters: Filtres (departement, poste, age_min, age_max, search)
+
+    Returns:
+        Dictionnaire d'agrégats, en cache jusqu'au prochain changement de version
+    """
+    return _employee_stats(_freeze_filters(filters), data_version())
+
+
+def employee(employee_id: int) -> Dict[str, Any]:
+    """Un employé par son ID (voir APIClient.get_employee)."""
+    return _employee(int(employee_id), data_version())
+
+
+def employees_by_ids(ids: List[int]) -> Dict[str, Any]:
+    """Plusieurs employés par IDs (voir APIClient.get_employees_by_ids)."""
+    return _employees_by_ids(tuple(int(i) for i in ids), data_version())
+
+
+def refresh():
+    """Vide les caches de données (Streamlit et client API)."""
+    for loader in (
+        health,
+        data_version,
+        _employees_page,
+        _all_employees,
+        _employee,
+        _employees_by_ids,
+        _employee_stats,
+        _prediction,
+        _team_scores,
+    ):
+        loader.clear()
+    _snapshot.clear()
+    get_client().cache.clear()
+
+
+def render_refresh_control():
+    """Bouton de rafraîchissement et version affichée, dans la barre latérale."""
+    with st.sidebar:
+        version = data_version()
+        st.caption(f"Version des données : {version if version is not None else 'inconnue'}")
+        if st.button("🔄 Rafraîchir les données", key="refresh_data"):
+            refresh()
+            st.rerun()
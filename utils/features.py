@@ -0,0 +1,243 @@
+"""
+Feature engineering partagé : export RH brut -> colonnes attendues par le modèle.
+
+Toutes les transformations sont vectorisées (une opération pandas par colonne)
+et ne calculent une colonne dérivée que si elle est absente ou vide : un
+enregistrement déjà préparé (table employees, test_employees.csv) traverse le
+pipeline sans changement, un export brut (dataset_employe.csv) est complété.
+
+Utilisé par l'import (database/stream_ingest.py, database/sync.py), le scoring
+par lot (scripts/score_export.py) et l'API (/predict, /predict/batch).
+"""
+
+from typing import Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Ordre exact des colonnes à l'entraînement (data/export-api/original_features.joblib)
+CATEGORICAL_FEATURES = [
+    "genre",
+    "statut_marital",
+    "heure_supplementaires",
+    "ayant_enfants",
+    "poste",
+    "domaine_etude",
+    "distance_categorie",
+    "frequence_deplacement",
+    "departement",
+]
+NUMERIC_FEATURES = [
+    "age",
+    "revenu_mensuel",
+    "nombre_experiences_precedentes",
+    "nombre_heures_travailless",
+    "annee_experience_totale",
+    "annees_dans_l_entreprise",
+    "annees_dans_le_poste_actuel",
+    "satisfaction_employee_environnement",
+    "note_evaluation_precedente",
+    "niveau_hierarchique_poste",
+    "satisfaction_employee_nature_travail",
+    "satisfaction_employee_equipe",
+    "satisfaction_employee_equilibre_pro_perso",
+    "note_evaluation_actuelle",
+    "nombre_participation_pee",
+    "nb_formations_suivies",
+    "nombre_employee_sous_responsabilite",
+    "distance_domicile_travail",
+    "niveau_education",
+    "annees_depuis_la_derniere_promotion",
+    "annes_sous_responsable_actuel",
+    "satisfaction_moyenne",
+    "parent_burnout",
+    "sous_paye_niveau_dept",
+    "augementation_salaire_precedente",
+]
+MODEL_FEATURES = CATEGORICAL_FEATURES + NUMERIC_FEATURES
+
+SATISFACTION_COLUMNS = [
+    "satisfaction_employee_environnement",
+    "satisfaction_employee_nature_travail",
+    "satisfaction_employee_equipe",
+    "satisfaction_employee_equilibre_pro_perso",
+]
+
+# Intervalles fermés à droite : 10 km -> "< 10 km", 20 km -> "10-20 km"
+DISTANCE_BINS = [-np.inf, 10, 20, np.inf]
+DISTANCE_LABELS = ["< 10 km", "10-20 km", "20-30 km"]
+
+# Groupes de référence de sous_paye_niveau_dept
+PAY_GROUP = ["departement", "niveau_hierarchique_poste"]
+
+# Indicateurs oui/non : valeurs reconnues -> modalités vues à l'entraînement
+FLAG_VALUES = {
+    "heure_supplementaires": ("Oui", "Non"),
+    "ayant_enfants": ("Y", "N"),
+}
+TRUE_VALUES = {"oui", "o", "y", "yes", "true", "vrai", "1"}
+FALSE_VALUES = {"non", "n", "no", "false", "faux", "0"}
+
+# Valeurs par défaut des colonnes absentes (comportement historique de /predict)
+UNKNOWN_CATEGORY = "Inconnu"
+
+
+def parse_percentage(values: pd.Series) -> pd.Series:
+    """
+    Convertit des pourcentages texte ("11 %", "11%", "11,5 %") en nombres.
+
+    Args:
+        values: Série brute (texte ou déjà numérique)
+
+    Returns:
+        Série float64, NaN pour les valeurs illisibles
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype("float64")
+    cleaned = (
+        values.astype("string")
+        .str.replace("%", "", regex=False)
+        .str.replace(",", ".", regex=False)
+        .str.strip()
+    )
+    return pd.to_numeric(cleaned, errors="coerce").astype("float64")
+
+
+def normalize_flag(values: pd.Series, true_value: str, false_value: str) -> pd.Series:
+    """
+    Ramène un indicateur oui/non (Y/N, Oui/Non, True/False, 1/0) aux modalités du modèle.
+
+    Les valeurs non reconnues sont conservées telles quelles.
+    """
+    text = values.astype("string").str.strip()
+    lowered = text.str.lower()
+    result = text.mask(lowered.isin(TRUE_VALUES), true_value)
+    return result.mask(lowered.isin(FALSE_VALUES), false_value)
+
+
+def pay_medians(df: pd.DataFrame) -> pd.Series:
+    """
+    Médiane du revenu mensuel par (département, niveau hiérarchique).
+
+    Args:
+        df: Population de référence (revenu_mensuel, departement, niveau_hierarchique_poste)
+
+    Returns:
+        Série indexée par (departement, niveau_hierarchique_poste)
+    """
+    revenue = pd.to_numeric(df["revenu_mensuel"], errors="coerce")
+    return revenue.groupby([df[column] for column in PAY_GROUP]).median()
+
+
+def _missing(df: pd.DataFrame, column: str) -> pd.Series:
+    """Masque des lignes où `column` est absente ou vide."""
+    if column not in df.columns:
+        return pd.Series(True, index=df.index)
+    return df[column].isna()
+
+
+def _fill(df: pd.DataFrame, column: str, values: pd.Series):
+    """Renseigne `column` avec `values` là où elle est absente ou vide."""
+    if column not in df.columns:
+        df[column] = values
+    else:
+        df[column] = df[column].where(df[column].notna(), values)
+
+
+def derive_features(
+    df: pd.DataFrame, medians: Optional[Mapping[Tuple[str, int], float]] = None
+) -> pd.DataFrame:
+    """
+    Complète un export (brut ou déjà préparé) avec les colonnes dérivées.
+
+    - id_employee est renommé en id ;
+    - augementation_salaire_precedente "11 %" -> 11 ;
+    - heure_supplementaires / ayant_enfants normalisés (Y/N, Oui/Non, booléens) ;
+    - satisfaction_moyenne, distance_categorie, parent_burnout et
+      sous_paye_niveau_dept calculés s'ils manquent.
+
+    parent_burnout reprend la règle de l'export d'entraînement :
+    ayant_enfants == "Oui" et heures supplémentaires. Les exports SIRH codent
+    ayant_enfants « Y », la colonne vaut donc 0 partout, comme à l'entraînement.
+
+    Args:
+        df: Données source (non modifiées)
+        medians: Médianes de référence par (département, niveau) pour
+            sous_paye_niveau_dept ; par défaut, celles de `df` lui-même
+            (correct pour un export complet, pas pour quelques lignes)
+
+    Returns:
+        Nouveau DataFrame
+    """
+    df = df.rename(columns={"id_employee": "id"})
+
+    if "augementation_salaire_precedente" in df.columns:
+        df["augementation_salaire_precedente"] = parse_percentage(
+            df["augementation_salaire_precedente"]
+        )
+
+    # La règle parent_burnout s'applique aux valeurs d'origine de ayant_enfants
+    if _missing(df, "parent_burnout").any() and {"ayant_enfants", "heure_supplementaires"} <= set(
+        df.columns
+    ):
+        overtime = normalize_flag(df["heure_supplementaires"], "Oui", "Non").eq("Oui")
+        burnout = (df["ayant_enfants"].astype("string").str.strip().eq("Oui") & overtime).astype(
+            "float64"
+        )
+        _fill(df, "parent_burnout", burnout)
+
+    for column, (true_value, false_value) in FLAG_VALUES.items():
+        if column in df.columns:
+            df[column] = normalize_flag(df[column], true_value, false_value)
+
+    if _missing(df, "satisfaction_moyenne").any() and set(SATISFACTION_COLUMNS) <= set(df.columns):
+        scores = df[SATISFACTION_COLUMNS].apply(pd.to_numeric, errors="coerce")
+        _fill(df, "satisfaction_moyenne", scores.mean(axis=1, skipna=False))
+
+    if _missing(df, "distance_categorie").any() and "distance_domicile_travail" in df.columns:
+        distance = pd.to_numeric(df["distance_domicile_travail"], errors="coerce")
+        categories = pd.cut(distance, bins=DISTANCE_BINS, labels=DISTANCE_LABELS)
+        _fill(df, "distance_categorie", categories.astype("string"))
+
+    if _missing(df, "sous_paye_niveau_dept").any() and {"revenu_mensuel", *PAY_GROUP} <= set(
+        df.columns
+    ):
+        reference = pay_medians(df) if medians is None else pd.Series(medians, dtype="float64")
+        keys = pd.MultiIndex.from_arrays([df[column] for column in PAY_GROUP])
+        median = pd.Series(reference.reindex(keys).to_numpy(), index=df.index)
+        revenue = pd.to_numeric(df["revenu_mensuel"], errors="coerce")
+        # Groupe inconnu de la référence : pas d'information, on laisse vide
+        underpaid = (revenue < median).astype("float64").where(median.notna())
+        _fill(df, "sous_paye_niveau_dept", underpaid)
+
+    return df
+
+
+def model_frame(
+    df: pd.DataFrame, medians: Optional[Mapping[Tuple[str, int], float]] = None
+) -> pd.DataFrame:
+    """
+    Construit la matrice d'entrée du modèle (colonnes, ordre et types d'entraînement).
+
+    Les valeurs encore manquantes après derive_features reçoivent les défauts
+    historiques de /predict : 0 pour les numériques, "Inconnu" pour les
+    catégories (ignorées par le OneHotEncoder).
+
+    Args:
+        df: Enregistrements bruts ou préparés
+        medians: Médianes de référence pour sous_paye_niveau_dept
+
+    Returns:
+        DataFrame de colonnes MODEL_FEATURES
+    """
+    df = derive_features(df, medians)
+    columns = {}
+    for column in CATEGORICAL_FEATURES:
+        values = df[column] if column in df.columns else pd.Series(index=df.index, dtype=object)
+        columns[column] = values.astype(object).where(values.notna(), UNKNOWN_CATEGORY)
+    for column in NUMERIC_FEATURES:
+        if column in df.columns:
+            columns[column] = pd.to_numeric(df[column], errors="coerce").fillna(0)
+        else:
+            columns[column] = pd.Series(0, index=df.index)
+    return pd.DataFrame(columns, index=df.index)[MODEL_FEATURES]
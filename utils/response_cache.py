@@ -0,0 +1,133 @@
+"""
+Cache des réponses GET du client API (voir APIClient).
+
+- Clé : méthode, URL, paramètres et format demandé (en-tête Accept).
+- Durée de vie par endpoint (CACHE_TTLS) : pendant ce délai la réponse est
+  resservie sans requête ; les IDs d'un chemin (/employees/12) partagent
+  la durée de /employees/{id}.
+- Au-delà, une réponse portant un ETag ou un Last-Modified est revalidée :
+  un 304 prolonge l'entrée sans retransférer le corps.
+- Taille bornée : l'entrée la moins récemment utilisée est évincée (LRU).
+- Compteurs (hits, revalidations, misses, évictions) pour la page Diagnostic.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# Durée de vie (secondes) des réponses par endpoint quand le cache est activé
+CACHE_TTLS = {
+    "/health": 5,
+    "/model-status": 60,
+    "/employees": 30,
+    "/employees/{id}": 60,
+}
+
+# Nombre maximal de réponses gardées
+CACHE_MAX_ENTRIES = 128
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+@dataclass
+class CacheEntry:
+    """Réponse gardée et instant (time.monotonic) de fin de fraîcheur."""
+
+    response: Any
+    expires: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+
+class ResponseCache:
+    """Cache LRU de réponses HTTP avec durée de vie par endpoint."""
+
+    def __init__(
+        self, ttls: Optional[Dict[str, float]] = None, max_entries: int = CACHE_MAX_ENTRIES
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            ttls: Durée de vie par endpoint ; vide = aucune réponse resservie sans
+                revalidation (seuls les 304 sont exploités)
+            max_entries: Nombre maximal de réponses gardées
+        """
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.revalidated = self.misses = self.evictions = 0
+
+    def ttl_for(self, path: str) -> float:
+        """Durée de vie d'un chemin (les segments numériques valent {id})."""
+        path = "/" + path.strip("/")
+        if path in self.ttls:
+            return self.ttls[path]
+        return self.ttls.get(_NUMERIC_SEGMENT.sub("/{id}", path), 0)
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        """Entrée d'une clé (marquée comme récemment utilisée), None si absente."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, response: Any, ttl: float):
+        """Garde une réponse, en évinçant les entrées les plus anciennes au-delà de la taille."""
+        with self._lock:
+            self._entries[key] = CacheEntry(response, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def refresh(self, key: tuple, ttl: float) -> Optional[Any]:
+        """Prolonge une entrée confirmée par un 304 et renvoie sa réponse."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires = time.monotonic() + ttl
+            self._entries.move_to_end(key)
+            return entry.response
+
+    def record(self, outcome: str):
+        """Compte un accès : "hit", "revalidated" ou "miss"."""
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "revalidated":
+                self.revalidated += 1
+            else:
+                self.misses += 1
+
+    def clear(self):
+        """Vide le cache (les compteurs sont conservés)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Compteurs du cache.
+
+        Returns:
+            Dictionnaire hits, revalidated, misses, evictions, entries et
+            hit_rate (part des accès servis sans retransférer le corps)
+        """
+        with self._lock:
+            lookups = self.hits + self.revalidated + self.misses
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "hit_rate": (self.hits + self.revalidated) / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,54 @@
+"""Scoring vectorisé : un seul appel predict_proba pour tout un lot d'employés."""
+
+from typing import Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.features import model_frame
+
+# Seuils de probabilité (bornes basses exclues) et niveaux de risque associés
+RISK_THRESHOLDS = [0.3, 0.6, 0.8]
+RISK_LABELS = ["Faible", "Moyen", "Élevé", "Très élevé"]
+
+
+def risk_levels(probabilities) -> np.ndarray:
+    """
+    Niveau de risque de chaque probabilité (mêmes seuils que get_risk_level).
+
+    Args:
+        probabilities: Probabilités d'attrition entre 0 et 1
+
+    Returns:
+        Tableau de libellés
+    """
+    indices = np.searchsorted(RISK_THRESHOLDS, np.asarray(probabilities), side="right")
+    return np.asarray(RISK_LABELS, dtype=object)[indices]
+
+
+def score_frame(
+    model, df: pd.DataFrame, medians: Optional[Mapping[Tuple[str, int], float]] = None
+) -> pd.DataFrame:
+    """
+    Score un lot d'enregistrements bruts ou préparés.
+
+    Args:
+        model: Pipeline scikit-learn chargé
+        df: Enregistrements (export brut, table employees, requêtes API)
+        medians: Médianes de référence pour sous_paye_niveau_dept
+
+    Returns:
+        DataFrame (même index) : attrition_probability, attrition_risk,
+        prediction, risk_level
+    """
+    features = model_frame(df, medians)
+    probabilities = model.predict_proba(features)[:, 1]
+    return pd.DataFrame(
+        {
+            "attrition_probability": probabilities.round(4),
+            "attrition_risk": (probabilities * 100).round(2),
+            "prediction": model.classes_[(probabilities > 0.5).astype(int)].astype(int),
+            "risk_level": risk_levels(probabilities),
+        },
+        index=df.index,
+    )
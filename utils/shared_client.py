@@ -0,0 +1,161 @@
+"""
+Client API partagé par toutes les sessions Streamlit du processus.
+
+Chaque session créait son propre APIClient : vingt personnes ouvrant
+Statistiques en même temps envoyaient vingt fois le même GET /employees.
+Le client partagé mutualise les lectures (« single-flight ») :
+
+- des GET identiques lancés en même temps ne font qu'un appel HTTP ; tous
+  les appelants reçoivent le même résultat décodé (dict ou DataFrame) ;
+- ce résultat est gardé SHARED_RESULT_TTL secondes pour les appels suivants ;
+- les erreurs sont transmises aux appelants en attente mais jamais gardées.
+
+Les résultats étant partagés, ils sont renvoyés sous forme de copie
+superficielle : ajouter ou retirer une colonne ou une clé reste local,
+les valeurs imbriquées ne doivent pas être modifiées.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import pandas as pd
+
+from config import API_URL
+from utils.api_client import APIClient
+
+# Durée (secondes) pendant laquelle un résultat mutualisé est resservi
+SHARED_RESULT_TTL = 2.0
+
+
+class SingleFlight:
+    """Exécution unique des appels identiques simultanés, avec rétention courte du résultat."""
+
+    def __init__(self, ttl: float = SHARED_RESULT_TTL):
+        """
+        Args:
+            ttl: Durée de rétention d'un résultat réussi (0 = aucune)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, Future] = {}
+        self._expires: Dict[Hashable, float] = {}
+        self.calls = self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Exécute `fn` une seule fois pour tous les appelants concurrents d'une même clé.
+
+        Args:
+            key: Identité de l'appel
+            fn: Appel à exécuter
+
+        Returns:
+            Résultat de `fn` (le même objet pour tous les appelants)
+
+        Raises:
+            Exception: L'erreur levée par `fn`, pour chacun des appelants
+        """
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None and time.monotonic() >= self._expires[key]:
+                future = None
+            leader = future is None
+            if leader:
+                self.calls += 1
+                future = self._flights[key] = Future()
+                # Pas d'expiration tant que l'appel est en cours
+                self._expires[key] = float("inf")
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                self._flights.pop(key, None)
+                self._expires.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._expires[key] = time.monotonic() + self.ttl
+            self._prune()
+        future.set_result(result)
+        return result
+
+    def _prune(self):
+        """Retire les résultats expirés (appelé sous verrou)."""
+        now = time.monotonic()
+        for key in [key for key, expires in self._expires.items() if expires <= now]:
+            del self._expires[key]
+            del self._flights[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Appels effectués et appels servis par un résultat partagé."""
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared}
+
+
+class SharedAPIClient(APIClient):
+    """APIClient dont les lectures (GET) sont mutualisées entre threads et sessions."""
+
+    def __init__(self, base_url: str = API_URL, ttl: float = SHARED_RESULT_TTL, cache: bool = True):
+        """
+        Args:
+            base_url: URL de base de l'API
+            ttl: Durée de rétention des résultats mutualisés
+            cache: Durées de vie CACHE_TTLS du cache de réponses (sinon
+                revalidation ETag/304 seulement, voir APIClient)
+        """
+        super().__init__(base_url, cache=cache)
+        self.flight = SingleFlight(ttl)
+
+    @staticmethod
+    def _flight_key(kind: str, method: str, endpoint: str, kwargs: Dict[str, Any]) -> tuple:
+        params = tuple(sorted((kwargs.get("params") or {}).items()))
+        return kind, method.upper(), "/" + endpoint.lstrip("/"), params
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict[str, Any]]:
+        if method.upper() != "GET":
+            return super()._make_request(method, endpoint, **kwargs)
+        key = self._flight_key("json", method, endpoint, kwargs)
+        result = self.flight.do(
+            key, lambda: super(SharedAPIClient, self)._make_request(method, endpoint, **kwargs)
+        )
+        return dict(result) if isinstance(result, dict) else result
+
+    def _send_for_frame(
+        self, method: str, endpoint: str, records_key: str, **kwargs
+    ) -> pd.DataFrame:
+        if method.upper() != "GET":
+            return super()._send_for_frame(method, endpoint, records_key, **kwargs)
+        key = self._flight_key("frame", method, endpoint, kwargs)
+        df = self.flight.do(
+            key,
+            lambda: super(SharedAPIClient, self)._send_for_frame(
+                method, endpoint, records_key, **kwargs
+            ),
+        )
+        return df.copy(deep=False)
+
+
+_shared_client: Optional[SharedAPIClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_client() -> SharedAPIClient:
+    """
+    Client unique du processus (créé au premier appel).
+
+    Returns:
+        SharedAPIClient pointant sur API_URL
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = SharedAPIClient()
+        return _shared_client
@@ -0,0 +1,154 @@
+"""
+Lecture des snapshots Parquet de la table employees (voir database/snapshot.py).
+
+Un snapshot est un dossier versionné, partitionné par département :
+
+    data/snapshots/
+        CURRENT                      # version courante
+        20260101T120000Z-1a2b3c4d/
+            _manifest.json           # version, lignes, colonnes, scores inclus
+            departement=Commercial/part-0.parquet
+            ...
+
+Les fichiers sont ouverts en mémoire mappée (pas de copie dans un tampon
+Python) et seules les colonnes et partitions demandées sont lues.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+BASE_DIR = Path(__file__).parent.parent
+SNAPSHOT_DIR = Path(os.getenv("SNAPSHOT_DIR", str(BASE_DIR / "data" / "snapshots")))
+
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "_manifest.json"
+PARTITION_COLUMN = "departement"
+
+
+def current_version(root: Path = SNAPSHOT_DIR) -> Optional[str]:
+    """
+    Version du dernier snapshot publié.
+
+    Args:
+        root: Dossier des snapshots
+
+    Returns:
+        Identifiant de version, None si aucun snapshot
+    """
+    pointer = Path(root) / CURRENT_FILE
+    if not pointer.exists():
+        return None
+    version = pointer.read_text(encoding="utf-8").strip()
+    return version if (Path(root) / version).is_dir() else None
+
+
+def snapshot_path(root: Path = SNAPSHOT_DIR, version: Optional[str] = None) -> Path:
+    """
+    Dossier d'un snapshot (le courant par défaut).
+
+    Raises:
+        FileNotFoundError: Aucun snapshot publié ou version inconnue
+    """
+    version = version or current_version(root)
+    path = Path(root) / version if version else None
+    if path is None or not path.is_dir():
+        raise FileNotFoundError(f"Aucun snapshot dans {root}")
+    return path
+
+
+def snapshot_manifest(root: Path = SNAPSHOT_DIR, version: Optional[str] = None) -> Dict:
+    """Manifeste d'un snapshot (version, created_at, rows, columns, partitions...)."""
+    with open(snapshot_path(root, version) / MANIFEST_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def open_snapshot(root: Path = SNAPSHOT_DIR, version: Optional[str] = None) -> ds.Dataset:
+    """
+    Dataset Arrow d'un snapshot, fichiers ouverts en mémoire mappée.
+
+    Args:
+        root: Dossier des snapshots
+        version: Version à lire (courante par défaut)
+
+    Returns:
+        pyarrow.dataset.Dataset (partition departement reconstituée)
+    """
+    return ds.dataset(
+        snapshot_path(root, version),
+        format="parquet",
+        partitioning="hive",
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+        exclude_invalid_files=True,
+    )
+
+
+def _scan(dataset: ds.Dataset, columns: Optional[List[str]], departements: Optional[Iterable[str]]):
+    condition = None
+    if departements is not None:
+        condition = ds.field(PARTITION_COLUMN).isin(list(departements))
+    return dataset.to_table(columns=columns, filter=condition)
+
+
+def read_snapshot(
+    columns: Optional[List[str]] = None,
+    departements: Optional[Iterable[str]] = None,
+    root: Path = SNAPSHOT_DIR,
+    version: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Charge un snapshot dans un DataFrame, trié par id.
+
+    Args:
+        columns: Colonnes à lire (toutes par défaut)
+        departements: Partitions à lire (toutes par défaut) ; les autres
+            fichiers ne sont pas ouverts
+        root: Dossier des snapshots
+        version: Version à lire (courante par défaut)
+
+    Returns:
+        DataFrame aux types de la table (Int64, float64, string)
+    """
+    table = _scan(open_snapshot(root, version), columns, departements)
+    df = table.to_pandas()
+    if "id" in df.columns:
+        df = df.sort_values("id", ignore_index=True)
+    return df
+
+
+def snapshot_arrays(
+    columns: List[str],
+    departements: Optional[Iterable[str]] = None,
+    root: Path = SNAPSHOT_DIR,
+    version: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Colonnes d'un snapshot en tableaux NumPy, sans passer par pandas.
+
+    Les colonnes numériques sans valeur manquante d'un seul bloc sont des vues
+    sur la mémoire mappée (aucune copie) ; les autres sont matérialisées.
+
+    Args:
+        columns: Colonnes à lire
+        departements: Partitions à lire (toutes par défaut)
+        root: Dossier des snapshots
+        version: Version à lire (courante par défaut)
+
+    Returns:
+        {colonne: ndarray}, dans l'ordre des fichiers (non trié)
+    """
+    table = _scan(open_snapshot(root, version), columns, departements)
+    arrays = {}
+    for name in columns:
+        column = table.column(name)
+        if column.num_chunks == 1:
+            arrays[name] = column.chunk(0).to_numpy(zero_copy_only=False)
+        else:
+            arrays[name] = column.to_numpy()
+    return arrays